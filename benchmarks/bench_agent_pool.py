@@ -0,0 +1,99 @@
+"""Agent construction per call versus leasing from an AgentPool.
+
+Each iteration runs one task on an agent configured like the lesson
+agents, over a zero-latency StubLLM so construction and reset dominate.
+The baseline builds a fresh swarms Agent per call, as the lessons used
+to; the pool leases agents by configuration and resets them on return.
+
+    python benchmarks/bench_agent_pool.py [--runs N] [--configs N]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.pool import AgentPool
+from swarms_course.stub_llm import StubLLM
+
+SYSTEM_PROMPT = (
+    "You are an enterprise assistant capable of analyzing business data,"
+    " generating reports and answering customer inquiries."
+)
+
+
+def configs(count):
+    return [
+        {
+            "agent_name": f"pool-bench-{i}",
+            "system_prompt": SYSTEM_PROMPT,
+            "temperature": round(i / count, 3),
+            "max_loops": 1,
+        }
+        for i in range(count)
+    ]
+
+
+def timed(label, fn, runs, baseline=None):
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    line = f"{label:<20} {seconds:6.2f}s  {seconds / runs * 1000:7.2f}ms/run"
+    if baseline:
+        line += f"  {baseline / seconds:5.1f}x"
+    return seconds, line
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--configs", type=int, default=3)
+    args = parser.parse_args()
+
+    from swarms import Agent
+
+    disable_agent_telemetry()
+    llm = StubLLM()
+    grid = configs(args.configs)
+    tasks = [
+        (f"Summarise customer ticket #{i}", grid[i % len(grid)])
+        for i in range(args.runs)
+    ]
+    pool = AgentPool(llm=llm)
+
+    def construct():
+        for task, config in tasks:
+            Agent(llm=llm, **config).run(task)
+
+    def pooled():
+        for task, config in tasks:
+            pool.run(task, **config)
+
+    def construct_only():
+        for _, config in tasks:
+            Agent(llm=llm, **config)
+
+    # Warm imports and the tokenizer before timing anything
+    with contextlib.redirect_stdout(io.StringIO()):
+        Agent(llm=llm, **grid[0]).run("warm up")
+        baseline, base_line = timed("construct per call", construct, args.runs)
+        _, pool_line = timed("AgentPool", pooled, args.runs, baseline)
+        build, _ = timed("construction only", construct_only, args.runs)
+
+    with pool.lease(**grid[0]) as agent:
+        history = len(agent.short_memory.conversation_history)
+    fresh = len(Agent(llm=llm, **grid[0]).short_memory.conversation_history)
+
+    print(f"{args.runs} runs over {args.configs} configurations")
+    print(base_line)
+    print(pool_line)
+    print(
+        f"construction alone   {build / args.runs * 1000:7.2f}ms/agent;"
+        f" pool {pool.stats}"
+    )
+    print(f"history after reuse  {history} messages (fresh agent: {fresh})")
+
+
+if __name__ == "__main__":
+    main()
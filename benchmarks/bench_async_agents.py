@@ -0,0 +1,139 @@
+"""Agent throughput against a local model server: thread pool versus asyncio.
+
+``--agents`` swarms Agents, each running ``--loops`` loops, talk to a
+MockLLMServer over HTTP through ``OpenAICompatibleChat``. The thread
+pool runs ``agent.run`` with ``run_batch`` at ``--threads`` workers;
+the asyncio run drives every agent with ``arun_agent`` under
+``arun_batch`` on one event loop. Agents are built up front so only the
+runs are timed; the report shows throughput, task latency and the peak
+number of threads.
+
+    python benchmarks/bench_async_agents.py [--agents N] [--threads N]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import threading
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.async_agents import (
+    OpenAICompatibleChat,
+    aclose_shared_session,
+    arun_agent,
+)
+from swarms_course.batch import arun_batch, run_batch
+from swarms_course.mock_server import MockLLMServer
+from swarms_course.stats import LatencyStats
+
+
+@contextlib.contextmanager
+def peak_threads(into):
+    """Sample the thread count every 5ms while the block runs"""
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.005):
+            into.append(threading.active_count())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield
+    finally:
+        done.set()
+        sampler.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=300)
+    parser.add_argument("--loops", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--threads", type=int, default=64)
+    args = parser.parse_args()
+
+    from swarms import Agent
+
+    disable_agent_telemetry()
+
+    def build(llm):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [
+                Agent(
+                    llm=llm, agent_name=f"agent-{i}", max_loops=args.loops
+                )
+                for i in range(args.agents)
+            ]
+
+    tasks = [f"Resolve ticket {i}" for i in range(args.agents)]
+    rows = []
+    with MockLLMServer(latency=args.latency) as server:
+        llm = OpenAICompatibleChat(base_url=server.url, api_key="bench")
+
+        agents = build(llm)
+        threads = [threading.active_count()]
+        with peak_threads(threads), contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            start = time.perf_counter()
+            results = list(
+                run_batch(
+                    lambda i: agents[i].run(tasks[i]),
+                    range(args.agents),
+                    max_concurrency=args.threads,
+                )
+            )
+            seconds = time.perf_counter() - start
+        rows.append(
+            (f"thread pool ({args.threads})", seconds, results, threads)
+        )
+
+        agents = build(llm)
+
+        async def handle(i):
+            return await arun_agent(agents[i], tasks[i])
+
+        async def drain():
+            try:
+                return [
+                    r
+                    async for r in arun_batch(
+                        handle,
+                        range(args.agents),
+                        max_concurrency=args.agents,
+                    )
+                ]
+            finally:
+                await aclose_shared_session()
+
+        threads = [threading.active_count()]
+        with peak_threads(threads), contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            start = time.perf_counter()
+            results = asyncio.run(drain())
+            seconds = time.perf_counter() - start
+        rows.append(("asyncio", seconds, results, threads))
+
+    calls = args.agents * args.loops
+    print(
+        f"{args.agents} agents x {args.loops} loops, model latency"
+        f" {args.latency * 1000:.0f}ms ({calls} requests each way)"
+    )
+    for label, seconds, results, threads in rows:
+        ok = sum(r.ok for r in results)
+        latency = LatencyStats.from_values(r.seconds for r in results)
+        print(
+            f"{label:<17} {seconds:6.2f}s  {calls / seconds:7.1f} req/s"
+            f"  p50={latency.p50 * 1000:6.0f}ms"
+            f"  p95={latency.p95 * 1000:6.0f}ms"
+            f"  peak threads {max(threads):3d}  ({ok}/{args.agents} ok)"
+        )
+    print(f"speed-up {rows[0][1] / rows[1][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
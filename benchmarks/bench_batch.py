@@ -0,0 +1,81 @@
+"""Throughput of the batch runner against a serial task loop.
+
+Every task calls a StubLLM that sleeps for a fixed latency, standing in
+for a remote model. The serial baseline is the loop lesson 1.3 used to
+run; the batch runs use ``run_batch`` (threads) and ``arun_batch``
+(asyncio) at several concurrency levels, plus one rate-limited run to
+show the pacing holds.
+
+    python benchmarks/bench_batch.py [--tasks N] [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import time
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.batch import arun_batch, run_batch
+from swarms_course.stats import LatencyStats
+from swarms_course.stub_llm import StubLLM
+
+
+def serial(llm, tasks):
+    start = time.perf_counter()
+    for task in tasks:
+        llm.run(task)
+    return time.perf_counter() - start
+
+
+def threaded(llm, tasks, **options):
+    start = time.perf_counter()
+    results = list(run_batch(llm, tasks, **options))
+    return time.perf_counter() - start, results
+
+
+def asynchronous(llm, tasks, **options):
+    async def drain():
+        return [r async for r in arun_batch(llm, tasks, **options)]
+
+    start = time.perf_counter()
+    results = asyncio.run(drain())
+    return time.perf_counter() - start, results
+
+
+def line(label, seconds, results, baseline):
+    latency = LatencyStats.from_values(r.seconds for r in results)
+    return (
+        f"{label:<22} {seconds:6.2f}s {len(results) / seconds:8.1f} tasks/s"
+        f"  {baseline / seconds:5.1f}x  p95 {latency.p95 * 1000:.0f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=256)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    llm = StubLLM(latency=args.latency)
+    tasks = [f"Summarise customer ticket #{i}" for i in range(args.tasks)]
+    print(f"{args.tasks} tasks, {args.latency * 1000:.0f}ms model latency")
+
+    baseline = serial(llm, tasks)
+    print(
+        f"{'serial loop':<22} {baseline:6.2f}s"
+        f" {args.tasks / baseline:8.1f} tasks/s"
+    )
+    for workers in (8, 32, 64):
+        seconds, results = threaded(llm, tasks, max_concurrency=workers)
+        print(line(f"run_batch c={workers}", seconds, results, baseline))
+        seconds, results = asynchronous(llm, tasks, max_concurrency=workers)
+        print(line(f"arun_batch c={workers}", seconds, results, baseline))
+
+    rate = 200.0
+    seconds, results = threaded(
+        llm, tasks, max_concurrency=64, rate_limit=rate
+    )
+    print(line(f"run_batch {rate:.0f}/s cap", seconds, results, baseline))
+
+
+if __name__ == "__main__":
+    main()
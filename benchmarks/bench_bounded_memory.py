@@ -0,0 +1,73 @@
+"""Prompt size and render cost over a long session, bounded or not.
+
+Appends turns to a swarms Conversation and, at checkpoints, measures
+what an agent loop pays to build its prompt: rendering the history with
+``return_history_as_string`` and the tokens that prompt would send. The
+bounded run uses ``BoundedMemory`` with a 4096 token budget and a
+summarizer that costs nothing, so only memory management is measured.
+
+    python benchmarks/bench_bounded_memory.py [--turns N]
+"""
+import argparse
+import time
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.memory import BoundedMemory
+from swarms_course.tokens import TokenCounter
+
+MESSAGE = (
+    "Turn {i}: customer 12345 asked about invoice INV-{i} and the"
+    " renewal date of their Enterprise Suite licence."
+)
+
+
+def session(turns, tokenizer, bounded):
+    from swarms.structs.conversation import Conversation
+
+    memory = Conversation(system_prompt="You are a support assistant.")
+    if bounded:
+        counter = BoundedMemory(
+            memory,
+            tokenizer,
+            4096,
+            summarizer=lambda summary, evicted: f"{len(evicted)} turns folded",
+            summary_tokens=64,
+        ).counter
+    else:
+        counter = TokenCounter(memory, tokenizer)
+    checkpoints = {turns // 10, turns // 2, turns}
+    start = time.perf_counter()
+    for i in range(1, turns + 1):
+        memory.add("User", MESSAGE.format(i=i))
+        if i in checkpoints:
+            render = time.perf_counter()
+            for _ in range(20):
+                memory.return_history_as_string()
+            render = (time.perf_counter() - render) / 20
+            yield i, render, counter.used
+    yield None, time.perf_counter() - start, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20000)
+    args = parser.parse_args()
+
+    from swarm_models.tiktoken_wrapper import TikTokenizer
+
+    tokenizer = TikTokenizer()
+    for bounded in (False, True):
+        label = "bounded" if bounded else "unbounded"
+        for turn, seconds, tokens in session(args.turns, tokenizer, bounded):
+            if turn is None:
+                print(f"{label:<10} total {seconds:.2f}s for {args.turns} turns")
+            else:
+                print(
+                    f"{label:<10} turn {turn:>6}  prompt {tokens:>8} tokens"
+                    f"  render {seconds * 1000:8.3f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
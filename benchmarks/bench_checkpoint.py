@@ -0,0 +1,125 @@
+"""Cost of saving agent state per loop as the history grows.
+
+For each history size, an Agent's short_memory is filled with that many
+turns. Then, for ``--loops`` loops, one response is added and the state
+is saved two ways:
+
+- ``save_state``: what ``autosave=True`` writes, the whole agent as
+  JSON in its workspace directory;
+- a ``CheckpointLog`` commit: the new message appended to a binary log.
+
+The report gives the median save time and bytes written per loop, the
+size of each file, and the time to load the checkpoint back into a
+fresh agent with ``restore``.
+
+    python benchmarks/bench_checkpoint.py [--turns N ...] [--loops N]
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import tempfile
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.checkpoint import CheckpointLog, checkpoint, restore
+from swarms_course.stub_llm import StubLLM
+
+ROLES = ("User", "enterprise-assistant")
+MESSAGE = (
+    "Turn {i}: customer 12345 asked about invoice INV-{i} and the"
+    " renewal date of their Enterprise Suite licence."
+)
+
+
+def agent(workspace):
+    from swarms import Agent
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Agent(
+            llm=StubLLM(),
+            agent_name="bench-agent",
+            system_prompt="You are a support assistant.",
+            max_loops=1,
+            workspace_dir=workspace,
+        )
+
+
+def timed_loops(memory, loops, save, turns):
+    times = []
+    for i in range(turns, turns + loops):
+        memory.add(ROLES[i % 2], MESSAGE.format(i=i))
+        start = time.perf_counter()
+        save()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--turns", type=int, nargs="+", default=[100, 1000, 10000]
+    )
+    parser.add_argument("--loops", type=int, default=20)
+    args = parser.parse_args()
+
+    from loguru import logger
+
+    disable_agent_telemetry()
+    # save_state logs every save; keep that I/O out of the timings
+    logger.disable("swarms")
+    print(f"median per-loop save over {args.loops} loops")
+    with tempfile.TemporaryDirectory() as workspace:
+        for turns in args.turns:
+            saved = agent(workspace)
+            memory = saved.short_memory
+            for i in range(turns):
+                memory.add(ROLES[i % 2], MESSAGE.format(i=i))
+            state_file = os.path.join(
+                workspace, f"{saved.saved_state_path}.json"
+            )
+            json_seconds = timed_loops(
+                memory, args.loops, saved.save_state, turns
+            )
+            json_bytes = os.path.getsize(state_file)
+
+            path = os.path.join(workspace, f"{turns}.ckpt")
+            log = CheckpointLog(path)
+            log.start_run("Reconcile the invoices", 100)
+            log.commit(memory.conversation_history, 0)
+            first = log.stats.bytes_written
+            loop = iter(range(1, args.loops + 1))
+            log_seconds = timed_loops(
+                memory,
+                args.loops,
+                lambda: log.commit(memory.conversation_history, next(loop)),
+                turns,
+            )
+            per_commit = (log.stats.bytes_written - first) / args.loops
+            log.close()
+
+            fresh = agent(workspace)
+            checkpoint(fresh, path)
+            start = time.perf_counter()
+            restore(fresh)
+            restore_seconds = time.perf_counter() - start
+            assert len(fresh.short_memory.conversation_history) == len(
+                memory.conversation_history
+            )
+            print(
+                f"{turns} turns\n"
+                f"  save_state  {json_seconds * 1000:8.3f}ms"
+                f"  {json_bytes / 1024:8.1f} KiB/loop"
+                f"  file {json_bytes / 1024:8.1f} KiB\n"
+                f"  checkpoint  {log_seconds * 1000:8.3f}ms"
+                f"  {per_commit / 1024:8.1f} KiB/loop"
+                f"  file {os.path.getsize(path) / 1024:8.1f} KiB"
+                f"  restore {restore_seconds * 1000:.1f}ms"
+                f"  ({json_seconds / log_seconds:.0f}x faster save)"
+            )
+
+
+if __name__ == "__main__":
+    main()
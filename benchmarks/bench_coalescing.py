@@ -0,0 +1,112 @@
+"""Upstream calls for a thundering herd of identical agent runs.
+
+``--users`` users each run the same ``--prompts`` support questions at
+the same moment. Each run leases an agent from an ``AgentPool`` and runs
+it with ``arun_agent`` against a MockLLMServer (``--latency`` seconds
+per call). The model is wrapped four ways:
+
+- not at all;
+- ``cache_responses``, cold: every run misses before the first returns;
+- ``coalesce_calls``: identical runs in flight share one call;
+- both, ``cache_responses(coalesce_calls(llm))``.
+
+The report gives the calls that reached the server and run latency.
+
+    python benchmarks/bench_coalescing.py [--users N] [--prompts N]
+        [--latency SECONDS]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.async_agents import (
+    OpenAICompatibleChat,
+    aclose_shared_session,
+    arun_agent,
+)
+from swarms_course.cache import cache_responses
+from swarms_course.coalesce import coalesce_calls
+from swarms_course.mock_server import MockLLMServer
+from swarms_course.pool import AgentPool
+from swarms_course.stats import LatencyStats
+
+CONFIG = dict(
+    agent_name="support-agent",
+    system_prompt="You are a customer support agent. Answer clearly.",
+    max_loops=1,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--prompts", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    disable_agent_telemetry()
+    runs = args.users * args.prompts
+    questions = [
+        f"How do I fix error E{100 + i}?" for i in range(args.prompts)
+    ]
+
+    with MockLLMServer(latency=args.latency) as server:
+        client = OpenAICompatibleChat(
+            base_url=server.url, api_key="bench", temperature=0.0
+        )
+        setups = [
+            ("plain", lambda: client),
+            ("cache (cold)", lambda: cache_responses(client)),
+            ("coalesce", lambda: coalesce_calls(client)),
+            (
+                "cache + coalesce",
+                lambda: cache_responses(coalesce_calls(client)),
+            ),
+        ]
+        print(
+            f"{args.users} users x {args.prompts} identical prompts at once"
+            f" ({runs} runs), model latency {args.latency * 1000:.0f}ms"
+        )
+        for label, build in setups:
+            llm = build()
+            pool = AgentPool(llm=llm, max_idle=runs)
+            with contextlib.redirect_stdout(io.StringIO()):
+                # Build every agent first so only the runs are timed
+                agents = [pool.acquire(**CONFIG) for _ in range(runs)]
+                for agent in agents:
+                    pool.release(agent)
+
+            async def run(question):
+                with pool.lease(**CONFIG) as agent:
+                    start = time.perf_counter()
+                    await arun_agent(agent, question)
+                    return time.perf_counter() - start
+
+            async def herd():
+                try:
+                    return await asyncio.gather(
+                        *(
+                            run(question)
+                            for question in questions
+                            for _ in range(args.users)
+                        )
+                    )
+                finally:
+                    await aclose_shared_session()
+
+            server.requests = 0
+            with contextlib.redirect_stdout(io.StringIO()):
+                latency = LatencyStats.from_values(asyncio.run(herd()))
+            print(
+                f"  {label:<17} {server.requests:4d} upstream calls"
+                f"  p50={latency.p50 * 1000:5.0f}ms"
+                f"  p95={latency.p95 * 1000:5.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
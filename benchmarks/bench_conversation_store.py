@@ -0,0 +1,101 @@
+"""Memory and render latency: swarms Conversation vs CompactConversation.
+
+For each history size, both stores get the same timestamped turns (as
+an Agent's short_memory does). The benchmark reports the memory they
+hold (tracemalloc; in brackets, after the first render, once the compact
+store caches its rendered text), the cost of one full render, and the
+agent-loop pattern: add one message, then render the history.
+
+    python benchmarks/bench_conversation_store.py [--turns N ...]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.conversation import CompactConversation
+
+ROLES = ("User", "enterprise-assistant")
+MESSAGE = (
+    "Turn {i}: customer 12345 asked about invoice INV-{i} and the"
+    " renewal date of their Enterprise Suite licence."
+)
+
+
+def build(factory, turns):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    store = factory()
+    for i in range(turns):
+        store.add(ROLES[i % 2], MESSAGE.format(i=i))
+    held = tracemalloc.get_traced_memory()[0] - before
+    store.return_history_as_string()
+    cached = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return store, held, cached
+
+
+def per_call(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def measure(factory, turns):
+    store, held, cached = build(factory, turns)
+    repeat = max(3, 200000 // turns)
+    render = per_call(store.return_history_as_string, repeat)
+    counter = iter(range(turns, turns + 10 * repeat))
+
+    def add_and_render():
+        store.add("User", MESSAGE.format(i=next(counter)))
+        store.return_history_as_string()
+
+    loop = per_call(add_and_render, repeat)
+    return held, cached, render, loop
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--turns", type=int, nargs="+", default=[10000, 100000]
+    )
+    args = parser.parse_args()
+
+    from swarms.structs.conversation import Conversation
+
+    stores = {
+        "Conversation": lambda: Conversation(
+            system_prompt="You are a support assistant.", time_enabled=True
+        ),
+        "CompactConversation": lambda: CompactConversation(
+            system_prompt="You are a support assistant.", time_enabled=True
+        ),
+    }
+    for turns in args.turns:
+        print(f"{turns} turns")
+        baseline = None
+        for name, factory in stores.items():
+            held, cached, render, loop = measure(factory, turns)
+            line = (
+                f"  {name:<20} {held / 2**20:6.1f} MiB"
+                f" ({cached / 2**20:5.1f} rendered)"
+                f"  render {render * 1000:8.3f}ms"
+                f"  add+render {loop * 1000:8.3f}ms"
+            )
+            if baseline:
+                line += (
+                    f"  {baseline[0] / held:.1f}x less memory,"
+                    f" {baseline[2] / loop:.0f}x faster loop"
+                )
+            else:
+                baseline = (held, render, loop)
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
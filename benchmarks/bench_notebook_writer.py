@@ -0,0 +1,87 @@
+"""Peak memory of nbf.write versus the streaming writer.
+
+Builds a synthetic text-only notebook (large markdown/code sources, the
+shape lessons take once they embed datasets and long listings) and
+measures traced peak allocation for both paths. The two files are then
+compared byte for byte.
+
+    python benchmarks/bench_notebook_writer.py [--cells N] [--cell-kb K]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+)
+
+import nbformat as nbf  # noqa: E402
+
+from nbwriter import write_cells  # noqa: E402
+
+
+def synthetic_cells(count, cell_kb):
+    """Yield alternating markdown/code cells with ~cell_kb KiB of source"""
+    line = "x = 'enterprise agent payload' * 2  # filler\n"
+    lines_per_cell = max(1, cell_kb * 1024 // len(line))
+    for index in range(count):
+        source = f"# cell {index}\n" + line * lines_per_cell
+        if index % 2:
+            cell = nbf.v4.new_code_cell(source)
+        else:
+            cell = nbf.v4.new_markdown_cell(source)
+        cell["id"] = f"cell-{index}"
+        yield cell
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} peak {peak / 2**20:8.1f} MiB  {elapsed:6.2f}s")
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=400)
+    parser.add_argument("--cell-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        current_path = os.path.join(tmp, "current.ipynb")
+        streaming_path = os.path.join(tmp, "streaming.ipynb")
+
+        def current():
+            nb = nbf.v4.new_notebook()
+            nb.cells.extend(synthetic_cells(args.cells, args.cell_kb))
+            with open(current_path, "w", encoding="utf-8") as f:
+                nbf.write(nb, f)
+
+        def streaming():
+            with open(streaming_path, "w", encoding="utf-8") as f:
+                write_cells(
+                    synthetic_cells(args.cells, args.cell_kb), f
+                )
+
+        size = args.cells * args.cell_kb / 1024
+        print(f"{args.cells} cells, ~{size:.1f} MiB of source")
+        current_peak = measure("nbf.write", current)
+        streaming_peak = measure("streaming", streaming)
+        print(f"peak reduction: {current_peak / streaming_peak:.1f}x")
+
+        with open(current_path, "rb") as a, open(streaming_path, "rb") as b:
+            identical = a.read() == b.read()
+        print(f"byte-identical: {identical}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
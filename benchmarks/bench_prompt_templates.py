@@ -0,0 +1,116 @@
+"""Per-agent prompt building: get_prompt and f-strings versus compiled templates.
+
+For each of ``--agents`` agents the lesson pattern fetches the system
+prompt with ``Prompt.get_prompt()``, splices the generator guidelines
+into an f-string request, and tokenizes both for a budget check. The
+compiled version renders ``compile_prompt`` templates and sums their
+precomputed section counts. ``get_prompt``'s telemetry call is disabled
+in both runs, so only string building and tokenization are compared.
+
+    python benchmarks/bench_prompt_templates.py [--agents N] [--cases N]
+"""
+import argparse
+import time
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.prompts import compile_prompt
+
+SYSTEM = """
+You are an enterprise-grade assistant specialized in business operations.
+
+# Instructions
+- Analyze business requirements thoroughly
+- Provide structured, actionable responses
+- Maintain professional communication
+- Follow company policies and guidelines
+
+# Constraints
+- Maintain data confidentiality
+- Follow compliance requirements
+- Stay within authorized access
+- Document all actions
+"""
+
+GUIDELINES = """
+Your task is to generate effective prompts for business scenarios.
+
+## Guidelines
+1. Understand the specific business need
+2. Include clear instructions and examples
+3. Define appropriate constraints
+4. Consider edge cases
+5. Maintain professional tone
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=5000)
+    parser.add_argument("--cases", type=int, default=50)
+    args = parser.parse_args()
+
+    from swarm_models.tiktoken_wrapper import TikTokenizer
+    from swarms.prompts.prompt import Prompt
+
+    Prompt.log_telemetry = lambda self: None
+    tokenizer = TikTokenizer()
+    system = Prompt(name="enterprise", content=SYSTEM)
+    generator = Prompt(name="generator", content=GUIDELINES)
+    cases = [
+        f"an agent that handles {area} reporting for region {i}"
+        for i, area in enumerate(
+            ["financial", "sales", "compliance", "inventory"] * args.cases
+        )
+    ][: args.cases]
+
+    def interpolated():
+        total = 0
+        for i in range(args.agents):
+            prompt = system.get_prompt()
+            request = (
+                "Using this prompt generator guidelines:"
+                f" {generator.get_prompt()}, create a specialized"
+                f" prompt for: {cases[i % len(cases)]}"
+            )
+            total += tokenizer.count_tokens(prompt)
+            total += tokenizer.count_tokens(request)
+        return total
+
+    def compiled():
+        total = 0
+        for i in range(args.agents):
+            template = compile_prompt(system, tokenizer)
+            request = compile_prompt(
+                "Using this prompt generator guidelines: {guidelines},"
+                " create a specialized prompt for: {business_case}",
+                tokenizer,
+            ).bind(guidelines=generator.content)
+            case = cases[i % len(cases)]
+            template.render()
+            request.render(business_case=case)
+            total += template.static_tokens
+            total += request.tokens(business_case=case)
+        return total
+
+    results = []
+    for label, fn in (
+        ("get_prompt + f-string", interpolated),
+        ("compiled templates", compiled),
+    ):
+        start = time.perf_counter()
+        tokens = fn()
+        results.append((label, time.perf_counter() - start, tokens))
+
+    baseline = results[0][1]
+    print(f"{args.agents} agents, {args.cases} distinct business cases")
+    for label, seconds, tokens in results:
+        print(
+            f"{label:<22} {seconds:6.3f}s"
+            f"  {seconds / args.agents * 1e6:8.1f}us/agent"
+            f"  {baseline / seconds:6.1f}x  ({tokens} tokens)"
+        )
+
+
+if __name__ == "__main__":
+    main()
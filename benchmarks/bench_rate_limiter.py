@@ -0,0 +1,122 @@
+"""Goodput and 429s for worker processes sharing one provider quota.
+
+A MockLLMServer allows ``--quota`` requests per second (burst 10), like
+one API key's tier. ``--processes`` worker processes, each with
+``--threads`` threads, call it through ``OpenAICompatibleChat`` for
+``--duration`` seconds and retry a 429 straight away, as agents do.
+They run three ways:
+
+- no limiter: every worker sends as fast as it can;
+- a ``RateLimiter`` per process set to the quota, which each process
+  believes it has to itself;
+- one limiter shared by all processes through ``rate_limit(...,
+  path=...)``, set just under the quota.
+
+The report gives successful calls per second against the quota and the
+429s the server sent.
+
+    python benchmarks/bench_rate_limiter.py [--processes N] [--threads N]
+        [--quota RPS] [--duration SECONDS]
+"""
+import argparse
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import common  # noqa: F401
+
+from swarms_course.async_agents import OpenAICompatibleChat
+from swarms_course.mock_server import MockLLMServer
+from swarms_course.ratelimit import RateLimitedLLM, RateLimiter, rate_limit
+
+MODES = ("no limiter", "limiter per process", "shared limiter")
+
+
+def worker(url, mode, rate, threads, start_at, duration, directory):
+    """Successful calls made by one process"""
+    llm = OpenAICompatibleChat(base_url=url, api_key="bench-key")
+    if mode == "limiter per process":
+        llm = RateLimitedLLM(
+            llm, RateLimiter(requests_per_second=rate, burst=10)
+        )
+    elif mode == "shared limiter":
+        llm = rate_limit(
+            llm, requests_per_second=rate, burst=10, path=directory
+        )
+    succeeded = []
+    deadline = start_at + duration
+
+    def loop():
+        ok = 0
+        while time.time() < deadline:
+            try:
+                llm.run("Summarise the open tickets")
+            except Exception:
+                continue
+            ok += 1
+        succeeded.append(ok)
+
+    time.sleep(max(0.0, start_at - time.time()))
+    running = [threading.Thread(target=loop) for _ in range(threads)]
+    for thread in running:
+        thread.start()
+    for thread in running:
+        thread.join()
+    return sum(succeeded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--quota", type=float, default=40)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{args.processes} processes x {args.threads} threads for"
+        f" {args.duration:g}s against a {args.quota:g} req/s quota"
+    )
+    with MockLLMServer(
+        latency=0.05, rate_limit=args.quota, burst=10
+    ) as server, ProcessPoolExecutor(
+        args.processes, mp_context=context
+    ) as pool:
+        # Start the workers and their imports before any timing
+        list(pool.map(time.sleep, [0.5] * args.processes))
+        for mode in MODES:
+            directory = tempfile.mkdtemp(prefix="ratelimit-")
+            rate = args.quota * (0.95 if mode == "shared limiter" else 1)
+            # Let the server's bucket refill between modes
+            time.sleep(1)
+            server.requests = server.rate_limited = 0
+            start_at = time.time() + 2
+            futures = [
+                pool.submit(
+                    worker,
+                    server.url,
+                    mode,
+                    rate,
+                    args.threads,
+                    start_at,
+                    args.duration,
+                    directory,
+                )
+                for _ in range(args.processes)
+            ]
+            ok = sum(future.result() for future in futures)
+            shutil.rmtree(directory, ignore_errors=True)
+            goodput = ok / args.duration
+            print(
+                f"  {mode:<20} {goodput:6.1f} ok/s"
+                f" ({goodput / args.quota:4.0%} of quota)"
+                f"  {server.rate_limited:6d} 429s"
+            )
+
+
+if __name__ == "__main__":
+    main()
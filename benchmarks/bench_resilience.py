@@ -0,0 +1,147 @@
+"""Tail latency and failures under a provider brownout, with and without ResilientLLM.
+
+A MockLLMServer plays a browned-out provider: most completions take a
+lognormal ~100ms, but ``--stall-share`` of them stall for ``--stall``
+seconds and ``--error-rate`` fail with a 503 after their delay.
+``--requests`` calls go through ``OpenAICompatibleChat`` on
+``--concurrency`` threads, wrapped three ways:
+
+- immediate retries, as an agent's ``retry_attempts`` does;
+- ``ResilientLLM`` with jittered backoff and a circuit breaker;
+- the same with a hedged duplicate after the recent p95.
+
+A second phase takes the provider down (every call fails) and shows
+how long callers wait to learn that and how many requests the dead
+endpoint receives, with and without a circuit breaker.
+
+    python benchmarks/bench_resilience.py [--requests N] [--concurrency N]
+        [--stall-share P] [--error-rate P]
+"""
+import argparse
+import math
+import random
+import time
+
+import common  # noqa: F401
+
+from swarms_course.async_agents import OpenAICompatibleChat
+from swarms_course.batch import run_batch
+from swarms_course.mock_server import MockLLMServer
+from swarms_course.resilience import Backoff, CircuitBreaker, ResilientLLM
+from swarms_course.stats import LatencyStats
+
+
+def brownout(median, stall, stall_share, seed):
+    rng = random.Random(seed)
+
+    def delay():
+        if rng.random() < stall_share:
+            return stall
+        return rng.lognormvariate(median, 0.3)
+
+    return delay
+
+
+def drive(llm, requests, concurrency):
+    """Successful call latencies and seconds each failed call took"""
+    ok, failed = [], []
+
+    def call(i):
+        start = time.perf_counter()
+        try:
+            llm.run(f"Summarise ticket {i}")
+        except Exception:
+            failed.append(time.perf_counter() - start)
+            raise
+        ok.append(time.perf_counter() - start)
+
+    for _ in run_batch(call, range(requests), max_concurrency=concurrency):
+        pass
+    return LatencyStats.from_values(ok), failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--stall", type=float, default=2.0)
+    parser.add_argument("--stall-share", type=float, default=0.03)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with MockLLMServer(
+        error_status=503, seed=args.seed, model_name="brownout"
+    ) as server:
+        client = OpenAICompatibleChat(base_url=server.url, api_key="bench")
+        immediate = Backoff(base=0.0)
+        setups = [
+            (
+                "immediate retries",
+                lambda: ResilientLLM(
+                    client, retries=3, backoff=immediate, breaker=False
+                ),
+            ),
+            (
+                "backoff + breaker",
+                lambda: ResilientLLM(
+                    client,
+                    retries=3,
+                    breaker=CircuitBreaker("brownout"),
+                    seed=args.seed,
+                ),
+            ),
+            (
+                "+ hedge at p95",
+                lambda: ResilientLLM(
+                    client,
+                    retries=3,
+                    breaker=CircuitBreaker("brownout"),
+                    hedge="p95",
+                    seed=args.seed,
+                ),
+            ),
+        ]
+
+        print(
+            f"Brownout: {args.requests} calls at concurrency"
+            f" {args.concurrency}, {args.stall_share:.0%} stall"
+            f" {args.stall:.1f}s, {args.error_rate:.0%} fail with 503"
+        )
+        for label, build in setups:
+            server.latency = brownout(
+                math.log(0.1), args.stall, args.stall_share, args.seed
+            )
+            server.error_rate = args.error_rate
+            server.requests = 0
+            llm = build()
+            latency, failed = drive(llm, args.requests, args.concurrency)
+            stats = llm.stats
+            print(
+                f"  {label:<18} p50={latency.p50 * 1000:5.0f}ms"
+                f"  p95={latency.p95 * 1000:5.0f}ms"
+                f"  p99={latency.p99 * 1000:5.0f}ms"
+                f"  failed {len(failed):3d}  server requests"
+                f" {server.requests:4d}  hedges {stats.hedges}"
+                f" ({stats.hedge_wins} won)"
+            )
+
+        print(
+            f"Outage: every call fails; {args.requests // 3} calls at"
+            f" concurrency {args.concurrency}"
+        )
+        for label, build in setups[:2]:
+            server.latency = 0.1
+            server.error_rate = 1.0
+            server.requests = 0
+            _, failed = drive(build(), args.requests // 3, args.concurrency)
+            waited = LatencyStats.from_values(failed)
+            print(
+                f"  {label:<18} time to fail p50={waited.p50 * 1000:5.0f}ms"
+                f"  p95={waited.p95 * 1000:5.0f}ms  server requests"
+                f" {server.requests:4d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Repeated prompts with and without the response cache.
+
+A workload of ``--calls`` prompts is drawn with a skewed distribution
+from ``--distinct`` unique prompts, as when a notebook or a support
+agent sees the same questions again, and sent to a StubLLM that sleeps
+``--latency`` seconds per call. It runs uncached, through a cold
+cache, and again through a fresh ``ResponseCache`` opened on the same
+SQLite file, as a restarted kernel would.
+
+    python benchmarks/bench_response_cache.py [--calls N] [--distinct N]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.cache import CachedLLM, ResponseCache
+from swarms_course.stub_llm import StubLLM
+
+SYSTEM_PROMPT = "System: : You are an enterprise customer service assistant."
+
+
+def workload(calls, distinct, seed=0):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    questions = rng.choices(range(distinct), weights, k=calls)
+    return [
+        f"{SYSTEM_PROMPT}\n\nUser: Question {q} about order status\n\n"
+        for q in questions
+    ]
+
+
+def timed(label, llm, prompts, baseline=None):
+    start = time.perf_counter()
+    for prompt in prompts:
+        llm(prompt)
+    seconds = time.perf_counter() - start
+    line = (
+        f"{label:<16} {seconds:6.2f}s"
+        f"  {seconds / len(prompts) * 1000:7.2f}ms/call"
+    )
+    if baseline:
+        line += f"  {baseline / seconds:5.1f}x"
+    return seconds, line
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--distinct", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    prompts = workload(args.calls, args.distinct)
+    llm = StubLLM(temperature=0.0, latency=args.latency)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.sqlite")
+        cold = CachedLLM(llm, ResponseCache(path))
+        baseline, base_line = timed("uncached", llm, prompts)
+        _, cold_line = timed("cold cache", cold, prompts, baseline)
+        cold.cache.close()
+
+        warm = CachedLLM(llm, ResponseCache(path))
+        _, warm_line = timed("warm from disk", warm, prompts, baseline)
+        warm_stats = str(warm.stats)
+        hits = [prompts[0]] * args.calls
+        _, hit_line = timed("memory hit only", warm, hits)
+        warm.cache.close()
+
+        llm.temperature = 0.7
+        hot = CachedLLM(llm, ResponseCache())
+        hot(prompts[0])
+
+    print(
+        f"{args.calls} calls, {len(set(prompts))} distinct prompts,"
+        f" {args.latency * 1000:.0f}ms model latency"
+    )
+    print(base_line)
+    print(cold_line)
+    print(f"  {cold.stats}")
+    print(warm_line)
+    print(f"  {warm_stats}")
+    print(hit_line)
+    print(f"temperature 0.7  {hot.stats}")
+
+
+if __name__ == "__main__":
+    main()
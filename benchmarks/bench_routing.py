@@ -0,0 +1,137 @@
+"""Throughput of one hard-wired provider versus routing across two.
+
+Two MockLLMServers stand in for the lessons' providers: "groq" answers
+in ~80ms but allows only ``--groq-rate`` requests per second, and
+"anthropic" has no rate limit but takes ~400ms. ``--requests`` calls
+are kept ``--concurrency`` in flight on one event loop against:
+
+- each provider alone, as the lessons hard-wire ``anthropic_model``;
+- round-robin between them;
+- ``ModelRouter`` told Groq's rate limit, so it paces Groq and sends
+  the overflow to Anthropic;
+- ``ModelRouter`` without the limit, learning it from 429s and falling
+  back.
+
+    python benchmarks/bench_routing.py [--requests N] [--concurrency N]
+        [--groq-rate RPS]
+"""
+import argparse
+import asyncio
+import itertools
+import time
+
+import common  # noqa: F401
+
+from swarms_course.async_agents import (
+    OpenAICompatibleChat,
+    aclose_shared_session,
+)
+from swarms_course.load import aload_test
+from swarms_course.mock_server import MockLLMServer
+from swarms_course.resilience import CircuitBreaker
+from swarms_course.routing import Backend, ModelRouter
+
+
+class RoundRobin:
+    """Alternate between models regardless of how they are doing"""
+
+    def __init__(self, *llms):
+        self._next = itertools.cycle(llms).__next__
+
+    async def arun(self, task):
+        return await self._next().arun(task)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--groq-rate", type=float, default=40)
+    args = parser.parse_args()
+
+    groq_server = MockLLMServer(
+        latency="lognormal:0.08:0.3",
+        rate_limit=args.groq_rate,
+        burst=10,
+        seed=1,
+        model_name="llama-3.1-70b-versatile",
+    ).start()
+    anthropic_server = MockLLMServer(
+        latency="lognormal:0.4:0.3",
+        seed=2,
+        model_name="claude-3-5-sonnet-20240620",
+    ).start()
+    groq = OpenAICompatibleChat(
+        model_name="llama-3.1-70b-versatile",
+        base_url=groq_server.url,
+        api_key="bench",
+    )
+    anthropic = OpenAICompatibleChat(
+        model_name="claude-3-5-sonnet-20240620",
+        base_url=anthropic_server.url,
+        api_key="bench",
+    )
+
+    def router(groq_rate):
+        # Fresh breakers so one setup's failures do not leak into the next
+        return ModelRouter(
+            [
+                Backend(
+                    groq,
+                    "groq",
+                    rate_limit=groq_rate,
+                    burst=10,
+                    breaker=CircuitBreaker("groq"),
+                ),
+                Backend(
+                    anthropic, "anthropic", breaker=CircuitBreaker("anthropic")
+                ),
+            ]
+        )
+
+    setups = [
+        ("anthropic only", lambda: anthropic),
+        ("groq only", lambda: groq),
+        ("round robin", lambda: RoundRobin(groq, anthropic)),
+        ("router", lambda: router(args.groq_rate)),
+        ("router, limit unknown", lambda: router(None)),
+    ]
+    tasks = [f"Resolve ticket {i}" for i in range(50)]
+
+    async def measure(llm):
+        try:
+            return await aload_test(
+                llm.arun,
+                tasks,
+                concurrency=args.concurrency,
+                requests=args.requests,
+            )
+        finally:
+            await aclose_shared_session()
+
+    print(
+        f"{args.requests} calls at concurrency {args.concurrency}; groq"
+        f" ~80ms at {args.groq_rate:g} req/s, anthropic ~400ms unlimited"
+    )
+    try:
+        for label, build in setups:
+            # Let Groq's rate-limit bucket refill between setups
+            time.sleep(1)
+            llm = build()
+            report = asyncio.run(measure(llm))
+            print(
+                f"  {label:<22} {report.throughput:6.1f} req/s"
+                f"  p50={report.latency.p50 * 1000:5.0f}ms"
+                f"  p95={report.latency.p95 * 1000:5.0f}ms"
+                f"  {report.error_rate:5.1%} failed"
+            )
+            if isinstance(llm, ModelRouter):
+                for line in str(llm.stats).splitlines()[1:]:
+                    print(f"  {line}")
+    finally:
+        groq_server.stop()
+        anthropic_server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Time to first output: blocking agent.run versus stream_run.
+
+A five-loop agent, like the lesson's ``enterprise_agent``, runs over a
+StubLLM with ``--latency`` seconds before the first word of each
+completion and ``--token-latency`` seconds per further word. A blocking
+``run`` shows nothing until the last loop ends; the stream's first
+token arrives after one model latency. A zero-latency run measures what
+the streaming machinery itself costs per token.
+
+    python benchmarks/bench_streaming.py [--loops N] [--latency S]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.streaming import stream_run
+from swarms_course.stub_llm import StubLLM
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--token-latency", type=float, default=0.02)
+    parser.add_argument("--overhead-runs", type=int, default=50)
+    args = parser.parse_args()
+
+    from swarms import Agent
+
+    disable_agent_telemetry()
+    llm = StubLLM(latency=args.latency, token_latency=args.token_latency)
+
+    def agent():
+        return Agent(
+            llm=llm, agent_name="stream-bench", max_loops=args.loops
+        )
+
+    task = "Outline an onboarding process for new enterprise customers"
+    with contextlib.redirect_stdout(io.StringIO()):
+        blocking_agent = agent()
+        start = time.perf_counter()
+        blocking_agent.run(task)
+        blocking = time.perf_counter() - start
+
+        stream = stream_run(agent(), task)
+        for _ in stream:
+            pass
+
+        llm.latency = llm.token_latency = 0.0
+        quick = agent()
+        start = time.perf_counter()
+        for _ in range(args.overhead_runs):
+            quick.run(task)
+        plain = time.perf_counter() - start
+        tokens = 0
+        start = time.perf_counter()
+        for _ in range(args.overhead_runs):
+            streamed = stream_run(quick, task)
+            for _ in streamed:
+                pass
+            tokens += streamed.stats.tokens
+        streamed_seconds = time.perf_counter() - start
+
+    stats = stream.stats
+    print(
+        f"{args.loops} loops, {args.latency * 1000:.0f}ms to first word,"
+        f" {args.token_latency * 1000:.0f}ms per word"
+    )
+    print(f"blocking run   first output after {blocking:6.2f}s")
+    print(
+        f"stream_run     first token after  {stats.first_token:6.2f}s"
+        f"  ({stats.seconds:.2f}s total, {stats.tokens} tokens)"
+    )
+    print(
+        "per-loop TTFT  "
+        + ", ".join(f"{s * 1000:.0f}ms" for s in stats.loop_first_tokens)
+    )
+    print(
+        f"overhead       {(streamed_seconds - plain) / tokens * 1e6:6.1f}"
+        f"us/token over {tokens} tokens at zero latency"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Serial configuration loop versus the concurrent sweep utility.
+
+Each configuration builds a swarms Agent over a StubLLM that sleeps for
+a fixed latency per call, which is what a remote model looks like from
+the agent's side. The serial baseline is the loop lesson 1.3 used to
+run; the sweep is ``swarms_course.sweep.sweep`` at several pool sizes.
+
+    python benchmarks/bench_sweep.py [--configs N] [--latency SECONDS]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.stub_llm import StubLLM
+from swarms_course.sweep import sweep
+
+TASK = "Suggest a marketing strategy for a new product."
+
+
+def serial(grid, llm):
+    from swarms import Agent
+
+    start = time.perf_counter()
+    for temperature in grid["temperature"]:
+        agent = Agent(
+            llm=llm,
+            agent_name=f"temp-test-{temperature}",
+            temperature=temperature,
+            max_loops=1,
+        )
+        agent.run(TASK)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--configs", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.25)
+    args = parser.parse_args()
+
+    grid = {
+        "temperature": [
+            round(i / args.configs, 3) for i in range(args.configs)
+        ],
+        "max_loops": [1],
+    }
+    disable_agent_telemetry()
+    llm = StubLLM(latency=args.latency)
+    lines = [f"{args.configs} configs, {args.latency * 1000:.0f}ms model latency"]
+
+    # Agents print every response; keep the benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        baseline = serial(grid, llm)
+        lines.append(f"serial loop        {baseline:6.2f}s")
+        for workers in (2, 4, 8, args.configs):
+            report = sweep(TASK, grid, llm=llm, max_workers=workers)
+            lines.append(
+                f"sweep workers={workers:<3}  {report.wall_seconds:6.2f}s"
+                f"  {baseline / report.wall_seconds:4.1f}x"
+                f"  p95 run {report.latency.p95 * 1000:.0f}ms"
+            )
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
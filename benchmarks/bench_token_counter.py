@@ -0,0 +1,79 @@
+"""Full re-tokenization versus the incremental TokenCounter.
+
+Grows a swarms Conversation one message at a time and asks for the
+token budget after every append, the way an agent loop checks its
+context. The baseline is ``Agent.check_available_tokens``: tokenize the
+whole rendered history with the agent's tokenizer. The counter
+tokenizes each message once.
+
+    python benchmarks/bench_token_counter.py [--turns N ...]
+"""
+import argparse
+import time
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.tokens import TokenCounter
+
+MESSAGE = (
+    "Customer {i} asked about renewal pricing for the Enterprise Suite;"
+    " we confirmed the discount tier and scheduled a follow-up call."
+)
+
+
+def conversation():
+    from swarms.structs.conversation import Conversation
+
+    return Conversation(system_prompt="You are an enterprise assistant.")
+
+
+def rescan(memory, tokenizer, turns):
+    """check_available_tokens after every append"""
+    memory.conversation_history = memory.conversation_history[:1]
+    start = time.perf_counter()
+    for i in range(turns):
+        memory.add("User", MESSAGE.format(i=i))
+        tokenizer.count_tokens(memory.return_history_as_string())
+    return time.perf_counter() - start
+
+
+def incremental(memory, tokenizer, turns):
+    memory.conversation_history = memory.conversation_history[:1]
+    counter = TokenCounter(memory, tokenizer)
+    start = time.perf_counter()
+    for i in range(turns):
+        memory.add("User", MESSAGE.format(i=i))
+        counter.used
+    return time.perf_counter() - start, counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--turns", type=int, nargs="+", default=[250, 1000, 4000]
+    )
+    args = parser.parse_args()
+
+    from swarm_models.tiktoken_wrapper import TikTokenizer
+
+    tokenizer = TikTokenizer()
+    for turns in args.turns:
+        memory = conversation()
+        baseline = rescan(memory, tokenizer, turns)
+        full = tokenizer.count_tokens(memory.return_history_as_string())
+        seconds, counter = incremental(memory, tokenizer, turns)
+        start = time.perf_counter()
+        for _ in range(10000):
+            counter.remaining
+        query = (time.perf_counter() - start) / 10000
+        print(
+            f"{turns:>6} turns  rescan {baseline * 1000 / turns:8.3f}ms/turn"
+            f"  counter {seconds * 1000 / turns:6.3f}ms/turn"
+            f"  {baseline / seconds:6.1f}x"
+            f"  query {query * 1e6:.2f}us"
+            f"  tokens {counter.used} vs {full}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Cost of tracing an agent: plain runs versus instrumented runs.
+
+An agent runs ``--loops`` loops per task against a zero-latency StubLLM,
+so the difference between plain and instrumented runs is the tracing
+itself: span bookkeeping, the collector and incremental token counts.
+The per-run cost is then set against a run whose model takes
+``--latency`` seconds per call to give the production overhead.
+
+    python benchmarks/bench_tracing.py [--runs N] [--loops N] [--latency S]
+"""
+import argparse
+import contextlib
+import os
+import time
+
+from common import disable_agent_telemetry
+
+from swarms_course.stub_llm import StubLLM
+from swarms_course.tracing import Tracer, instrument
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--loops", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    from swarms import Agent
+
+    disable_agent_telemetry()
+
+    def agent():
+        return Agent(
+            llm=StubLLM(), agent_name="trace-bench", max_loops=args.loops
+        )
+
+    def timed(agent):
+        history = agent.short_memory.conversation_history
+        base = len(history)
+        start = time.perf_counter()
+        for i in range(args.runs):
+            agent.run(f"Summarise support ticket {i}")
+            del history[base:]
+        return (time.perf_counter() - start) / args.runs
+
+    tracer = Tracer()
+    traced = agent()
+    instrument(traced, tracer)
+    plain = agent()
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        # Interleave the two so drift affects both equally
+        plain_seconds = traced_seconds = 0.0
+        for _ in range(3):
+            plain_seconds += timed(plain) / 3
+            traced_seconds += timed(traced) / 3
+
+    spans = len(tracer.collector.spans)
+    per_run = traced_seconds - plain_seconds
+    model_run = plain_seconds + args.loops * args.latency
+    print(
+        f"{args.runs} runs x {args.loops} loops,"
+        f" {spans / (3 * args.runs):.0f} spans per run"
+    )
+    print(f"plain run        {plain_seconds * 1e3:8.3f}ms")
+    print(
+        f"instrumented     {traced_seconds * 1e3:8.3f}ms"
+        f"  (+{per_run * 1e6:.0f}us,"
+        f" {per_run / (spans / (3 * args.runs)) * 1e6:.1f}us/span)"
+    )
+    print(
+        f"overhead with a {args.latency * 1000:.0f}ms model:"
+        f" {per_run / model_run:.3%} of a {model_run:.2f}s run"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Recall and latency of VectorMemory at a million entries.
+
+Fills a persisted VectorMemory with clustered synthetic embeddings (a
+million texts through the hashing embedder would only time the
+embedder), builds the IVF index, reopens the directory cold through
+memmap, and compares exact search with the index at several ``nprobe``
+settings. Recall@k is measured against exact search on queries that are
+perturbed copies of stored vectors.
+
+    python benchmarks/bench_vector_memory.py [--entries N] [--dim D]
+"""
+import argparse
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+import common  # noqa: F401  (puts the repo root on sys.path)
+
+from swarms_course.vector_memory import VectorMemory
+
+
+def clustered(rng, count, dim, clusters, chunk=100000):
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    for start in range(0, count, chunk):
+        size = min(chunk, count - start)
+        vectors = centers[rng.integers(clusters, size=size)]
+        vectors += rng.normal(size=(size, dim)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        yield start, vectors
+
+
+def rss_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as path:
+        start = time.perf_counter()
+        with VectorMemory(path, dim=args.dim) as memory:
+            for offset, vectors in clustered(
+                rng, args.entries, args.dim, clusters=2000
+            ):
+                memory.add_many(
+                    (f"memory {offset + i}" for i in range(len(vectors))),
+                    vectors,
+                )
+            loaded = time.perf_counter() - start
+            start = time.perf_counter()
+            memory.build_index()
+            indexed = time.perf_counter() - start
+        print(
+            f"{args.entries} x {args.dim} entries: load {loaded:.1f}s,"
+            f" index build {indexed:.1f}s"
+            f" ({len(memory._centroids)} lists)"
+        )
+
+        memory = VectorMemory(path)
+        picks = rng.integers(args.entries, size=args.queries)
+        queries = np.asarray(memory._vectors[picks]).copy()
+        noise = rng.normal(size=queries.shape).astype(np.float32)
+        queries += 0.5 / np.sqrt(args.dim) * noise
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        truth = []
+        start = time.perf_counter()
+        for query in queries:
+            hits = memory.search_vector(query, k=args.k, exact=True)
+            truth.append({index for index, _ in hits})
+        exact = (time.perf_counter() - start) / args.queries
+        print(f"exact          {exact * 1000:8.2f}ms/query  recall 1.000")
+
+        for nprobe in (1, 4, 8, 16, 32):
+            found = 0
+            start = time.perf_counter()
+            for query, expected in zip(queries, truth):
+                hits = memory.search_vector(query, k=args.k, nprobe=nprobe)
+                found += len(expected & {index for index, _ in hits})
+            seconds = (time.perf_counter() - start) / args.queries
+            print(
+                f"ivf nprobe={nprobe:<3} {seconds * 1000:8.2f}ms/query"
+                f"  recall {found / (args.k * args.queries):.3f}"
+                f"  {exact / seconds:5.1f}x"
+            )
+
+        start = time.perf_counter()
+        for _ in range(20):
+            memory.query("renewal date for customer 12345")
+        print(
+            f"query() text     {(time.perf_counter() - start) / 20 * 1000:6.2f}ms"
+            f"  (embed + search + fetch {memory.k} texts)"
+        )
+        print(f"peak RSS {rss_mib():.0f} MiB")
+        memory.close()
+
+
+if __name__ == "__main__":
+    main()
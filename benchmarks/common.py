@@ -0,0 +1,18 @@
+"""Shared setup for the benchmark scripts."""
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def disable_agent_telemetry():
+    """Keep swarms' per-run telemetry POST out of the measurements
+
+    ``Agent.run`` reports agent data to swarms.world synchronously; that
+    network round trip has nothing to do with what the benchmarks time.
+    """
+    from swarms import Agent
+
+    Agent.log_agent_data = lambda self, *args, **kwargs: None
@@ -0,0 +1,292 @@
+"""Micro-benchmark suite for the agent operations the lessons rely on.
+
+Each ``time_*`` function below sets up its inputs and returns the
+operation to time, in the style of asv. Every operation is calibrated
+to run for at least ``--min-time`` seconds per sample and sampled
+``--repeat`` times; the median and fastest per-call times are reported.
+
+Results are appended to a JSON-lines history (``--history``), one
+record per run with the commit, the package versions and a machine key.
+Each case is compared with the median of the last ``--window`` runs on
+the same machine, and a slowdown beyond ``--threshold`` is flagged as a
+regression; with ``--check`` the suite then exits with status 1.
+
+Telemetry POSTs to swarms.world are disabled, so only local work is
+timed; ``Prompt.get_prompt`` still collects its system data.
+
+    python benchmarks/suite.py [-k FILTER] [--repeat N] [--threshold 0.15]
+        [--check] [--no-save]
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from importlib import metadata
+
+from common import REPO_ROOT, disable_agent_telemetry
+
+from swarms_course.stub_llm import StubLLM
+
+HISTORY = os.path.join(REPO_ROOT, "benchmarks", "results", "history.jsonl")
+
+SYSTEM_PROMPT = (
+    "You are an enterprise assistant capable of analysing business"
+    " data, generating reports and answering customer questions."
+)
+
+TURNS = [
+    "Analyze the customer feedback: 'Your product is great but the"
+    " interface needs improvement'",
+    "Here is a structured plan: clarify the goal, gather the relevant"
+    " data, analyse it, and report actionable recommendations.",
+] * 25
+
+
+def _agent(**kwargs):
+    from swarms import Agent
+
+    return Agent(
+        llm=StubLLM(),
+        agent_name="bench-agent",
+        system_prompt=SYSTEM_PROMPT,
+        max_loops=1,
+        **kwargs,
+    )
+
+
+def _agent_with_history():
+    agent = _agent()
+    for i, turn in enumerate(TURNS):
+        agent.short_memory.add(
+            role="user" if i % 2 == 0 else agent.agent_name, content=turn
+        )
+    return agent
+
+
+def time_agent_construction():
+    return _agent
+
+
+def time_add_memory():
+    agent = _agent()
+    history = agent.short_memory.conversation_history
+    base = len(history)
+
+    def add():
+        agent.add_memory(TURNS[0])
+        # Keep the history short so later samples time the same work
+        if len(history) > base + 100:
+            del history[base:]
+
+    return add
+
+
+def time_return_history_as_string():
+    return _agent_with_history().short_memory.return_history_as_string
+
+
+def time_check_available_tokens():
+    return _agent_with_history().check_available_tokens
+
+
+def time_prompt_get_prompt():
+    from swarms.prompts.prompt import Prompt
+
+    return Prompt(name="enterprise", content=SYSTEM_PROMPT).get_prompt
+
+
+def time_agent_run_stub():
+    agent = _agent()
+    history = agent.short_memory.conversation_history
+    base = len(history)
+
+    def run():
+        agent.run(TURNS[0])
+        del history[base:]
+
+    return run
+
+
+CASES = {
+    name[len("time_"):]: case
+    for name, case in sorted(globals().items())
+    if name.startswith("time_")
+}
+
+
+def measure(op, repeat, min_time):
+    """Median and fastest seconds per call over ``repeat`` samples"""
+    timer = timeit.Timer(op)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+    samples = [t / number for t in timer.repeat(repeat, number)]
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def machine():
+    """Key identifying comparable runs"""
+    return "-".join(
+        [
+            platform.system().lower(),
+            platform.machine(),
+            f"py{platform.python_version()}",
+            f"{os.cpu_count()}cpu",
+        ]
+    )
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version(package):
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def baselines(history, key, window):
+    """Median of each case's medians over the last ``window`` runs"""
+    runs = [run for run in history if run["machine"] == key][-window:]
+    medians = {}
+    for run in runs:
+        for name, result in run["results"].items():
+            medians.setdefault(name, []).append(result["median"])
+    return {
+        name: statistics.median(values) for name, values in medians.items()
+    }
+
+
+def _format(seconds):
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.2f}ms"
+    return f"{seconds * 1e6:8.1f}us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k", dest="filter", help="only run cases containing this string"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="seconds each sample should take at least",
+    )
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=5,
+        help="compare against the median of this many previous runs",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="flag slowdowns beyond this fraction",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 on a regression"
+    )
+    parser.add_argument(
+        "--no-save", action="store_true", help="do not record this run"
+    )
+    args = parser.parse_args()
+
+    import swarms.prompts.prompt
+
+    disable_agent_telemetry()
+    swarms.prompts.prompt.log_agent_data = lambda *args, **kwargs: None
+
+    key = machine()
+    history = load_history(args.history)
+    baseline = baselines(history, key, args.window)
+    cases = {
+        name: case
+        for name, case in CASES.items()
+        if not args.filter or args.filter in name
+    }
+
+    print(f"{len(cases)} cases on {key}, {len(history)} runs in history")
+    results = {}
+    regressions = []
+    for name, case in cases.items():
+        # Agents print every response; keep the report readable
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            results[name] = result = measure(
+                case(), args.repeat, args.min_time
+            )
+        line = (
+            f"{name:<28} {_format(result['median'])}"
+            f"  (min {_format(result['min']).strip()})"
+        )
+        if name in baseline:
+            change = result["median"] / baseline[name] - 1
+            line += f"  {change:+7.1%} vs {_format(baseline[name]).strip()}"
+            if change > args.threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if not args.no_save:
+        directory = os.path.dirname(os.path.abspath(args.history))
+        os.makedirs(directory, exist_ok=True)
+        record = {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc)
+            .isoformat(timespec="seconds"),
+            "commit": _commit(),
+            "machine": key,
+            "versions": {
+                package: _version(package)
+                for package in ("swarms", "swarm-models", "tiktoken")
+            },
+            "results": results,
+        }
+        with open(args.history, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) beyond"
+            f" {args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,362 +1,13 @@
 import nbformat as nbf
 
-nb = nbf.v4.new_notebook()
+from scripts.lesson_spec import compile_lesson, lesson_path
 
-# Title and Course Overview
-nb.cells.append(nbf.v4.new_markdown_cell("""# 1.1 Introduction to Autonomous Agents
 
-## Course Overview
-This module introduces the fundamental concepts of autonomous agents, their architecture, and their role in enterprise systems. We'll focus on understanding what agents are, how they work, and why they're transformative for business operations.
+def create_introduction_lesson():
+    """Create the 1.1 Introduction to Autonomous Agents notebook"""
+    return compile_lesson(lesson_path("1.1_Introduction_to_Autonomous_Agents.md"))
 
-## Learning Objectives
-- Understand what autonomous agents are and their role in enterprise systems
-- Learn about the core components of agent architecture
-- Explore the Swarms agent ecosystem
-- Grasp how agents interact with their environment and tools
 
-## What are Autonomous Agents?
-
-An autonomous agent is a software entity that can:
-- Perceive its environment
-- Make decisions independently
-- Take actions to achieve specific goals
-- Learn and adapt from experiences
-- Interact with other agents and systems
-
-Think of an agent as a digital employee that can:
-- Understand and process natural language instructions
-- Remember past interactions and context
-- Use various tools and systems
-- Make reasoned decisions based on available information
-- Complete complex tasks through multiple steps
-
-### Real-World Analogies
-
-🧠 **Human Worker Analogy**
-Just as a human employee needs certain capabilities to work effectively, an agent requires:
-- Knowledge (Training and Context)
-- Memory (Short and Long-term)
-- Tools (Software and Systems Access)
-- Decision-making ability (Logic and Reasoning)
-- Communication skills (Input/Output Processing)
-"""))
-
-# Agent Architecture
-nb.cells.append(nbf.v4.new_markdown_cell("""## Agent Architecture
-
-### Core Components
-
-1. **Brain (Language Model)**
-   - Acts as the cognitive center
-   - Processes information and makes decisions
-   - Generates responses and plans actions
-   - Understands context and nuance
-
-2. **Memory Systems**
-   - Short-term Memory (Current Conversation)
-   - Long-term Memory (Historical Knowledge)
-   - Episodic Memory (Past Experiences)
-   - Working Memory (Active Task Processing)
-
-3. **Tool Interface**
-   - API Connections
-   - System Access
-   - External Resource Integration
-   - Custom Function Execution
-
-4. **Input/Output Processors**
-   - Natural Language Understanding
-   - Response Generation
-   - Multi-modal Processing (Text, Images, etc.)
-   - Format Handling
-
-### Architectural Flow
-
-```
-[Input] → [Processing] → [Action] → [Output]
-   ↑          ↑            ↑          ↓
-   └──────[Memory]──────[Tools]────────┘
-```
-
-### Key Principles
-
-1. **Autonomy**
-   - Independent decision making
-   - Self-directed task execution
-   - Goal-oriented behavior
-
-2. **Persistence**
-   - Maintains state across interactions
-   - Learns from experiences
-   - Builds context over time
-
-3. **Reactivity**
-   - Responds to environmental changes
-   - Adapts to new information
-   - Handles unexpected situations
-
-4. **Proactivity**
-   - Takes initiative when appropriate
-   - Anticipates needs
-   - Suggests improvements
-"""))
-
-# Enterprise Components
-nb.cells.append(nbf.v4.new_markdown_cell("""## Key Components of Enterprise Agents
-
-### 1. Enterprise Integration Layer
-
-**System Connectivity**
-- Database Integration
-- API Management
-- Legacy System Compatibility
-- Security Protocols
-
-**Data Processing**
-- Document Analysis
-- Information Extraction
-- Data Transformation
-- Format Conversion
-
-**Workflow Integration**
-- Business Process Management
-- Task Orchestration
-- Event Handling
-- Status Tracking
-
-### 2. Business Logic Layer
-
-**Decision Making**
-- Rule Processing
-- Policy Compliance
-- Risk Assessment
-- Priority Management
-
-**Process Automation**
-- Workflow Execution
-- Task Scheduling
-- Resource Allocation
-- Quality Control
-
-**Knowledge Management**
-- Information Organization
-- Context Preservation
-- Knowledge Base Updates
-- Learning Integration
-
-### 3. Communication Layer
-
-**Interface Management**
-- User Interaction
-- System Messaging
-- Notification Handling
-- Status Reporting
-
-**Protocol Handling**
-- Format Standards
-- Data Exchange
-- Error Handling
-- Recovery Procedures
-
-### 4. Security Layer
-
-**Access Control**
-- Authentication
-- Authorization
-- Audit Logging
-- Compliance Tracking
-
-**Data Protection**
-- Encryption
-- Privacy Controls
-- Data Governance
-- Regulatory Compliance
-"""))
-
-# Swarms Ecosystem
-nb.cells.append(nbf.v4.new_markdown_cell("""## The Swarms Agent Ecosystem
-
-### Overview of Swarms
-
-Swarms provides a robust framework for building and deploying enterprise-grade autonomous agents. It offers:
-
-1. **Agent Management**
-   - Agent Creation and Configuration
-   - Lifecycle Management
-   - State Persistence
-   - Performance Monitoring
-
-2. **Tool Integration**
-   - Built-in Tool Library
-   - Custom Tool Development
-   - Tool Chain Management
-   - Function Calling Framework
-
-3. **Memory Systems**
-   - Conversation Management
-   - Vector Database Integration
-   - Context Preservation
-   - Knowledge Base Management
-
-4. **Enterprise Features**
-   - Scalability Options
-   - Monitoring and Logging
-   - Error Handling
-   - Performance Optimization
-
-### Agent Types in Swarms
-
-1. **Single-Purpose Agents**
-   - Focused on specific tasks
-   - Optimized for particular domains
-   - Streamlined configuration
-   - Clear success metrics
-
-2. **Multi-Purpose Agents**
-   - Handle various tasks
-   - Adaptable to different contexts
-   - Complex decision making
-   - Broad tool access
-
-3. **Collaborative Agents**
-   - Work in teams
-   - Share information
-   - Coordinate actions
-   - Achieve complex goals
-
-### Agent Capabilities
-
-1. **Core Capabilities**
-   - Natural Language Processing
-   - Task Planning
-   - Decision Making
-   - Memory Management
-
-2. **Extended Capabilities**
-   - Tool Usage
-   - API Integration
-   - Document Processing
-   - Multi-modal Interaction
-
-3. **Enterprise Capabilities**
-   - Workflow Automation
-   - Process Integration
-   - Security Compliance
-   - Audit Trail Maintenance
-"""))
-
-# Use Cases and Benefits
-nb.cells.append(nbf.v4.new_markdown_cell("""## Enterprise Use Cases and Benefits
-
-### Common Use Cases
-
-1. **Customer Service**
-   - Query Resolution
-   - Ticket Management
-   - Information Distribution
-   - Support Escalation
-
-2. **Data Processing**
-   - Document Analysis
-   - Data Extraction
-   - Report Generation
-   - Insight Development
-
-3. **Process Automation**
-   - Workflow Management
-   - Task Coordination
-   - Quality Control
-   - Resource Allocation
-
-4. **Knowledge Management**
-   - Information Organization
-   - Content Creation
-   - Knowledge Base Maintenance
-   - Training Support
-
-### Business Benefits
-
-1. **Efficiency Gains**
-   - 24/7 Operation
-   - Faster Processing
-   - Reduced Errors
-   - Consistent Performance
-
-2. **Cost Reduction**
-   - Lower Operational Costs
-   - Reduced Manual Work
-   - Optimized Resource Use
-   - Scaled Operations
-
-3. **Quality Improvements**
-   - Consistent Results
-   - Error Reduction
-   - Better Compliance
-   - Enhanced Accuracy
-
-4. **Strategic Advantages**
-   - Improved Scalability
-   - Better Customer Service
-   - Enhanced Analytics
-   - Innovation Enablement
-"""))
-
-# Best Practices
-nb.cells.append(nbf.v4.new_markdown_cell("""## Best Practices and Considerations
-
-### Implementation Best Practices
-
-1. **Planning**
-   - Clear Use Case Definition
-   - Success Metrics Establishment
-   - Resource Assessment
-   - Risk Evaluation
-
-2. **Development**
-   - Iterative Implementation
-   - Thorough Testing
-   - Performance Monitoring
-   - Security Integration
-
-3. **Deployment**
-   - Phased Rollout
-   - User Training
-   - Support Structure
-   - Feedback Collection
-
-4. **Maintenance**
-   - Regular Updates
-   - Performance Optimization
-   - Security Patches
-   - Feature Enhancement
-
-### Key Considerations
-
-1. **Technical Considerations**
-   - Infrastructure Requirements
-   - Integration Complexity
-   - Scaling Needs
-   - Maintenance Demands
-
-2. **Business Considerations**
-   - ROI Assessment
-   - Resource Allocation
-   - Change Management
-   - Training Requirements
-
-3. **Security Considerations**
-   - Data Protection
-   - Access Control
-   - Compliance Requirements
-   - Risk Management
-
-4. **Ethical Considerations**
-   - Privacy Protection
-   - Bias Prevention
-   - Transparency
-   - Accountability
-"""))
-
-# Save the notebook
-with open("1.1_Introduction_to_Autonomous_Agents.ipynb", "w") as f:
-    nbf.write(nb, f)
\ No newline at end of file
+if __name__ == "__main__":
+    with open("1.1_Introduction_to_Autonomous_Agents.ipynb", "w") as f:
+        nbf.write(create_introduction_lesson(), f)
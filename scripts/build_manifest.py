@@ -0,0 +1,45 @@
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = ".build_manifest.json"
+
+
+def hash_cells(nb):
+    """Hash a notebook's cells and metadata, ignoring the random cell ids"""
+    cells = [
+        [cell.cell_type, cell.source, cell.get("metadata", {})]
+        for cell in nb.cells
+    ]
+    if nb.get("metadata"):
+        cells = {"cells": cells, "metadata": nb.metadata}
+    payload = json.dumps(cells, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_dir):
+    """Load the {filename: cell hash} manifest, empty if missing or unreadable"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(output_dir, manifest):
+    """Atomically write the manifest next to the generated notebooks"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def is_stale(output_dir, filename, digest, manifest):
+    """A notebook needs writing if its hash changed or the file is gone"""
+    if manifest.get(filename) != digest:
+        return True
+    return not os.path.exists(os.path.join(output_dir, filename))
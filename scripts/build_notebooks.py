@@ -0,0 +1,213 @@
+"""Build every course notebook from one entry point.
+
+Lessons are declarative specs under ``lessons/`` (see ``lesson_spec``),
+found without running any generator code. Each lesson is compiled,
+hashed and streamed to a temp file by a worker process (see
+``nbwriter``); the parent moves the files into place in a fixed order
+so the output and the report are identical from run to run.
+Specs whose compiled cache and manifest entry are both current are
+reported unchanged without being handed to a worker at all.
+
+    python scripts/build_notebooks.py [--force] [--jobs N] [--output-dir DIR]
+"""
+import argparse
+import filecmp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from build_manifest import is_stale, load_manifest, save_manifest
+from lesson_spec import (
+    cached_entry,
+    discover_specs,
+    hash_spec_cells,
+    lesson_key,
+    load_cells,
+    make_cells,
+    notebook_metadata,
+    output_path,
+)
+from nbwriter import write_cells
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def discover_lessons():
+    """List (spec path, notebook path) pairs in a stable order
+
+    Notebook paths are relative to the output directory; see
+    ``lesson_spec.output_path``.
+    """
+    return [(path, output_path(path)) for path in discover_specs()]
+
+
+def recorded_digest(output_dir, filename, manifest):
+    """The manifest hash, or None when the notebook has to be rewritten"""
+    digest = manifest.get(filename)
+    if is_stale(output_dir, filename, digest, manifest):
+        return None
+    return digest
+
+
+def build_lesson(
+    path, filename, known_digest, force, output_dir, stable_ids=True
+):
+    """Construct, hash and (if needed) stream one lesson to a temp file"""
+    start = time.perf_counter()
+    cells = load_cells(path)
+    metadata = notebook_metadata(path)
+    digest = hash_spec_cells(cells, metadata)
+    key = lesson_key(path) if stable_ids else None
+    nb_cells = make_cells(cells, key)
+
+    tmp_path = None
+    if force or digest != known_digest:
+        tmp_path = os.path.join(output_dir, f"{filename}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            write_cells(nb_cells, f, metadata)
+    return {
+        "filename": filename,
+        "digest": digest,
+        "tmp_path": tmp_path,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def build_all(
+    output_dir="notebooks", jobs=None, force=False, stable_ids=True
+):
+    """Build all discovered lessons and return their per-lesson results"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    lessons = discover_lessons()
+
+    seen = {}
+    for path, filename in lessons:
+        if filename in seen:
+            raise ValueError(
+                f"{filename} is declared by both {seen[filename]}"
+                f" and {path}"
+            )
+        seen[filename] = path
+        os.makedirs(
+            os.path.join(output_dir, os.path.dirname(filename)),
+            exist_ok=True,
+        )
+
+    results = [None] * len(lessons)
+    pending = []
+    for position, (path, filename) in enumerate(lessons):
+        digest = recorded_digest(output_dir, filename, manifest)
+        if not force and digest is not None:
+            start = time.perf_counter()
+            entry = cached_entry(path)
+            if entry is not None and entry["digest"] == digest:
+                results[position] = {
+                    "filename": filename,
+                    "digest": digest,
+                    "tmp_path": None,
+                    "seconds": time.perf_counter() - start,
+                }
+                continue
+        pending.append((position, path, filename, digest))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                (
+                    position,
+                    pool.submit(
+                        build_lesson,
+                        path,
+                        filename,
+                        digest,
+                        force,
+                        output_dir,
+                        stable_ids,
+                    ),
+                )
+                for position, path, filename, digest in pending
+            ]
+            for position, future in futures:
+                results[position] = future.result()
+
+    written = 0
+    manifest_changed = False
+    for result in results:
+        filename = result["filename"]
+        tmp_path = result.pop("tmp_path")
+        target = os.path.join(output_dir, filename)
+        if tmp_path is not None and os.path.exists(target):
+            # Stable ids make regenerated lessons byte-identical, so a
+            # forced rebuild leaves unchanged files (and mtimes) alone
+            if filecmp.cmp(tmp_path, target, shallow=False):
+                os.remove(tmp_path)
+                tmp_path = None
+        result["written"] = tmp_path is not None
+        if result["written"]:
+            os.replace(tmp_path, target)
+            written += 1
+        if manifest.get(filename) != result["digest"]:
+            manifest[filename] = result["digest"]
+            manifest_changed = True
+
+    if manifest_changed:
+        save_manifest(output_dir, manifest)
+    return results
+
+
+def print_report(results, elapsed):
+    """Print build time per lesson in discovery order"""
+    width = max((len(r["filename"]) for r in results), default=0)
+    for result in results:
+        status = "built" if result["written"] else "unchanged"
+        print(
+            f"{result['filename']:<{width}}  {status:<9}"
+            f"  {result['seconds'] * 1000:8.1f} ms"
+        )
+    written = sum(r["written"] for r in results)
+    print(
+        f"{written}/{len(results)} notebooks written in"
+        f" {elapsed:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build all course notebooks in parallel"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="notebooks",
+        help="directory the notebooks are written to",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate every notebook even if its cells are unchanged",
+    )
+    parser.add_argument(
+        "--random-ids",
+        action="store_true",
+        help="let nbformat assign random cell ids instead of stable ones",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = build_all(
+        args.output_dir,
+        args.jobs,
+        args.force,
+        stable_ids=not args.random_ids,
+    )
+    print_report(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
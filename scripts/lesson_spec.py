@@ -0,0 +1,316 @@
+"""Declarative lesson specs compiled to notebooks.
+
+A lesson spec is a plain text file: a front-matter header followed by a
+run of cells, each introduced by a marker line.
+
+    ---
+    title: Module 1.2: Agent Fundamentals
+    output: module1_lesson2.ipynb
+    metadata: {"kernelspec": {"name": "python3", ...}}
+    ---
+    <!-- markdown -->
+    # Module 1.2: Agent Fundamentals
+    <!-- code -->
+    from swarms import Agent
+
+The optional ``metadata`` key holds the notebook-level metadata
+(kernelspec, language_info) as one line of JSON.
+
+A cell's source is everything between its marker and the next one,
+minus the line break right before that next marker, so sources
+round-trip verbatim (leading blank lines and trailing indentation
+included). The markers are HTML comments and disappear when the spec
+is rendered as markdown.
+
+Specs are parsed line by line and cells are yielded as soon as they are
+complete. Compiled cell lists are cached under ``.lesson_cache/`` keyed
+by the spec's content hash, with a stat index in front so that a repeat
+build of an untouched spec does not even read it.
+
+Notebooks are written under a directory per course module, taken from
+the spec's file name (``1.2_Agent_Fundamentals.md`` and
+``module1_lesson2.md`` both belong to ``module1/``); the ``output``
+front-matter key names the file inside it.
+
+Cell ids are derived from the spec path and each cell's index and
+content rather than drawn at random, so recompiling an unchanged lesson
+yields a byte-identical notebook.
+"""
+import hashlib
+import json
+import os
+import re
+
+import nbformat as nbf
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LESSONS_DIR = os.path.join(REPO_ROOT, "lessons")
+CACHE_DIR = os.path.join(REPO_ROOT, ".lesson_cache")
+SPEC_SUFFIX = ".md"
+
+FRONT_MATTER = "---"
+CELL_MARKERS = {
+    "<!-- markdown -->": "markdown",
+    "<!-- code -->": "code",
+}
+
+
+class LessonSpecError(ValueError):
+    """Raised when a lesson spec cannot be parsed"""
+
+
+def lesson_path(name):
+    """Path of a spec in the lessons/ directory"""
+    return os.path.join(LESSONS_DIR, name)
+
+
+def discover_specs(lessons_dir=LESSONS_DIR):
+    """List lesson spec paths in a stable order"""
+    if not os.path.isdir(lessons_dir):
+        return []
+    specs = []
+    for directory, subdirs, files in os.walk(lessons_dir):
+        subdirs.sort()
+        specs.extend(
+            os.path.join(directory, name)
+            for name in sorted(files)
+            if name.endswith(SPEC_SUFFIX)
+        )
+    return specs
+
+
+def _read_front_matter(lines, path):
+    """Consume the header from a line iterator and return it as a dict"""
+    first = next(lines, None)
+    if first is None or first.rstrip("\n") != FRONT_MATTER:
+        raise LessonSpecError(f"{path}: missing front matter")
+    metadata = {}
+    for line in lines:
+        line = line.rstrip("\n")
+        if line == FRONT_MATTER:
+            break
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            raise LessonSpecError(
+                f"{path}: bad front matter line {line!r}"
+            )
+        metadata[key.strip()] = value.strip()
+    else:
+        raise LessonSpecError(f"{path}: unterminated front matter")
+    metadata.setdefault(
+        "output",
+        os.path.basename(path)[: -len(SPEC_SUFFIX)] + ".ipynb",
+    )
+    return metadata
+
+
+def read_metadata(path):
+    """Read only the front matter of a spec, without touching its cells"""
+    with open(path, encoding="utf-8") as f:
+        return _read_front_matter(iter(f), path)
+
+
+def notebook_metadata(path, metadata=None):
+    """Notebook-level metadata declared by a spec, ``{}`` if none"""
+    if metadata is None:
+        metadata = read_metadata(path)
+    try:
+        notebook = json.loads(metadata.get("metadata", "{}"))
+    except ValueError as error:
+        raise LessonSpecError(f"{path}: bad notebook metadata: {error}")
+    if not isinstance(notebook, dict):
+        raise LessonSpecError(f"{path}: notebook metadata is not an object")
+    return notebook
+
+
+MODULE_PATTERN = re.compile(r"(?:module)?(\d+)[._]")
+
+
+def lesson_module(path):
+    """Module directory of a spec, ``module1`` for ``1.2_...``"""
+    match = MODULE_PATTERN.match(os.path.basename(path))
+    if match is None:
+        raise LessonSpecError(f"{path}: no module number in the file name")
+    return f"module{int(match.group(1))}"
+
+
+def output_path(path, metadata=None):
+    """Notebook path of a spec, relative to the output directory
+
+    Also the spec's key in the build manifest, so it always uses
+    forward slashes.
+    """
+    if metadata is None:
+        metadata = read_metadata(path)
+    return f"{lesson_module(path)}/{metadata['output']}"
+
+
+def iter_cells(path):
+    """Yield (cell_type, source) pairs as the spec is read"""
+    with open(path, encoding="utf-8") as f:
+        lines = iter(f)
+        _read_front_matter(lines, path)
+        cell_type = None
+        body = []
+        for line in lines:
+            marker = CELL_MARKERS.get(line.rstrip("\n"))
+            if marker is None:
+                if cell_type is None:
+                    if line.strip():
+                        raise LessonSpecError(
+                            f"{path}: content before the first cell"
+                        )
+                    continue
+                body.append(line)
+                continue
+            if cell_type is not None:
+                yield cell_type, _cell_source(body)
+            cell_type = marker
+            body = []
+        if cell_type is not None:
+            yield cell_type, _cell_source(body)
+
+
+def _cell_source(body):
+    source = "".join(body)
+    return source[:-1] if source.endswith("\n") else source
+
+
+def dumps_spec(metadata, cells):
+    """Render front matter and (cell_type, source) pairs as a spec"""
+    markers = {kind: marker for marker, kind in CELL_MARKERS.items()}
+    parts = [FRONT_MATTER + "\n"]
+    parts.extend(f"{key}: {value}\n" for key, value in metadata.items())
+    parts.append(FRONT_MATTER + "\n")
+    for cell_type, source in cells:
+        parts.append(markers[cell_type] + "\n")
+        parts.append(source + "\n")
+    return "".join(parts)
+
+
+def hash_spec_cells(cells, metadata=None):
+    """Hash a (cell_type, source) list the same way as build_manifest
+
+    Notebook ``metadata``, when there is any, is hashed with the cells.
+    """
+    payload = [[cell_type, source, {}] for cell_type, source in cells]
+    if metadata:
+        payload = {"cells": payload, "metadata": metadata}
+    payload = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _index_path(cache_dir):
+    return os.path.join(cache_dir, "index.json")
+
+
+def _load_index(cache_dir):
+    try:
+        with open(_index_path(cache_dir)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def cached_entry(path, cache_dir=CACHE_DIR, index=None):
+    """Index entry for a spec if its file is unchanged since it was cached"""
+    if index is None:
+        index = _load_index(cache_dir)
+    entry = index.get(os.path.abspath(path))
+    if entry is None:
+        return None
+    stat = os.stat(path)
+    if (entry["mtime_ns"], entry["size"]) != (
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return None
+    return entry
+
+
+def load_cells(path, cache_dir=CACHE_DIR):
+    """Return the spec's cells, parsing it only on a cache miss"""
+    index = _load_index(cache_dir)
+    key = os.path.abspath(path)
+    entry = cached_entry(path, cache_dir, index)
+    stat = os.stat(path)
+    if entry is None:
+        with open(path, "rb") as f:
+            sha = hashlib.sha256(f.read()).hexdigest()
+        previous = index.get(key)
+        if previous is not None and previous["sha256"] == sha:
+            entry = dict(previous)
+    else:
+        sha = entry["sha256"]
+
+    cells_path = os.path.join(cache_dir, sha + ".json")
+    cells = None
+    if entry is not None:
+        try:
+            with open(cells_path, encoding="utf-8") as f:
+                cells = [tuple(cell) for cell in json.load(f)]
+        except (OSError, ValueError):
+            cells = None
+
+    if cells is None:
+        cells = list(iter_cells(path))
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_json(cells_path, cells)
+        digest = hash_spec_cells(cells, notebook_metadata(path))
+        entry = {"sha256": sha, "digest": digest}
+
+    entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+    if index.get(key) != entry:
+        index = _load_index(cache_dir)
+        index[key] = entry
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_json(_index_path(cache_dir), index)
+    return cells
+
+
+def lesson_key(path):
+    """Repository-relative spec path, the namespace for its cell ids"""
+    return os.path.relpath(os.path.abspath(path), REPO_ROOT).replace(
+        os.sep, "/"
+    )
+
+
+def stable_cell_id(key, index, cell_type, source):
+    """Derive a cell id from the lesson, the cell's position and content"""
+    payload = "\0".join((key, str(index), cell_type, source))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:8]
+
+
+def make_cells(cells, key=None):
+    """Yield nbformat cells for (cell_type, source) pairs
+
+    With a ``key`` the cell ids are derived by ``stable_cell_id``, so an
+    unchanged lesson always serializes to the same bytes; without one
+    nbformat assigns random ids.
+    """
+    for index, (cell_type, source) in enumerate(cells):
+        if cell_type == "code":
+            cell = nbf.v4.new_code_cell(source)
+        else:
+            cell = nbf.v4.new_markdown_cell(source)
+        if key is not None:
+            cell["id"] = stable_cell_id(key, index, cell_type, source)
+        yield cell
+
+
+def compile_lesson(path, cache_dir=CACHE_DIR, stable_ids=True):
+    """Compile a lesson spec into an nbformat v4 notebook"""
+    nb = nbf.v4.new_notebook(metadata=notebook_metadata(path))
+    key = lesson_key(path) if stable_ids else None
+    nb.cells.extend(make_cells(load_cells(path, cache_dir), key))
+    return nb
@@ -0,0 +1,192 @@
+"""Load-test a support-agent workload against an OpenAI-compatible endpoint.
+
+Without ``--base-url`` a local ``MockLLMServer`` is started with the
+given latency distribution, token rate, error rate and rate limit, so
+the run needs no network access or API key. Each request leases an
+agent from an ``AgentPool`` and runs one ticket through it (``--loops``
+model calls). ``--client openai`` uses the lessons' ``OpenAIChat``
+(langchain, with the openai client's own retries) on threads;
+``--client async`` uses ``OpenAICompatibleChat`` with ``arun_agent`` on
+one event loop. The report gives throughput and p50/p95/p99 latency.
+
+    python scripts/load_test.py [--client openai|async] [--concurrency N]
+        [--requests N | --duration SECONDS] [--rate RPS]
+        [--latency lognormal:0.3:0.5] [--tokens-per-second N]
+        [--error-rate P] [--rate-limit RPS] [--base-url URL]
+        [--report report.json]
+"""
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import io
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from swarms_course.async_agents import (  # noqa: E402
+    OpenAICompatibleChat,
+    aclose_shared_session,
+    arun_agent,
+)
+from swarms_course.load import aload_test, load_test  # noqa: E402
+from swarms_course.mock_server import MockLLMServer  # noqa: E402
+from swarms_course.pool import AgentPool  # noqa: E402
+
+TICKETS = [
+    "My invoice shows the wrong amount for March",
+    "How do I add a new user to our enterprise account?",
+    "The export to CSV has been failing since yesterday",
+    "Can we move to annual billing and keep our discount?",
+    "Our SSO login redirects back to the sign-in page",
+]
+
+SUPPORT_PROMPT = (
+    "You are a customer support agent for an enterprise SaaS product."
+    " Answer clearly and list next steps."
+)
+
+
+def answered(response):
+    """``response``, or an error if the agent gave up on every attempt
+
+    ``Agent.run`` and ``arun_agent`` log a model call that still fails
+    after the agent's retries and stop without raising.
+    """
+    if not response:
+        raise RuntimeError("no response after the agent's retries")
+    return response
+
+
+def run(args, base_url):
+    from swarms import Agent
+
+    # Agent.run reports to swarms.world on every call; keep that
+    # network round trip out of the measurements
+    Agent.log_agent_data = lambda self, *a, **k: None
+    config = dict(
+        agent_name="support-agent",
+        system_prompt=SUPPORT_PROMPT,
+        max_loops=args.loops,
+    )
+    options = dict(
+        concurrency=args.concurrency,
+        rate=args.rate,
+        requests=None if args.duration else args.requests,
+        duration=args.duration,
+        timeout=args.timeout,
+    )
+    if args.client == "openai":
+        from swarm_models import OpenAIChat
+
+        llm = OpenAIChat(
+            openai_api_base=base_url,
+            openai_api_key=args.api_key,
+            model_name=args.model,
+        )
+        pool = AgentPool(llm=llm, max_idle=args.concurrency)
+        return load_test(
+            lambda ticket: answered(pool.run(ticket, **config)),
+            TICKETS,
+            **options,
+        )
+
+    llm = OpenAICompatibleChat(
+        model_name=args.model, api_key=args.api_key, base_url=base_url
+    )
+    pool = AgentPool(llm=llm, max_idle=args.concurrency)
+
+    async def handle(ticket):
+        with pool.lease(**config) as agent:
+            return answered(await arun_agent(agent, ticket))
+
+    async def main():
+        try:
+            return await aload_test(handle, TICKETS, **options)
+        finally:
+            await aclose_shared_session()
+
+    return asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--client", choices=("openai", "async"), default="async"
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--duration", type=float, help="run for this many seconds instead"
+    )
+    parser.add_argument(
+        "--rate", type=float, help="cap request starts per second"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--loops", type=int, default=1)
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument(
+        "--base-url", help="target this endpoint instead of a mock server"
+    )
+    parser.add_argument(
+        "--api-key", default=os.getenv("OPENAI_API_KEY", "load-test")
+    )
+    server_options = parser.add_argument_group("mock server")
+    server_options.add_argument(
+        "--latency",
+        default="lognormal:0.3:0.5",
+        help="seconds, or kind:seconds[:spread] with kind one of"
+        " fixed, uniform, exponential, lognormal",
+    )
+    server_options.add_argument("--tokens-per-second", type=float)
+    server_options.add_argument("--error-rate", type=float, default=0.0)
+    server_options.add_argument(
+        "--rate-limit", type=float, help="requests per second before 429s"
+    )
+    server_options.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="write a JSON report here")
+    args = parser.parse_args()
+
+    server = None
+    if args.base_url is None:
+        server = MockLLMServer(
+            latency=args.latency,
+            tokens_per_second=args.tokens_per_second,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+            seed=args.seed,
+        ).start()
+    try:
+        # Agents print every response; only the report is of interest
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = run(args, args.base_url or server.url)
+    finally:
+        if server is not None:
+            server.stop()
+
+    target = args.base_url or f"mock server ({args.latency})"
+    print(
+        f"{args.client} client, concurrency {args.concurrency},"
+        f" {args.loops} loop(s) per request against {target}"
+    )
+    print(report)
+    if server is not None:
+        print(f"server  {server}")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(
+                dict(
+                    dataclasses.asdict(report),
+                    throughput=report.throughput,
+                    error_rate=report.error_rate,
+                ),
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
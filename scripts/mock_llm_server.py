@@ -0,0 +1,67 @@
+"""Serve the mock OpenAI-compatible endpoint until interrupted.
+
+Point any OpenAI client at the printed URL, for example
+``OpenAIChat(openai_api_base="http://127.0.0.1:8000/v1",
+openai_api_key="test")``, to load-test it offline. Counters are printed
+on exit.
+
+    python scripts/mock_llm_server.py [--port 8000]
+        [--latency lognormal:0.3:0.5] [--tokens-per-second N]
+        [--error-rate P] [--rate-limit RPS]
+"""
+import argparse
+import os
+import sys
+import threading
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from swarms_course.mock_server import MockLLMServer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--latency",
+        default="0.3",
+        help="seconds, or kind:seconds[:spread] with kind one of"
+        " fixed, uniform, exponential, lognormal",
+    )
+    parser.add_argument("--tokens-per-second", type=float)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument(
+        "--rate-limit", type=float, help="requests per second before 429s"
+    )
+    parser.add_argument("--burst", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--model", default="mock-model")
+    args = parser.parse_args()
+
+    server = MockLLMServer(
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+        model_name=args.model,
+    ).start()
+    print(f"Serving {args.model} at {server.url} (Ctrl-C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Streaming notebook writer.
+
+``nbf.write`` needs the whole notebook as a NotebookNode tree and then
+builds the full JSON document as one string before writing it, so peak
+memory is roughly twice the notebook size. ``write_cells`` takes cells
+from any iterable and writes each one as soon as it is produced.
+
+The output follows nbformat's own JSON writer exactly (sorted keys,
+``indent=1``, sources split into lines, transient metadata stripped),
+so for text-only notebooks it is byte-identical to ``nbf.write``.
+"""
+import json
+
+import nbformat as nbf
+
+from lesson_spec import (
+    iter_cells,
+    lesson_key,
+    make_cells,
+    notebook_metadata,
+)
+
+_NON_TEXT_SPLIT_MIMES = {"application/javascript", "image/svg+xml"}
+_DUMP_KWARGS = {
+    "indent": 1,
+    "sort_keys": True,
+    "separators": (",", ": "),
+    "ensure_ascii": False,
+}
+# Cells sit two levels deep: {"cells": [<cell>, ...]}
+_CELL_INDENT = "  "
+
+
+def _split_mimebundle(bundle):
+    for key, value in bundle.items():
+        if isinstance(value, str) and (
+            key.startswith("text/") or key in _NON_TEXT_SPLIT_MIMES
+        ):
+            bundle[key] = value.splitlines(True)
+
+
+def _prepare_cell(cell):
+    """Copy a cell into its on-disk shape, as nbformat's split_lines does"""
+    cell = json.loads(json.dumps(cell))
+    if isinstance(cell.get("source"), str):
+        cell["source"] = cell["source"].splitlines(True)
+    cell.get("metadata", {}).pop("trusted", None)
+    for attachment in cell.get("attachments", {}).values():
+        _split_mimebundle(attachment)
+    for output in cell.get("outputs", ()):
+        if output.get("output_type") in ("execute_result", "display_data"):
+            _split_mimebundle(output.get("data", {}))
+        elif output.get("output_type") == "stream" and isinstance(
+            output.get("text"), str
+        ):
+            output["text"] = output["text"].splitlines(True)
+    return cell
+
+
+def write_cells(
+    cells,
+    fp,
+    metadata=None,
+    nbformat=nbf.v4.nbformat,
+    nbformat_minor=nbf.v4.nbformat_minor,
+):
+    """Write a v4 notebook to ``fp``, consuming ``cells`` one at a time
+
+    Returns the number of cells written.
+    """
+    count = 0
+    for cell in cells:
+        fp.write('{\n "cells": [\n' if count == 0 else ",\n")
+        text = json.dumps(_prepare_cell(cell), **_DUMP_KWARGS)
+        fp.write(
+            "\n".join(_CELL_INDENT + line for line in text.split("\n"))
+        )
+        count += 1
+    fp.write('{\n "cells": [],\n' if count == 0 else "\n ],\n")
+
+    tail = json.dumps(
+        {
+            "metadata": metadata or {},
+            "nbformat": nbformat,
+            "nbformat_minor": nbformat_minor,
+        },
+        **_DUMP_KWARGS,
+    )
+    # Drop the tail's opening brace; it continues the document above
+    fp.write(tail[2:])
+    fp.write("\n")
+    return count
+
+
+def stream_lesson(path, fp, stable_ids=True):
+    """Compile a lesson spec straight to ``fp`` without building a notebook"""
+    key = lesson_key(path) if stable_ids else None
+    return write_cells(
+        make_cells(iter_cells(path), key), fp, notebook_metadata(path)
+    )
@@ -0,0 +1,269 @@
+"""Execute the generated notebooks headlessly against a stub LLM.
+
+Every notebook runs in its own worker process (a fresh interpreter per
+notebook, several in parallel) through an IPython shell, so magics and
+indented lesson cells behave as they do in Jupyter. Before the first
+cell the worker swaps ``OpenAIChat``/``Anthropic`` for the deterministic
+``swarms_course.stub_llm.StubLLM``, answers ``input()`` prompts with
+``exit`` and turns shell escapes (``!pip install ...``) into no-ops, so
+no network access is needed.
+
+Wall time, time to first output and peak RSS are recorded per code
+cell. The run fails if any cell raises. With ``--stream`` each cell's
+output is also echoed as it is written, prefixed with the notebook
+name, so streamed agent output shows up live.
+
+    python scripts/run_notebooks.py [NOTEBOOK ...] [--jobs N] [--stream]
+        [--slow SECONDS] [--timeout SECONDS] [--report report.json]
+"""
+import argparse
+import builtins
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import types
+
+import nbformat as nbf
+
+from build_notebooks import REPO_ROOT, discover_lessons
+
+STUB_MODELS = {
+    "swarm_models": ("OpenAIChat", "Anthropic"),
+    "swarms.models": ("OpenAIChat", "Anthropic"),
+}
+
+
+def peak_rss_mib():
+    """Peak resident set size of this process so far"""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def install_stub_models():
+    """Point the lesson LLM imports at StubLLM"""
+    from swarms_course import stub_llm
+
+    # swarms imports swarm_models internally; load the real packages
+    # first so a placeholder module never shadows an installed one
+    with contextlib.suppress(ImportError):
+        swarms = importlib.import_module("swarms")
+        # Agent.run reports to swarms.world on every run; stay offline
+        swarms.Agent.log_agent_data = lambda self, *args, **kwargs: None
+
+    for module_name, names in STUB_MODELS.items():
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            parent, _, _ = module_name.rpartition(".")
+            if parent:
+                try:
+                    importlib.import_module(parent)
+                except ImportError:
+                    continue
+            module = types.ModuleType(module_name)
+            sys.modules[module_name] = module
+            if parent:
+                setattr(
+                    sys.modules[parent],
+                    module_name.rpartition(".")[2],
+                    module,
+                )
+        for name in names:
+            setattr(module, name, getattr(stub_llm, name))
+
+
+class CellOutput(io.StringIO):
+    """Captured cell output that notes its first write and can echo it"""
+
+    def __init__(self, echo_prefix=None):
+        super().__init__()
+        self.echo_prefix = echo_prefix
+        self.first_write = None
+        self._line_start = True
+
+    def write(self, text):
+        if text and self.first_write is None:
+            self.first_write = time.perf_counter()
+        if text and self.echo_prefix is not None:
+            out = sys.__stdout__
+            for piece in text.splitlines(keepends=True):
+                if self._line_start:
+                    out.write(self.echo_prefix)
+                out.write(piece)
+                self._line_start = piece.endswith("\n")
+            out.flush()
+        return super().write(text)
+
+
+def execute_notebook(path, echo=False):
+    """Run one notebook's code cells in this process and time each one"""
+    from IPython.core.interactiveshell import InteractiveShell
+
+    path = os.path.abspath(path)
+    nb = nbf.read(path, as_version=4)
+
+    workdir = tempfile.mkdtemp(prefix="notebook-run-")
+    os.chdir(workdir)
+    os.environ["WORKSPACE_DIR"] = workdir
+    sys.path.insert(0, REPO_ROOT)
+    install_stub_models()
+    builtins.input = lambda prompt="": "exit"
+
+    shell = InteractiveShell.instance(colors="NoColor")
+    skipped_commands = []
+    shell.system = skipped_commands.append
+
+    cells = []
+    for index, cell in enumerate(nb.cells):
+        if cell.cell_type != "code":
+            continue
+        output = CellOutput(
+            f"[{os.path.basename(path)}:{index}] " if echo else None
+        )
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(
+            output
+        ):
+            result = shell.run_cell(cell.source, store_history=False)
+        error = result.error_before_exec or result.error_in_exec
+        cells.append(
+            {
+                "index": index,
+                "seconds": time.perf_counter() - start,
+                "first_output_seconds": (
+                    None
+                    if output.first_write is None
+                    else output.first_write - start
+                ),
+                "peak_rss_mib": peak_rss_mib(),
+                "error": None if error is None else repr(error),
+                "output": output.getvalue() if error else "",
+            }
+        )
+        if error is not None:
+            break
+
+    return {
+        "notebook": path,
+        "ok": all(cell["error"] is None for cell in cells),
+        "cells": cells,
+        "skipped_commands": skipped_commands,
+    }
+
+
+def run_notebooks(paths, jobs=None, timeout=None, echo=False):
+    """Execute notebooks in parallel and return results in input order"""
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with context.Pool(processes=jobs, maxtasksperchild=1) as pool:
+        pending = [
+            (path, pool.apply_async(execute_notebook, (path, echo)))
+            for path in paths
+        ]
+        for path, job in pending:
+            try:
+                results.append(job.get(timeout=timeout))
+            except multiprocessing.TimeoutError:
+                results.append(
+                    {
+                        "notebook": os.path.abspath(path),
+                        "ok": False,
+                        "cells": [],
+                        "skipped_commands": [],
+                        "error": f"timed out after {timeout}s",
+                    }
+                )
+        pool.terminate()
+    return results
+
+
+def print_report(results, slow):
+    for result in results:
+        status = "ok" if result["ok"] else "FAILED"
+        print(f"{os.path.relpath(result['notebook'])}: {status}")
+        if result.get("error"):
+            print(f"  {result['error']}")
+        for cell in result["cells"]:
+            flags = []
+            if cell["seconds"] >= slow:
+                flags.append("SLOW")
+            if cell["error"]:
+                flags.append("ERROR")
+            first = cell.get("first_output_seconds")
+            first = "-" if first is None else f"{first * 1000:.1f}"
+            print(
+                f"  cell {cell['index']:>3}  {cell['seconds'] * 1000:9.1f} ms"
+                f"  first output {first:>9} ms"
+                f"  {cell['peak_rss_mib']:7.1f} MiB  {' '.join(flags)}"
+            )
+            if cell["error"]:
+                print(cell["output"].rstrip())
+                print(f"  {cell['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Execute notebooks headlessly against a stub LLM"
+    )
+    parser.add_argument(
+        "notebooks",
+        nargs="*",
+        help="notebooks to run (default: every generated notebook)",
+    )
+    parser.add_argument(
+        "--notebooks-dir",
+        default="notebooks",
+        help="where the generated notebooks were written",
+    )
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument(
+        "--slow",
+        type=float,
+        default=5.0,
+        help="flag cells slower than this many seconds",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600.0,
+        help="give up on a notebook after this many seconds",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="echo cell output live as the notebooks run",
+    )
+    parser.add_argument("--report", help="write a JSON report here")
+    args = parser.parse_args()
+
+    paths = args.notebooks or [
+        os.path.join(args.notebooks_dir, filename)
+        for _, filename in discover_lessons()
+    ]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        parser.error(
+            "missing notebooks (run scripts/build_notebooks.py first): "
+            + ", ".join(missing)
+        )
+
+    results = run_notebooks(paths, args.jobs, args.timeout, args.stream)
+    print_report(results, args.slow)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=1)
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1 @@
-find ./tests -name '*.py' -exec pytest {} \;
\ No newline at end of file
+python -m pytest tests "$@"
@@ -0,0 +1,148 @@
+"""Helpers used by the Enterprise Agent Development course notebooks."""
+from swarms_course.async_agents import (
+    OpenAICompatibleChat,
+    aclose_shared_session,
+    arun_agent,
+)
+from swarms_course.batch import BatchResult, arun_batch, run_batch
+from swarms_course.cache import (
+    CachedLLM,
+    CacheStats,
+    ResponseCache,
+    cache_responses,
+)
+from swarms_course.checkpoint import (
+    Checkpoint,
+    CheckpointLog,
+    CheckpointStats,
+    aresume,
+    checkpoint,
+    restore,
+    resume,
+)
+from swarms_course.coalesce import (
+    CoalesceStats,
+    CoalescingLLM,
+    SingleFlight,
+    coalesce_calls,
+)
+from swarms_course.conversation import CompactConversation, compact_memory
+from swarms_course.memory import BoundedMemory, bound_memory, llm_summarizer
+from swarms_course.load import LoadReport, aload_test, load_test
+from swarms_course.mock_server import MockLLMServer, latency_distribution
+from swarms_course.pool import AgentPool, PoolStats
+from swarms_course.prompts import PromptTemplate, compile_prompt
+from swarms_course.ratelimit import (
+    FileState,
+    LimiterStats,
+    RateLimitedLLM,
+    RateLimiter,
+    rate_limit,
+)
+from swarms_course.resilience import (
+    Backoff,
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilienceStats,
+    ResilientLLM,
+    resilient,
+)
+from swarms_course.routing import (
+    Backend,
+    BackendStats,
+    ModelRouter,
+    RouterStats,
+)
+from swarms_course.streaming import (
+    AgentStream,
+    StreamEvent,
+    StreamStats,
+    print_stream,
+    stream_run,
+)
+from swarms_course.stub_llm import StubLLM
+from swarms_course.sweep import SweepReport, SweepResult, expand_grid, sweep
+from swarms_course.tokens import TokenCounter, track_tokens
+from swarms_course.tracing import (
+    JSONLExporter,
+    OTLPJSONExporter,
+    Span,
+    SpanCollector,
+    TraceSummary,
+    Tracer,
+    instrument,
+)
+from swarms_course.vector_memory import VectorMemory
+
+__all__ = [
+    "AgentPool",
+    "AgentStream",
+    "Backend",
+    "BackendStats",
+    "Backoff",
+    "BatchResult",
+    "BoundedMemory",
+    "CacheStats",
+    "CachedLLM",
+    "Checkpoint",
+    "CheckpointLog",
+    "CheckpointStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CoalesceStats",
+    "CoalescingLLM",
+    "CompactConversation",
+    "FileState",
+    "JSONLExporter",
+    "LimiterStats",
+    "LoadReport",
+    "MockLLMServer",
+    "ModelRouter",
+    "OTLPJSONExporter",
+    "OpenAICompatibleChat",
+    "PoolStats",
+    "PromptTemplate",
+    "RateLimitedLLM",
+    "RateLimiter",
+    "ResilienceStats",
+    "ResilientLLM",
+    "ResponseCache",
+    "RouterStats",
+    "SingleFlight",
+    "Span",
+    "SpanCollector",
+    "StreamEvent",
+    "StreamStats",
+    "StubLLM",
+    "SweepReport",
+    "SweepResult",
+    "TokenCounter",
+    "TraceSummary",
+    "Tracer",
+    "VectorMemory",
+    "aclose_shared_session",
+    "aload_test",
+    "aresume",
+    "arun_agent",
+    "arun_batch",
+    "bound_memory",
+    "cache_responses",
+    "checkpoint",
+    "coalesce_calls",
+    "compact_memory",
+    "compile_prompt",
+    "expand_grid",
+    "instrument",
+    "latency_distribution",
+    "llm_summarizer",
+    "load_test",
+    "print_stream",
+    "rate_limit",
+    "resilient",
+    "restore",
+    "resume",
+    "run_batch",
+    "stream_run",
+    "sweep",
+    "track_tokens",
+]
@@ -0,0 +1,310 @@
+"""Run many agents concurrently on one event loop.
+
+``Agent.run`` blocks, so running agents side by side has meant a thread
+per agent. ``arun_agent`` drives a swarms ``Agent``'s loop as a
+coroutine instead: it adds the task to the agent's memory, renders the
+history, awaits the model and records the response for each loop, just
+as ``run`` does. Hundreds of agents can then wait on their models at
+once from a single thread.
+
+    llm = OpenAICompatibleChat(model_name="gpt-4o-mini")
+    agents = [Agent(llm=llm, agent_name=f"support-{i}") for i in range(200)]
+    responses = await asyncio.gather(
+        *(arun_agent(agent, ticket) for agent, ticket in zip(agents, tickets))
+    )
+
+The model is awaited through its ``arun`` coroutine (``StubLLM``,
+``OpenAICompatibleChat``) or langchain's ``ainvoke`` (``OpenAIChat``).
+Models with neither, and agents using features this path does not cover
+(tools, planning, interactive mode, evaluators, prompt generation,
+artifacts, ``max_loops="auto"``), fall back to running ``agent.run`` on
+a worker thread.
+
+``OpenAICompatibleChat`` talks to any OpenAI-style ``/chat/completions``
+endpoint over shared keep-alive connection pools: one httpx client for
+synchronous calls, and one aiohttp session per event loop for ``arun``.
+(httpcore's async pool scans every connection for each request, which
+dominates once hundreds of requests are in flight.)
+"""
+import asyncio
+import inspect
+import os
+import threading
+import weakref
+from typing import Any, Optional
+
+import aiohttp
+import httpx
+from loguru import logger
+
+MAX_CONNECTIONS = 512
+MAX_KEEPALIVE = 128
+
+_sync_client = None
+_async_sessions = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def shared_client() -> httpx.Client:
+    """Process-wide pooled client for synchronous calls"""
+    global _sync_client
+    with _clients_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE,
+                ),
+                timeout=None,
+            )
+        return _sync_client
+
+
+def shared_session() -> aiohttp.ClientSession:
+    """Pooled session for the running event loop
+
+    Connections belong to the loop that opened them, so each loop gets
+    its own session. Close it with ``aclose_shared_session`` before the
+    loop ends.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        session = _async_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS
+                )
+            )
+            _async_sessions[loop] = session
+        return session
+
+
+async def aclose_shared_session():
+    """Close the running loop's pooled session"""
+    with _clients_lock:
+        session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+class OpenAICompatibleChat:
+    """Chat completions over pooled HTTP, callable sync or async
+
+    Args:
+        model_name (str): Model to request.
+        api_key (str): Bearer token; defaults to ``OPENAI_API_KEY``.
+        base_url (str): API root; defaults to ``OPENAI_BASE_URL`` or
+            the OpenAI API.
+        temperature (float): Sampling temperature.
+        max_tokens (int): Completion limit, or None for the default.
+        timeout (float): Seconds to wait for each response.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "gpt-4o-mini",
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        temperature: float = 0.5,
+        max_tokens: Optional[int] = None,
+        timeout: float = 60.0,
+        *args,
+        **kwargs,
+    ):
+        self.model_name = model_name
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        self.base_url = (
+            base_url
+            or os.getenv("OPENAI_BASE_URL")
+            or "https://api.openai.com/v1"
+        ).rstrip("/")
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+
+    @property
+    def url(self):
+        return f"{self.base_url}/chat/completions"
+
+    def _payload(self, task):
+        payload = {
+            "model": self.model_name,
+            "messages": [{"role": "user", "content": str(task)}],
+            "temperature": self.temperature,
+        }
+        if self.max_tokens is not None:
+            payload["max_tokens"] = self.max_tokens
+        return payload
+
+    def _headers(self):
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    @staticmethod
+    def _content(body):
+        return body["choices"][0]["message"]["content"]
+
+    def run(self, task, *args, **kwargs) -> str:
+        """Completion for ``task``, blocking the calling thread"""
+        response = shared_client().post(
+            self.url,
+            json=self._payload(task),
+            headers=self._headers(),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return self._content(response.json())
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs) -> str:
+        """Completion for ``task`` without blocking the event loop"""
+        async with shared_session().post(
+            self.url,
+            json=self._payload(task),
+            headers=self._headers(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as response:
+            response.raise_for_status()
+            return self._content(await response.json())
+
+
+def async_call(llm):
+    """``await call(prompt)`` for ``llm``, using a thread only if needed"""
+    arun = getattr(llm, "arun", None)
+    if inspect.iscoroutinefunction(arun):
+        return arun
+    ainvoke = getattr(llm, "ainvoke", None)
+    if inspect.iscoroutinefunction(ainvoke):
+
+        async def invoke(prompt, *args, **kwargs):
+            message = await ainvoke(prompt, *args, **kwargs)
+            return getattr(message, "content", message)
+
+        return invoke
+    return lambda prompt, *args, **kwargs: asyncio.to_thread(
+        llm, prompt, *args, **kwargs
+    )
+
+
+def _needs_thread(agent):
+    """True if ``agent`` uses features only ``Agent.run`` implements"""
+    return (
+        agent.max_loops == "auto"
+        or getattr(agent, "output_type", "str")
+        not in ("str", "string", "list")
+        or bool(getattr(agent, "tools", None))
+        or getattr(agent, "interactive", False)
+        or getattr(agent, "plan_enabled", False)
+        or getattr(agent, "auto_generate_prompt", False)
+        or getattr(agent, "artifacts_on", False)
+        or getattr(agent, "evaluator", None) is not None
+        or getattr(agent, "sentiment_analyzer", None) is not None
+        or getattr(agent, "output_cleaner", None) is not None
+        or getattr(agent, "loop_interval", 0)
+    )
+
+
+async def arun_agent(agent: Any, task: str, *args, **kwargs):
+    """Run a swarms ``Agent`` on ``task`` as a coroutine
+
+    Returns what ``agent.run`` would for ``output_type`` ``"str"`` (all
+    loop responses joined) or ``"list"``. As in ``run``, a model call is
+    tried ``agent.retry_attempts`` times, and if every attempt fails the
+    error is logged and the run stops with the responses so far. Agents
+    passed to ``tracing.instrument`` emit the same spans as ``run``, and
+    agents passed to ``checkpoint`` commit the same checkpoints.
+    """
+    from swarms_course.tracing import tracing_of
+
+    if _needs_thread(agent):
+        return await asyncio.to_thread(agent.run, task, *args, **kwargs)
+    tracing = tracing_of(agent)
+    if tracing is None:
+        return await _arun(agent, None, task, *args, **kwargs)
+    span, token = tracing.start_run(task)
+    try:
+        result = await _arun(agent, tracing, task, *args, **kwargs)
+    except BaseException as error:
+        tracing.end_run(span, token, error)
+        raise
+    tracing.end_run(span, token)
+    return result
+
+
+async def _arun(agent, tracing, task, *args, first_loop=0, **kwargs):
+    """The loops of ``Agent.run``; from ``first_loop`` when resuming"""
+    from swarms_course.checkpoint import (
+        checkpoint_of,
+        loop_started,
+        run_finished,
+    )
+
+    call = async_call(agent.llm)
+    if tracing is not None:
+        call = tracing.trace_async(call)
+    log = checkpoint_of(agent)
+    memory = agent.short_memory
+    if not first_loop:
+        agent.agent_output.task = task
+        memory.add(role=agent.user_name, content=task)
+        if agent.long_term_memory is not None:
+            agent.memory_query(task)
+        if log is not None:
+            log.start_run(task, agent.max_loops)
+    attempts = max(1, agent.retry_attempts or 1)
+    responses = []
+    loops = first_loop
+    for loop in range(first_loop, agent.max_loops):
+        if tracing is not None:
+            tracing.loop(loop + 1)
+        if log is not None:
+            loop_started(log, loop + 1)
+        if agent.dynamic_temperature_enabled:
+            agent.dynamic_temperature()
+        prompt = memory.return_history_as_string()
+        response = None
+        for attempt in range(attempts):
+            try:
+                if (
+                    agent.long_term_memory is not None
+                    and agent.rag_every_loop
+                ):
+                    agent.memory_query(prompt)
+                response = agent.llm_output_parser(
+                    await call(prompt, *args, **kwargs)
+                )
+                break
+            except Exception as error:
+                logger.error(
+                    f"Attempt {attempt + 1}: Error generating"
+                    f" response: {error}"
+                )
+        else:
+            logger.error(
+                "Failed to generate a valid response after retry attempts."
+            )
+            break
+        memory.add(role=agent.agent_name, content=response)
+        responses.append(response)
+        loops = loop + 1
+        if (
+            agent.stopping_condition is not None
+            and agent._check_stopping_condition(response)
+        ) or (
+            agent.stopping_func is not None
+            and agent.stopping_func(response)
+        ):
+            break
+    if log is not None:
+        run_finished(log, loops)
+    if agent.autosave:
+        await asyncio.to_thread(agent.save_state)
+    agent.agent_output.steps = memory.to_dict()
+    agent.agent_output.full_history = memory.get_str()
+    agent.agent_output.total_tokens = agent.tokenizer.count_tokens(
+        agent.agent_output.full_history
+    )
+    if agent.output_type == "list":
+        return responses
+    return "".join(responses)
@@ -0,0 +1,229 @@
+"""Run many tasks through an agent with bounded concurrency.
+
+``run_batch`` (threads) and ``arun_batch`` (asyncio) pull tasks lazily
+from an iterable, or an async iterable for ``arun_batch``. They keep at
+most ``max_concurrency`` runs in flight and optionally cap how many
+runs start per second. Results are yielded in completion order as soon
+as each run finishes, so a queue of thousands of tasks never has to be
+materialised up front.
+
+    for result in run_batch(agent, tasks, max_concurrency=8, timeout=60):
+        print(result.index, result.response if result.ok else result.error)
+
+A run that exceeds ``timeout`` is reported as a ``TimeoutError``. Python
+cannot interrupt a blocking call, so the underlying request keeps its
+worker thread, and its concurrency slot, until it returns.
+"""
+import asyncio
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from swarms_course.ratelimit import RateLimiter
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one task; ``index`` is its position in the input"""
+
+    index: int
+    task: Any
+    response: Any = None
+    error: Optional[BaseException] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _limiter(rate_limit):
+    """``rate_limit`` as a ``RateLimiter`` spacing run starts, or None"""
+    if not rate_limit or isinstance(rate_limit, RateLimiter):
+        return rate_limit or None
+    return RateLimiter(requests_per_second=rate_limit, burst=1)
+
+
+def _callable(agent):
+    return agent.run if hasattr(agent, "run") else agent
+
+
+def _timed(call, task):
+    start = time.perf_counter()
+    response = call(task)
+    return response, time.perf_counter() - start
+
+
+def run_batch(
+    agent,
+    tasks,
+    max_concurrency: int = 8,
+    rate_limit: Union[float, RateLimiter, None] = None,
+    timeout: Optional[float] = None,
+):
+    """Yield a ``BatchResult`` per task as the runs complete
+
+    Args:
+        agent: Anything with a ``run(task)`` method, or a plain callable.
+        tasks: Iterable of tasks, consumed lazily.
+        max_concurrency (int): Maximum runs in flight.
+        rate_limit: Maximum run starts per second, or a
+            ``RateLimiter`` shared with other batches.
+        timeout (float): Seconds before a run is reported as timed out.
+    """
+    call = _callable(agent)
+    limiter = _limiter(rate_limit)
+    source = enumerate(tasks)
+    pending = {}
+    # Timed-out runs whose threads are still busy; they hold their slot
+    # so a new task never queues behind them with its clock running
+    abandoned = set()
+    exhausted = False
+    pool = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def submit_next():
+        nonlocal exhausted
+        if len(pending) + len(abandoned) >= max_concurrency:
+            return False
+        item = next(source, None)
+        if item is None:
+            exhausted = True
+            return False
+        index, task = item
+        if limiter is not None:
+            limiter.acquire()
+        future = pool.submit(_timed, call, task)
+        pending[future] = (index, task, time.perf_counter())
+        return True
+
+    try:
+        while submit_next():
+            pass
+        while pending or (abandoned and not exhausted):
+            wait_for = None
+            if timeout is not None and pending:
+                oldest = min(start for _, _, start in pending.values())
+                wait_for = max(0.0, oldest + timeout - time.perf_counter())
+            done, _ = wait(
+                [*pending, *abandoned],
+                timeout=wait_for,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                if future in abandoned:
+                    abandoned.discard(future)
+                    continue
+                index, task, _ = pending.pop(future)
+                result = BatchResult(index=index, task=task)
+                try:
+                    result.response, result.seconds = future.result()
+                except Exception as error:
+                    result.error = error
+                yield result
+            if timeout is not None:
+                now = time.perf_counter()
+                for future, (index, task, start) in list(pending.items()):
+                    if now - start >= timeout:
+                        del pending[future]
+                        if not future.cancel():
+                            abandoned.add(future)
+                        yield BatchResult(
+                            index=index,
+                            task=task,
+                            error=TimeoutError(
+                                f"task {index} exceeded {timeout}s"
+                            ),
+                            seconds=now - start,
+                        )
+            while submit_next():
+                pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiter(tasks):
+    if hasattr(tasks, "__aiter__"):
+        async for task in tasks:
+            yield task
+    else:
+        for task in tasks:
+            yield task
+
+
+async def arun_batch(
+    agent,
+    tasks,
+    max_concurrency: int = 8,
+    rate_limit: Union[float, RateLimiter, None] = None,
+    timeout: Optional[float] = None,
+):
+    """Async counterpart of ``run_batch``; ``tasks`` may be an async iterable
+
+    Coroutine functions, and agents exposing an ``arun`` coroutine, are
+    awaited directly; anything else runs on a private thread pool sized
+    to ``max_concurrency``.
+    """
+    arun = agent if inspect.iscoroutinefunction(agent) else None
+    arun = arun or getattr(agent, "arun", None)
+    if not inspect.iscoroutinefunction(arun):
+        arun = None
+    call = _callable(agent)
+    limiter = _limiter(rate_limit)
+    loop = asyncio.get_running_loop()
+    pool = None if arun else ThreadPoolExecutor(max_workers=max_concurrency)
+    slots = asyncio.Semaphore(max_concurrency)
+    results = asyncio.Queue()
+
+    async def run_one(index, task):
+        result = BatchResult(index=index, task=task)
+        start = time.perf_counter()
+        try:
+            if arun is not None:
+                pending = arun(task)
+            else:
+                pending = loop.run_in_executor(pool, call, task)
+            result.response = await asyncio.wait_for(pending, timeout)
+        except asyncio.TimeoutError:
+            result.error = TimeoutError(f"task {index} exceeded {timeout}s")
+        except Exception as error:
+            result.error = error
+        result.seconds = time.perf_counter() - start
+        slots.release()
+        await results.put(result)
+
+    async def produce():
+        index = -1
+        async for task in _aiter(tasks):
+            index += 1
+            await slots.acquire()
+            if limiter is not None:
+                await limiter.aacquire()
+            task = asyncio.create_task(run_one(index, task))
+            running.add(task)
+            # Drop finished runs so a long stream does not keep them all
+            task.add_done_callback(running.discard)
+        return index + 1
+
+    running = set()
+    producer = asyncio.create_task(produce())
+    yielded = 0
+    try:
+        while True:
+            if producer.done() and yielded == producer.result():
+                break
+            getter = asyncio.ensure_future(results.get())
+            waiting = {getter} if producer.done() else {getter, producer}
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yielded += 1
+                yield getter.result()
+            else:
+                getter.cancel()
+    finally:
+        producer.cancel()
+        for task in list(running):
+            task.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,296 @@
+"""Opt-in response cache in front of an agent's LLM.
+
+Notebook runs send the same prompts again and again. ``CachedLLM``
+wraps any model an ``Agent`` accepts and serves repeated calls from a
+cache instead of calling the model. The key covers the model name, its
+current temperature and the full prompt; the prompt an agent sends
+already contains the system prompt and message history. Only calls at
+or below ``threshold`` temperature are cached, since higher temperatures
+are expected to vary; a model that does not expose its temperature is
+never cached.
+
+    llm = cache_responses(OpenAIChat(temperature=0), ".response_cache.sqlite")
+    agent = Agent(llm=llm, agent_name="support")
+    print(llm.stats)
+
+``ResponseCache`` has two tiers: an in-process LRU and, with a
+``path``, a SQLite file that survives restarts and can be shared by
+processes. Entries expire after ``ttl`` seconds.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    expires REAL
+)
+"""
+
+
+@dataclass
+class CacheStats:
+    """Lookups so far; ``saved_seconds`` is model time avoided by hits"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hits(self):
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.hits} hits ({self.memory_hits} memory,"
+            f" {self.disk_hits} disk), {self.misses} misses,"
+            f" {self.bypassed} bypassed; hit rate {self.hit_rate:.0%},"
+            f" saved {self.saved_seconds:.2f}s"
+        )
+
+
+class ResponseCache:
+    """LRU in memory, optionally backed by SQLite, with TTL expiry
+
+    Args:
+        path (str): SQLite file for the disk tier; None keeps the cache
+            in memory only.
+        max_entries (int): Size of the in-memory LRU.
+        ttl (float): Seconds an entry stays valid; None never expires.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 7 * 24 * 3600,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(
+                path, timeout=30, check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(SCHEMA)
+            self.purge()
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Stable digest of the JSON-encoded ``parts``"""
+        encoded = json.dumps(parts, sort_keys=True, default=repr)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Cached response for ``key``, or None; updates ``stats``"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and (entry[2] is None or entry[2] > now):
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                self.stats.saved_seconds += entry[1]
+                return entry[0]
+            self._memory.pop(key, None)
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, seconds, expires FROM responses"
+                    " WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                    (key, now),
+                ).fetchone()
+                if row is not None:
+                    entry = (json.loads(row[0]), row[1], row[2])
+                    self._remember(key, entry)
+                    self.stats.disk_hits += 1
+                    self.stats.saved_seconds += entry[1]
+                    return entry[0]
+            self.stats.misses += 1
+            return None
+
+    def put(self, key, response, seconds=0.0):
+        """Store ``response``, which took ``seconds`` to produce"""
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._remember(key, (response, seconds, expires))
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                        (key, json.dumps(response), seconds, expires),
+                    )
+
+    def purge(self):
+        """Drop expired entries from both tiers"""
+        now = time.time()
+        with self._lock:
+            for key in [
+                k
+                for k, (_, _, expires) in self._memory.items()
+                if expires is not None and expires <= now
+            ]:
+                del self._memory[key]
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "DELETE FROM responses WHERE expires <= ?", (now,)
+                    )
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM responses")
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class CachedLLM:
+    """Wrap ``llm`` so low-temperature calls are served from ``cache``
+
+    Exposes ``run`` and ``__call__`` like the models agents accept, and
+    forwards every other attribute (``temperature``, ``model_name``, ...)
+    to the wrapped model.
+
+    Args:
+        llm: The model to wrap.
+        cache (ResponseCache): Where responses are kept.
+        threshold (float): Highest temperature that is cached.
+    """
+
+    def __init__(
+        self, llm: Any, cache: ResponseCache, threshold: float = 0.0
+    ):
+        self.__dict__["llm"] = llm
+        self.__dict__["cache"] = cache
+        self.__dict__["threshold"] = threshold
+
+    @property
+    def stats(self):
+        return self.cache.stats
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def __setattr__(self, name, value):
+        # Agents set ``temperature`` on their model; pass it through
+        if name in self.__dict__:
+            self.__dict__[name] = value
+        else:
+            setattr(self.llm, name, value)
+
+    def _call(self, task, *args, **kwargs):
+        # Call the model the way ``Agent`` does, falling back to ``run``
+        if callable(self.llm):
+            return self.llm(task, *args, **kwargs)
+        return self.llm.run(task, *args, **kwargs)
+
+    def _key(self, task, args, kwargs):
+        """Cache key for a call, or None if it should bypass the cache"""
+        temperature = getattr(self.llm, "temperature", None)
+        # An unknown temperature may be the provider's default, above 0
+        if temperature is None or temperature > self.threshold:
+            with self.cache._lock:
+                self.cache.stats.bypassed += 1
+            return None
+        model = (
+            getattr(self.llm, "model_name", None) or type(self.llm).__name__
+        )
+        return self.cache.key(model, temperature, task, args, kwargs)
+
+    def run(self, task, *args, **kwargs):
+        key = self._key(task, args, kwargs)
+        if key is None:
+            return self._call(task, *args, **kwargs)
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+        start = time.perf_counter()
+        response = self._call(task, *args, **kwargs)
+        self.cache.put(key, response, time.perf_counter() - start)
+        return response
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs):
+        """``run`` as a coroutine, awaiting the model on a miss"""
+        from swarms_course.async_agents import async_call
+
+        key = self._key(task, args, kwargs)
+        call = async_call(self.llm)
+        if key is None:
+            return await call(task, *args, **kwargs)
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+        start = time.perf_counter()
+        response = await call(task, *args, **kwargs)
+        self.cache.put(key, response, time.perf_counter() - start)
+        return response
+
+    def stream(self, task, *args, **kwargs):
+        """Stream from the model, or replay a cached response in one chunk"""
+        from swarms_course.streaming import stream_chunks
+
+        key = self._key(task, args, kwargs)
+        if key is not None:
+            response = self.cache.get(key)
+            if response is not None:
+                yield response
+                return
+        start = time.perf_counter()
+        pieces = []
+        for chunk in stream_chunks(self.llm, task, *args, **kwargs):
+            pieces.append(chunk)
+            yield chunk
+        if key is not None:
+            self.cache.put(
+                key, "".join(pieces), time.perf_counter() - start
+            )
+
+
+def cache_responses(
+    llm,
+    path: Optional[str] = None,
+    threshold: float = 0.0,
+    max_entries: int = 1024,
+    ttl: Optional[float] = 7 * 24 * 3600,
+) -> CachedLLM:
+    """Wrap ``llm`` in a ``CachedLLM`` with a fresh ``ResponseCache``"""
+    return CachedLLM(
+        llm,
+        ResponseCache(path, max_entries=max_entries, ttl=ttl),
+        threshold=threshold,
+    )
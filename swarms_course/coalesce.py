@@ -0,0 +1,296 @@
+"""Share one model call between identical requests that are in flight.
+
+When many users run the same lesson or production prompt at once, the
+identical requests (same model, temperature and full prompt, which
+includes the system prompt and input) all go to the provider. A
+response cache does not help while it is cold: every request misses
+before the first one has returned. ``CoalescingLLM`` sends the first
+request upstream and makes the identical ones that arrive while it is
+running wait for it and share its response or its error. As with the
+response cache, only calls at or below ``threshold`` temperature (0 by
+default) are coalesced, since higher temperatures are expected to
+vary, and a model without a ``temperature`` is not coalesced; pass
+``threshold=None`` to coalesce every call.
+
+    llm = coalesce_calls(OpenAIChat(temperature=0))
+    agent = Agent(llm=llm, agent_name="support")
+    print(llm.stats)
+
+Put it under a cache so concurrent misses coalesce and later requests
+hit the cache: ``cache_responses(coalesce_calls(llm))``. Once a call
+has returned, the next identical request goes upstream again; nothing
+is kept.
+
+``stream`` coalesces too: the first caller streams as usual, and the
+identical calls waiting on it get its whole response as one chunk, as
+a cache hit does.
+"""
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from swarms_course.cache import ResponseCache
+
+
+@dataclass
+class CoalesceStats:
+    """Requests seen, calls sent upstream and requests that shared one"""
+
+    calls: int = 0
+    upstream: int = 0
+    coalesced: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def coalesced_rate(self):
+        return self.coalesced / self.calls if self.calls else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.calls} calls, {self.upstream} sent upstream,"
+            f" {self.coalesced} coalesced ({self.coalesced_rate:.0%}),"
+            f" saved {self.saved_seconds:.2f}s"
+        )
+
+
+class _Flight:
+    """One upstream call and the callers waiting on it"""
+
+    __slots__ = (
+        "done",
+        "future",
+        "response",
+        "error",
+        "followers",
+        "owner",
+    )
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.owner = threading.get_ident()
+        self.future = None
+        self.response = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; callers share its outcome
+
+    ``do`` serves threads, ``stream`` streamed calls on threads and
+    ``ado`` coroutines; coroutines only share calls with others on the
+    same event loop.
+    """
+
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._flights = {}
+        self._async_flights = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _join(self, flights, key, threaded=False):
+        """The flight for ``key`` and whether the caller leads it
+
+        With ``threaded``, a flight led from the caller's own thread is
+        not joined, since waiting on it would deadlock: the flight is
+        None and the caller is not its leader.
+        """
+        with self._lock:
+            self.stats.calls += 1
+            flight = flights.get(key)
+            if flight is None:
+                flight = flights[key] = _Flight()
+                return flight, True
+            if threaded and flight.owner == threading.get_ident():
+                return None, False
+            flight.followers += 1
+            self.stats.coalesced += 1
+            return flight, False
+
+    def _land(self, flights, key, flight, seconds):
+        with self._lock:
+            del flights[key]
+            self.stats.upstream += 1
+            self.stats.saved_seconds += seconds * flight.followers
+
+    def do(self, key: str, fn, *args, **kwargs):
+        """``fn(*args, **kwargs)``, or the result of the same key in flight"""
+        flight, leader = self._join(self._flights, key)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        start = time.perf_counter()
+        try:
+            flight.response = fn(*args, **kwargs)
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            self._land(
+                self._flights, key, flight, time.perf_counter() - start
+            )
+            flight.done.set()
+        return flight.response
+
+    def stream(self, key: str, chunks):
+        """Yield from ``chunks()``, or the joined text of the same key
+
+        Callers waiting on a stream that is abandoned before its end,
+        or led from their own thread (where waiting would deadlock),
+        stream for themselves.
+        """
+        flight, leader = self._join(self._flights, key, threaded=True)
+        if not leader:
+            if flight is not None:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                if flight.response is not None:
+                    yield flight.response
+                    return
+            yield from chunks()
+            return
+        start = time.perf_counter()
+        pieces = []
+        try:
+            for chunk in chunks():
+                pieces.append(chunk)
+                yield chunk
+            flight.response = "".join(pieces)
+        except GeneratorExit:
+            raise
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            self._land(
+                self._flights, key, flight, time.perf_counter() - start
+            )
+            flight.done.set()
+
+    async def ado(self, key: str, factory):
+        """Await ``factory()``, or the call for the same key in flight
+
+        The shared call runs as its own task, so one caller being
+        cancelled does not cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flights = self._async_flights.setdefault(loop, {})
+        flight, leader = self._join(flights, key)
+        if leader:
+            flight.future = loop.create_task(
+                self._lead(flights, key, flight, factory)
+            )
+        return await asyncio.shield(flight.future)
+
+    async def _lead(self, flights, key, flight, factory):
+        start = time.perf_counter()
+        try:
+            return await factory()
+        finally:
+            self._land(flights, key, flight, time.perf_counter() - start)
+
+
+class CoalescingLLM:
+    """Wrap ``llm`` so identical concurrent calls share one upstream call
+
+    Exposes ``run``, ``__call__``, ``arun`` and ``stream`` like the
+    models agents accept, and forwards every other attribute to the
+    wrapped model.
+
+    Args:
+        llm: The model to wrap.
+        flight (SingleFlight): Where calls in flight are tracked; pass
+            one to several wrappers to coalesce across them.
+        threshold (float): Highest temperature that is coalesced, as
+            for ``CachedLLM``; None coalesces every call. Above it,
+            identical requests are expected to differ and each goes
+            upstream.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        flight: Optional[SingleFlight] = None,
+        threshold: Optional[float] = 0.0,
+    ):
+        self.__dict__["llm"] = llm
+        self.__dict__["flight"] = flight or SingleFlight()
+        self.__dict__["threshold"] = threshold
+
+    @property
+    def stats(self) -> CoalesceStats:
+        with self.flight._lock:
+            return CoalesceStats(**vars(self.flight.stats))
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def __setattr__(self, name, value):
+        # Agents set ``temperature`` on their model; pass it through
+        if name in self.__dict__:
+            self.__dict__[name] = value
+        else:
+            setattr(self.llm, name, value)
+
+    def _call(self, task, *args, **kwargs):
+        if callable(self.llm):
+            return self.llm(task, *args, **kwargs)
+        return self.llm.run(task, *args, **kwargs)
+
+    def _key(self, task, args, kwargs):
+        """Key identifying identical calls, or None to never coalesce"""
+        temperature = getattr(self.llm, "temperature", None)
+        if self.threshold is not None and (
+            temperature is None or temperature > self.threshold
+        ):
+            return None
+        model = (
+            getattr(self.llm, "model_name", None) or type(self.llm).__name__
+        )
+        return ResponseCache.key(model, temperature, task, args, kwargs)
+
+    def run(self, task, *args, **kwargs):
+        key = self._key(task, args, kwargs)
+        if key is None:
+            return self._call(task, *args, **kwargs)
+        return self.flight.do(key, self._call, task, *args, **kwargs)
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs):
+        """``run`` as a coroutine, sharing calls within the event loop"""
+        from swarms_course.async_agents import async_call
+
+        call = async_call(self.llm)
+        key = self._key(task, args, kwargs)
+        if key is None:
+            return await call(task, *args, **kwargs)
+        return await self.flight.ado(
+            key, lambda: call(task, *args, **kwargs)
+        )
+
+    def stream(self, task, *args, **kwargs):
+        """Stream from the model, sharing identical streams in flight"""
+        from swarms_course.streaming import stream_chunks
+
+        def chunks():
+            return stream_chunks(self.llm, task, *args, **kwargs)
+
+        key = self._key(task, args, kwargs)
+        if key is None:
+            return chunks()
+        return self.flight.stream(key, chunks)
+
+
+def coalesce_calls(
+    llm, threshold: Optional[float] = 0.0
+) -> CoalescingLLM:
+    """Wrap ``llm`` in a ``CoalescingLLM`` with its own ``SingleFlight``"""
+    return CoalescingLLM(llm, threshold=threshold)
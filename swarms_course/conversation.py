@@ -0,0 +1,331 @@
+"""Compact conversation store with an incrementally rendered history.
+
+swarms' ``Conversation`` keeps each message as a dict with a formatted
+timestamp string, and ``return_history_as_string`` re-formats and
+re-joins every message each time it is called, which an agent does
+several times per loop. ``CompactConversation`` is a drop-in
+replacement that stores ``__slots__`` records with interned role names
+and a float timestamp. It keeps the rendered history as one contiguous
+string, extended with only the messages added since the last call, so
+rendering is amortized O(new messages) plus a copy of the result.
+
+    agent = Agent(llm=llm, agent_name="support")
+    compact_memory(agent)
+
+Records support ``message["role"]``-style access, so code written
+against dict messages keeps working. ``conversation_history`` is a list
+that reports in-place edits (``pop``, ``insert``, item assignment) back
+to the store, which re-renders only from the first changed message.
+"""
+import datetime
+import json
+import sys
+import time
+from array import array
+from collections import Counter
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Message:
+    """One conversation turn; ``time`` is epoch seconds or a timestamp string"""
+
+    __slots__ = ("role", "content", "time")
+
+    def __init__(self, role, content, time=None):
+        self.role = sys.intern(role) if isinstance(role, str) else role
+        self.content = content
+        self.time = time
+
+    @classmethod
+    def from_dict(cls, message):
+        return cls(
+            message["role"], message["content"], message.get("timestamp")
+        )
+
+    @property
+    def timestamp(self):
+        if isinstance(self.time, float):
+            return datetime.datetime.fromtimestamp(self.time).strftime(
+                TIMESTAMP_FORMAT
+            )
+        return self.time
+
+    def __getitem__(self, key):
+        if key == "role":
+            return self.role
+        if key == "content":
+            return self.content
+        if key == "timestamp" and self.time is not None:
+            return self.timestamp
+        raise KeyError(key)
+
+    def keys(self):
+        if self.time is None:
+            return ("role", "content")
+        return ("role", "content", "timestamp")
+
+    def __contains__(self, key):
+        return key in ("role", "content") or (
+            key == "timestamp" and self.time is not None
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        message = {"role": self.role, "content": self.content}
+        if self.time is not None:
+            message["timestamp"] = self.timestamp
+        return message
+
+    def __repr__(self):
+        return f"Message(role={self.role!r}, content={self.content!r})"
+
+
+def _start(index, length):
+    """First position a list edit at ``index`` touches"""
+    if isinstance(index, slice):
+        return index.indices(length)[0]
+    return index + length if index < 0 else index
+
+
+class MessageLog(list):
+    """List of messages that tells its owners about in-place edits
+
+    Each owner (the conversation, a ``TokenCounter``) has an
+    ``_invalidate(index)`` method, called before any edit that is not
+    an append with the first position it touches.
+    """
+
+    __slots__ = ("owners",)
+
+    def __init__(self, messages=(), owner=None):
+        super().__init__(messages)
+        self.owners = [] if owner is None else [owner]
+
+    def _changed(self, index=0):
+        for owner in self.owners:
+            owner._invalidate(max(0, index))
+
+    def insert(self, index, message):
+        self._changed(min(_start(index, len(self)), len(self)))
+        super().insert(index, message)
+
+    def pop(self, index=-1):
+        self._changed(_start(index, len(self)))
+        return super().pop(index)
+
+    def __setitem__(self, index, value):
+        self._changed(_start(index, len(self)))
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._changed(_start(index, len(self)))
+        super().__delitem__(index)
+
+    def remove(self, message):
+        self._changed(self.index(message))
+        super().remove(message)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._changed()
+        super().reverse()
+
+    def __imul__(self, count):
+        self._changed()
+        return super().__imul__(count)
+
+
+class CompactConversation:
+    """Drop-in for ``swarms.structs.conversation.Conversation``
+
+    Takes the same core arguments; ``system_prompt``, ``rules`` and
+    ``custom_rules_prompt`` are added as the first messages.
+    """
+
+    def __init__(
+        self,
+        system_prompt=None,
+        time_enabled: bool = False,
+        autosave: bool = False,
+        save_filepath: str = None,
+        rules: str = None,
+        custom_rules_prompt: str = None,
+        user: str = "User:",
+        *args,
+        **kwargs,
+    ):
+        self.system_prompt = system_prompt
+        self.time_enabled = time_enabled
+        self.autosave = autosave
+        self.save_filepath = save_filepath
+        self.rules = rules
+        self.custom_rules_prompt = custom_rules_prompt
+        self.user = user
+        self._text = ""
+        self._ends = array("Q")
+        self._rendered = 0
+        self.conversation_history = []
+        if system_prompt is not None:
+            self.add("System: ", system_prompt)
+        if rules is not None:
+            self.add("User", rules)
+        if custom_rules_prompt is not None:
+            self.add(user or "User", custom_rules_prompt)
+
+    @classmethod
+    def from_conversation(cls, conversation):
+        """Copy the messages and settings of an existing conversation"""
+        compact = cls(
+            time_enabled=getattr(conversation, "time_enabled", False),
+            autosave=getattr(conversation, "autosave", False),
+            save_filepath=getattr(conversation, "save_filepath", None),
+            user=getattr(conversation, "user", "User:"),
+        )
+        compact.system_prompt = getattr(conversation, "system_prompt", None)
+        compact.rules = getattr(conversation, "rules", None)
+        compact.conversation_history.extend(
+            m if isinstance(m, Message) else Message.from_dict(m)
+            for m in conversation.conversation_history
+        )
+        return compact
+
+    @property
+    def conversation_history(self):
+        return self._history
+
+    @conversation_history.setter
+    def conversation_history(self, messages):
+        self._history = MessageLog(messages, owner=self)
+        self._invalidate(0)
+
+    def _invalidate(self, index):
+        """Forget the rendering of message ``index`` and everything after"""
+        if index >= self._rendered:
+            return
+        self._text = self._text[: self._ends[index - 1]] if index else ""
+        del self._ends[index:]
+        self._rendered = index
+
+    def add(self, role: str, content, *args, **kwargs):
+        """Add a message to the conversation history"""
+        self._history.append(
+            Message(role, content, time.time() if self.time_enabled else None)
+        )
+        if self.autosave:
+            self.save_as_json(self.save_filepath)
+
+    def return_history_as_string(self):
+        """The history as ``"role: content"`` blocks, like ``Conversation``"""
+        history = self._history
+        if self._rendered < len(history):
+            position = len(self._text) + (1 if self._rendered else 0)
+            pieces = []
+            for message in history[self._rendered :]:
+                piece = f"{message['role']}: {message['content']}\n\n"
+                pieces.append(piece)
+                position += len(piece)
+                self._ends.append(position)
+                position += 1
+            chunk = "\n".join(pieces)
+            # Concatenating onto a local that holds the only reference
+            # lets CPython grow the string in place instead of copying it
+            text, self._text = self._text, ""
+            text += "\n" + chunk if self._rendered else chunk
+            self._text = text
+            self._rendered = len(history)
+        return self._text
+
+    def get_str(self):
+        return self.return_history_as_string()
+
+    def delete(self, index):
+        self._history.pop(index)
+
+    def update(self, index, role, content):
+        self._history[index] = Message(role, content)
+
+    def query(self, index):
+        return self._history[index]
+
+    def search(self, keyword: str):
+        return [m for m in self._history if keyword in m["content"]]
+
+    search_keyword_in_conversation = search
+
+    def count_messages_by_role(self):
+        return dict(Counter(m["role"] for m in self._history))
+
+    def display_conversation(self, detailed: bool = False):
+        for message in self._history:
+            print(f"{message['role']}: {message['content']}\n\n")
+
+    def export_conversation(self, filename: str, *args, **kwargs):
+        with open(filename, "w") as f:
+            for message in self._history:
+                f.write(f"{message['role']}: {message['content']}\n")
+
+    def import_conversation(self, filename: str):
+        with open(filename) as f:
+            for line in f:
+                role, content = line.split(": ", 1)
+                self.add(role, content.strip())
+
+    def to_dict(self):
+        return [
+            m.to_dict() if isinstance(m, Message) else m
+            for m in self._history
+        ]
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    def to_yaml(self):
+        import yaml
+
+        return yaml.dump(self.to_dict())
+
+    def save_as_json(self, filename: str = None):
+        if filename is not None:
+            with open(filename, "w") as f:
+                json.dump(self.to_dict(), f)
+
+    def load_from_json(self, filename: str):
+        if filename is not None:
+            with open(filename) as f:
+                self.conversation_history = [
+                    Message.from_dict(m) for m in json.load(f)
+                ]
+
+    def clear(self):
+        self.conversation_history = []
+
+    def __getitem__(self, index):
+        return self._history[index]
+
+    def __len__(self):
+        return len(self._history)
+
+
+def compact_memory(agent) -> CompactConversation:
+    """Swap ``agent.short_memory`` for a ``CompactConversation`` copy of it
+
+    Call this before ``track_tokens`` or ``bound_memory``, which attach
+    to whatever conversation the agent holds at the time.
+    """
+    agent.short_memory = CompactConversation.from_conversation(
+        agent.short_memory
+    )
+    return agent.short_memory
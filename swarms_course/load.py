@@ -0,0 +1,165 @@
+"""Load-test an agent workload and report latency percentiles and throughput.
+
+``load_test`` (threads) and ``aload_test`` (asyncio) push tasks through
+a workload with ``run_batch``/``arun_batch``: closed-loop at a fixed
+``concurrency``, or open-loop by also capping the start ``rate``. Tasks
+are cycled until ``requests`` have been sent or ``duration`` seconds
+have passed. The ``LoadReport`` summarises what came back.
+
+    with MockLLMServer(latency="lognormal:0.3:0.5", error_rate=0.02) as server:
+        llm = OpenAICompatibleChat(base_url=server.url, api_key="test")
+        pool = AgentPool(llm=llm)
+        report = load_test(
+            lambda ticket: pool.run(ticket, agent_name="support"),
+            tickets,
+            concurrency=32,
+            duration=30,
+        )
+    print(report)
+
+Latency percentiles cover successful requests; failures are counted
+by error type.
+"""
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from swarms_course.batch import arun_batch, run_batch
+from swarms_course.stats import LatencyStats
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load test"""
+
+    requests: int
+    succeeded: int
+    seconds: float
+    latency: LatencyStats
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(cls, results, seconds):
+        results = list(results)
+        ok = [r for r in results if r.ok]
+        return cls(
+            requests=len(results),
+            succeeded=len(ok),
+            seconds=seconds,
+            latency=LatencyStats.from_values(r.seconds for r in ok),
+            errors=dict(
+                Counter(
+                    type(r.error).__name__ for r in results if not r.ok
+                )
+            ),
+        )
+
+    @property
+    def throughput(self):
+        """Successful requests per second"""
+        return self.succeeded / self.seconds if self.seconds else 0.0
+
+    @property
+    def error_rate(self):
+        failed = self.requests - self.succeeded
+        return failed / self.requests if self.requests else 0.0
+
+    def __str__(self):
+        lines = [
+            f"{self.requests} requests in {self.seconds:.2f}s:"
+            f" {self.throughput:.1f} req/s,"
+            f" {self.error_rate:.1%} failed",
+            f"latency {self.latency}",
+        ]
+        if self.errors:
+            lines.append(
+                "errors "
+                + ", ".join(
+                    f"{name} x{count}"
+                    for name, count in sorted(self.errors.items())
+                )
+            )
+        return "\n".join(lines)
+
+
+def _schedule(
+    tasks: Iterable[Any],
+    requests: Optional[int],
+    duration: Optional[float],
+) -> Iterator[Any]:
+    """``tasks`` once, or cycled up to ``requests`` / ``duration``"""
+    if requests is None and duration is None:
+        yield from tasks
+        return
+    source = itertools.cycle(tasks)
+    if requests is not None:
+        source = itertools.islice(source, requests)
+    deadline = None if duration is None else time.monotonic() + duration
+    for task in source:
+        if deadline is not None and time.monotonic() >= deadline:
+            return
+        yield task
+
+
+def load_test(
+    workload,
+    tasks: Iterable[Any],
+    concurrency: int = 8,
+    rate: Optional[float] = None,
+    requests: Optional[int] = None,
+    duration: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> LoadReport:
+    """Run ``workload`` over ``tasks`` on a thread pool and report on it
+
+    Args:
+        workload: Anything ``run_batch`` accepts: an agent or a callable.
+        tasks: Tasks to send; cycled when ``requests`` or ``duration``
+            is given.
+        concurrency (int): Requests in flight at once.
+        rate (float): Maximum request starts per second.
+        requests (int): Stop after this many requests.
+        duration (float): Stop starting requests after this many seconds.
+        timeout (float): Seconds before a request counts as timed out.
+    """
+    start = time.perf_counter()
+    results = list(
+        run_batch(
+            workload,
+            _schedule(tasks, requests, duration),
+            max_concurrency=concurrency,
+            rate_limit=rate,
+            timeout=timeout,
+        )
+    )
+    return LoadReport.from_results(results, time.perf_counter() - start)
+
+
+async def aload_test(
+    workload,
+    tasks: Iterable[Any],
+    concurrency: int = 8,
+    rate: Optional[float] = None,
+    requests: Optional[int] = None,
+    duration: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> LoadReport:
+    """Async counterpart of ``load_test``, built on ``arun_batch``
+
+    Coroutine functions are awaited on the running loop, so
+    ``concurrency`` can reach the hundreds without a thread each.
+    """
+    start = time.perf_counter()
+    results = [
+        result
+        async for result in arun_batch(
+            workload,
+            _schedule(tasks, requests, duration),
+            max_concurrency=concurrency,
+            rate_limit=rate,
+            timeout=timeout,
+        )
+    ]
+    return LoadReport.from_results(results, time.perf_counter() - start)
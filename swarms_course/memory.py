@@ -0,0 +1,249 @@
+"""Keep an agent's short-term memory inside a token budget.
+
+A swarms ``Conversation`` grows without limit, and every loop renders
+the whole history into the prompt, so long sessions get slower and more
+expensive per call until they overflow the context window.
+``bound_memory`` hooks the conversation's ``add`` so that, after every
+message, the oldest turns are evicted until the history fits the budget.
+Evicted turns can be folded into a single rolling summary message by a
+``summarizer``; without one they are dropped.
+
+    memory = bound_memory(agent, summarizer=llm_summarizer(llm))
+    agent.run("...")
+    print(memory.counter.used, memory.stats)
+
+Messages present when the memory is bound (the system prompt, rules) are
+pinned and never evicted. Token counts come from ``TokenCounter``.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from swarms_course.tokens import TokenCounter, render_message
+
+SUMMARY_ROLE = "Summary"
+# Prefixed to a message whose start was cut to fit the budget
+TRUNCATION_MARKER = "[...] "
+
+SUMMARY_PROMPT = """Update the running summary of an assistant's conversation.
+Keep names, identifiers, decisions and open questions; drop small talk.
+Answer with the new summary only, in at most {max_words} words.
+
+Current summary:
+{summary}
+
+Messages to fold in:
+{messages}"""
+
+
+def llm_summarizer(llm, max_words: int = 120) -> Callable[..., str]:
+    """Summarizer that asks ``llm`` to fold evicted turns into the summary"""
+
+    def summarize(summary, evicted):
+        return str(
+            llm.run(
+                SUMMARY_PROMPT.format(
+                    max_words=max_words,
+                    summary=summary or "(empty)",
+                    messages="".join(render_message(m) for m in evicted),
+                )
+            )
+        ).strip()
+
+    return summarize
+
+
+@dataclass
+class MemoryStats:
+    """What the bounded memory has done so far"""
+
+    evicted: int = 0
+    summaries: int = 0
+    truncated: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.evicted} evicted, {self.summaries} summaries,"
+            f" {self.truncated} truncated"
+        )
+
+
+class BoundedMemory:
+    """Token-budgeted view over a swarms ``Conversation``
+
+    Args:
+        conversation: The ``Conversation`` to bound; its ``add`` is
+            replaced by ``BoundedMemory.add``.
+        tokenizer: Anything ``token_count_fn`` accepts.
+        max_tokens (int): Budget for the rendered history.
+        summarizer: ``summarizer(summary, evicted_messages) -> str``, or
+            None to drop evicted turns.
+        summary_tokens (int): Budget reserved for the summary message;
+            longer summaries are truncated.
+        low_water (float): Once over budget, evict down to this fraction
+            of it, so summaries are written every few turns rather than
+            on every message.
+    """
+
+    def __init__(
+        self,
+        conversation: Any,
+        tokenizer: Any,
+        max_tokens: int,
+        summarizer: Optional[Callable[[str, List[dict]], str]] = None,
+        summary_tokens: int = 256,
+        low_water: float = 0.75,
+    ):
+        self.conversation = conversation
+        self.counter = TokenCounter(conversation, tokenizer, max_tokens)
+        self.max_tokens = max_tokens
+        self.summarizer = summarizer
+        self.summary_tokens = summary_tokens if summarizer else 0
+        self.low_water = low_water
+        self.stats = MemoryStats()
+        self.summary = ""
+        self._summary_message = None
+        self._pinned = len(conversation.conversation_history)
+        if self.counter.used + self.summary_tokens > max_tokens:
+            raise ValueError(
+                f"pinned messages use {self.counter.used} tokens,"
+                f" leaving no room in a {max_tokens} token budget"
+            )
+        self._add = conversation.add
+        conversation.add = self.add
+
+    def add(self, role, content, *args, **kwargs):
+        self._add(role, content, *args, **kwargs)
+        self.enforce()
+
+    def _fit(self, text, max_tokens, keep_end=False):
+        """Shorten ``text`` by characters until it fits ``max_tokens``"""
+        count = self.counter.count
+        if count(text) <= max_tokens:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            part = text[-mid:] if keep_end else text[:mid]
+            if count(part) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[-low:] if keep_end and low else text[:low]
+
+    def _overhead(self, message):
+        """Tokens ``message`` costs with empty content"""
+        return self.counter.count(render_message({**message, "content": ""}))
+
+    def _replace(self, index, message):
+        history = self.conversation.conversation_history
+        self.counter.removed(history[index])
+        history[index] = message
+
+    def _fold(self, evicted):
+        summary = self.summarizer(self.summary, evicted)
+        message = {"role": SUMMARY_ROLE, "content": ""}
+        self.summary = self._fit(
+            summary, self.summary_tokens - self._overhead(message)
+        )
+        message["content"] = self.summary
+        history = self.conversation.conversation_history
+        if self._summary_message is None:
+            history.insert(self._pinned, message)
+        else:
+            self._replace(self._pinned, message)
+        self._summary_message = message
+        self.stats.summaries += 1
+
+    def enforce(self):
+        """Evict, summarise or truncate until the history fits the budget"""
+        counter = self.counter
+        history = self.conversation.conversation_history
+        if self._summary_message is not None and (
+            len(history) <= self._pinned
+            or history[self._pinned] is not self._summary_message
+        ):
+            # The history was replaced behind our back; start over
+            self._summary_message = None
+            self.summary = ""
+        first = self._pinned + (self._summary_message is not None)
+        summary_used = (
+            counter.tokens(self._summary_message)
+            if self._summary_message is not None
+            else 0
+        )
+        # Reserve the summary's full budget so folding cannot overflow
+        limit = self.max_tokens - self.summary_tokens + summary_used
+        if counter.used > limit:
+            limit = min(limit, int(self.max_tokens * self.low_water))
+        # Find the oldest turns to evict, then drop them in one edit so
+        # the counter re-adds the rest once
+        used, end = counter.used, first
+        while used > limit and end < len(history) - 1:
+            used -= counter.tokens(history[end])
+            end += 1
+        evicted = history[first:end]
+        if evicted:
+            del history[first:end]
+            for message in evicted:
+                counter.removed(message)
+        self.stats.evicted += len(evicted)
+        if evicted and self.summarizer is not None:
+            self._fold(evicted)
+        overflow = counter.used - self.max_tokens
+        if overflow > 0:
+            # Only the newest message is left and it alone is too large
+            newest = history[-1]
+            room = counter.tokens(newest) - overflow
+            text = str(newest["content"])
+            marked = {**newest, "content": TRUNCATION_MARKER}
+            budget = room - counter.count(render_message(marked))
+            while budget > 0:
+                content = TRUNCATION_MARKER + self._fit(
+                    text, budget, keep_end=True
+                )
+                message = {**newest, "content": content}
+                # Pieces can tokenize differently once joined
+                excess = counter.count(render_message(message)) - room
+                if excess <= 0:
+                    break
+                budget -= excess
+            else:
+                # No room left for the text, or even for the marker
+                message = {**newest, "content": ""}
+            self._replace(len(history) - 1, message)
+            self.stats.truncated += 1
+
+    def __repr__(self):
+        return (
+            f"BoundedMemory(used={self.counter.used},"
+            f" max_tokens={self.max_tokens}, {self.stats})"
+        )
+
+
+def bound_memory(
+    agent,
+    max_tokens: Optional[int] = None,
+    reserve_tokens: int = 0,
+    summarizer: Optional[Callable[[str, List[dict]], str]] = None,
+    summary_tokens: int = 256,
+    low_water: float = 0.75,
+) -> BoundedMemory:
+    """Bound ``agent.short_memory`` to its context length and return it
+
+    ``max_tokens`` defaults to ``agent.context_length - reserve_tokens``;
+    reserve room for the model's reply with ``reserve_tokens``. The
+    agent's ``check_available_tokens`` reports against the same counter.
+    """
+    if max_tokens is None:
+        max_tokens = agent.context_length - reserve_tokens
+    memory = BoundedMemory(
+        agent.short_memory,
+        agent.tokenizer,
+        max_tokens,
+        summarizer=summarizer,
+        summary_tokens=summary_tokens,
+        low_water=low_water,
+    )
+    agent.token_counter = memory.counter
+    agent.check_available_tokens = lambda: memory.counter.used
+    return memory
@@ -0,0 +1,454 @@
+"""Local OpenAI-compatible chat completions server for offline load tests.
+
+``MockLLMServer`` answers ``POST /v1/chat/completions`` (plain or
+streamed as server-sent events) with the same deterministic completions
+as ``StubLLM``, and ``GET /v1/models``. It is a small HTTP/1.1 server on
+asyncio streams with keep-alive, running on its own event loop in a
+background thread, so notebooks and benchmarks can drive it with real
+HTTP clients, including ``OpenAIChat(openai_api_base=server.url)``.
+
+What a hosted model would do to the caller is simulated:
+
+- ``latency``: delay before the first token, fixed or drawn from a
+  distribution (``latency_distribution``);
+- ``tokens_per_second``: generation speed after the first token;
+- ``error_rate``: share of completions that fail with ``error_status``;
+- ``rate_limit``: requests per second (token bucket of ``burst``);
+  excess requests get a 429 with ``Retry-After``, as the OpenAI API does.
+
+    with MockLLMServer(latency="lognormal:0.3:0.5", error_rate=0.01) as server:
+        llm = OpenAICompatibleChat(base_url=server.url, api_key="test")
+        llm.run("Summarise the ticket")
+"""
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from typing import Callable, Optional, Union
+
+from swarms_course.stub_llm import _WORD, StubLLM
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+def latency_distribution(
+    kind: str = "fixed",
+    seconds: float = 0.05,
+    spread: float = 0.0,
+    seed: Optional[int] = None,
+) -> Callable[[], float]:
+    """Zero-argument callable drawing delays from a named distribution
+
+    Args:
+        kind (str): ``fixed`` (always ``seconds``), ``uniform``
+            (``seconds`` plus or minus ``spread``), ``exponential`` (mean
+            ``seconds``) or ``lognormal`` (median ``seconds``, sigma
+            ``spread``; a long right tail like real model latencies).
+        seconds (float): Typical delay.
+        spread (float): Width of the distribution, as above.
+        seed (int): Seed for reproducible draws.
+    """
+    if kind not in DISTRIBUTIONS:
+        raise ValueError(
+            f"unknown latency distribution {kind!r};"
+            f" expected one of {', '.join(DISTRIBUTIONS)}"
+        )
+    rng = random.Random(seed)
+    if kind == "fixed":
+        return lambda: seconds
+    if kind == "uniform":
+        low, high = max(0.0, seconds - spread), seconds + spread
+        return lambda: rng.uniform(low, high)
+    if kind == "exponential":
+        return lambda: rng.expovariate(1 / seconds) if seconds else 0.0
+    return lambda: rng.lognormvariate(math.log(seconds), spread)
+
+
+def parse_latency(text: str, seed: Optional[int] = None):
+    """``"0.2"`` or ``"kind:seconds[:spread]"`` as a latency setting"""
+    kind, _, rest = text.partition(":")
+    if not rest:
+        return float(kind)
+    seconds, _, spread = rest.partition(":")
+    return latency_distribution(
+        kind, float(seconds), float(spread or 0.0), seed=seed
+    )
+
+
+class _Bucket:
+    """Token bucket refilled at ``rate`` per second, up to ``burst``"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Seconds until a request is allowed; 0 if it was taken now"""
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class MockLLMServer:
+    """OpenAI-style completions endpoint on ``127.0.0.1``
+
+    Args:
+        latency (float | callable | str): Seconds before the first token:
+            a number, a zero-argument callable returning the delay (see
+            ``latency_distribution``), or a ``"kind:seconds[:spread]"``
+            string.
+        tokens_per_second (float): Generation speed after the first
+            token; None returns the whole completion at once.
+        error_rate (float): Share of completions that fail, after their
+            latency, with ``error_status``.
+        error_status (int): Status of injected failures.
+        rate_limit (float): Requests per second accepted before 429s;
+            None for no limit.
+        burst (int): Requests the rate limit lets through at once;
+            defaults to one second's worth.
+        seed (int): Seed for latency draws and injected errors.
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free one.
+        model_name (str): Model reported by ``/v1/models``.
+    """
+
+    def __init__(
+        self,
+        latency: Union[float, Callable[[], float], str] = 0.05,
+        tokens_per_second: Optional[float] = None,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        model_name: str = "mock-model",
+    ):
+        if isinstance(latency, str):
+            latency = parse_latency(latency, seed=seed)
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.host = host
+        self.port = port
+        self.model_name = model_name
+        self.requests = 0
+        self.connections = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.completion_tokens = 0
+        self._random = random.Random(seed)
+        self._bucket = None
+        self._stub = StubLLM(model_name=model_name)
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._handlers = {}
+
+    @property
+    def url(self):
+        """Base URL to give an OpenAI-compatible client"""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self) -> "MockLLMServer":
+        """Serve from a background thread; returns once listening"""
+        ready = threading.Event()
+
+        def serve():
+            self._loop = asyncio.new_event_loop()
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(
+                    self._connection, self.host, self.port, backlog=4096
+                )
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(
+            target=serve, name="mock-llm-server", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop(self):
+        """Close open connections and stop the server thread"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(
+            self._shutdown(), self._loop
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+    async def _shutdown(self):
+        self._server.close()
+        # Closing the transports ends each handler's read loop cleanly
+        for writer in self._handlers.values():
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __str__(self):
+        return (
+            f"{self.requests} completions, {self.errors} failed,"
+            f" {self.rate_limited} rate limited, over"
+            f" {self.connections} connections"
+        )
+
+    # -- HTTP --------------------------------------------------------------
+
+    async def _connection(self, reader, writer):
+        self.connections += 1
+        handler = asyncio.current_task()
+        self._handlers[handler] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                close = headers.get("connection", "").lower() == "close"
+                status, payload, extra = await self._route(
+                    method, path, body
+                )
+                head = [
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}",
+                    f"Connection: {'close' if close else 'keep-alive'}",
+                ]
+                head += [f"{name}: {value}" for name, value in extra.items()]
+                if isinstance(payload, dict):
+                    data = json.dumps(payload).encode()
+                    head += [
+                        "Content-Type: application/json",
+                        f"Content-Length: {len(data)}",
+                    ]
+                    writer.write(("\r\n".join(head) + "\r\n\r\n").encode())
+                    writer.write(data)
+                    await writer.drain()
+                else:
+                    head += [
+                        "Content-Type: text/event-stream",
+                        "Cache-Control: no-cache",
+                        "Transfer-Encoding: chunked",
+                    ]
+                    writer.write(("\r\n".join(head) + "\r\n\r\n").encode())
+                    async for event in payload:
+                        data = f"data: {event}\n\n".encode()
+                        writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+                        await writer.drain()
+                    writer.write(b"0\r\n\r\n")
+                    await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._handlers.pop(handler, None)
+            writer.close()
+
+    async def _route(self, method, path, body):
+        if method == "GET" and path.rstrip("/").endswith("/models"):
+            return (
+                200,
+                {
+                    "object": "list",
+                    "data": [{"id": self.model_name, "object": "model"}],
+                },
+                {},
+            )
+        if method == "POST" and path.endswith("/chat/completions"):
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                return 400, _error("invalid JSON body"), {}
+            return await self._complete(request)
+        return 404, _error(f"no route for {method} {path}"), {}
+
+    def _admit(self):
+        """Rate-limit headers, or a 429 response if over the limit"""
+        if self.rate_limit is None:
+            return None
+        burst = self.burst or max(1, math.ceil(self.rate_limit))
+        bucket = self._bucket
+        if bucket is None or (bucket.rate, bucket.burst) != (
+            self.rate_limit,
+            burst,
+        ):
+            self._bucket = _Bucket(self.rate_limit, burst)
+        wait = self._bucket.take()
+        if not wait:
+            return None
+        self.rate_limited += 1
+        return (
+            429,
+            _error(
+                f"Rate limit reached: {self.rate_limit:g} requests per"
+                " second",
+                kind="requests",
+                code="rate_limit_exceeded",
+            ),
+            {
+                "Retry-After": f"{math.ceil(wait)}",
+                "retry-after-ms": f"{math.ceil(wait * 1000)}",
+                "x-ratelimit-limit-requests": f"{self.rate_limit:g}",
+                "x-ratelimit-remaining-requests": "0",
+            },
+        )
+
+    async def _complete(self, request):
+        limited = self._admit()
+        if limited is not None:
+            return limited
+        self.requests += 1
+        latency = self.latency
+        delay = latency() if callable(latency) else latency
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            return (
+                self.error_status,
+                _error(
+                    "Injected failure from MockLLMServer",
+                    kind="server_error",
+                ),
+                {},
+            )
+        body = self.completion(request)
+        content = body["choices"][0]["message"]["content"]
+        tokens = _WORD.findall(content)
+        self.completion_tokens += len(tokens)
+        if request.get("stream"):
+            return 200, self._events(request, body, tokens), {}
+        if self.tokens_per_second:
+            await asyncio.sleep(len(tokens) / self.tokens_per_second)
+        return 200, body, {}
+
+    async def _events(self, request, body, tokens):
+        """SSE payloads for a streamed completion, paced per token"""
+        options = request.get("stream_options") or {}
+        interval = (
+            1 / self.tokens_per_second if self.tokens_per_second else 0.0
+        )
+
+        def chunk(delta, finish_reason=None, **extra):
+            return json.dumps(
+                {
+                    "id": body["id"],
+                    "object": "chat.completion.chunk",
+                    "created": body["created"],
+                    "model": body["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": delta,
+                            "finish_reason": finish_reason,
+                        }
+                    ],
+                    **extra,
+                }
+            )
+
+        for index, token in enumerate(tokens):
+            if interval and index:
+                await asyncio.sleep(interval)
+            delta = {"content": token}
+            if not index:
+                delta["role"] = "assistant"
+            yield chunk(delta)
+        yield chunk({}, "stop")
+        if options.get("include_usage"):
+            yield json.dumps(
+                {
+                    "id": body["id"],
+                    "object": "chat.completion.chunk",
+                    "created": body["created"],
+                    "model": body["model"],
+                    "choices": [],
+                    "usage": body["usage"],
+                }
+            )
+        yield "[DONE]"
+
+    def completion(self, request):
+        """Chat completion body answering ``request``"""
+        prompt = "\n".join(
+            str(m.get("content", "")) for m in request.get("messages", [])
+        )
+        content = self._stub.respond(prompt)
+        prompt_tokens = len(prompt.split())
+        completion_tokens = len(content.split())
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", self.model_name),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+
+def _error(message, kind="invalid_request_error", code=None):
+    """OpenAI-style error body"""
+    return {
+        "error": {
+            "message": message,
+            "type": kind,
+            "param": None,
+            "code": code,
+        }
+    }
@@ -0,0 +1,180 @@
+"""Reuse agents across runs instead of constructing one per call.
+
+Building a swarms ``Agent`` sets up a tokenizer, a thread pool, a
+conversation and a telemetry thread, which costs far more than the
+state a run actually leaves behind. ``AgentPool`` keeps idle agents
+keyed by their configuration. When an agent is returned it restores the
+conversation captured right after construction, so the next lease starts
+from a clean system prompt with the tokenizer and LLM client already
+warm.
+
+    pool = AgentPool(llm=llm)
+    with pool.lease(agent_name="support", system_prompt=prompt) as agent:
+        agent.run("Where is my order?")
+"""
+import copy
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+def config_key(config):
+    """Hashable key for a configuration dict
+
+    Lists, tuples, sets and dicts are frozen recursively; values that
+    still cannot be hashed (an LLM client, a tool function) are keyed by
+    identity, so two configs share agents only if they share the object.
+    """
+
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(freeze(v) for v in value)
+        try:
+            hash(value)
+        except TypeError:
+            return ("id", id(value))
+        return value
+
+    return freeze(config)
+
+
+@dataclass
+class AgentSnapshot:
+    """Per-run state of a freshly built agent, restored on release"""
+
+    history: Optional[list] = None
+    feedback: Optional[list] = None
+    agent_output: Any = None
+    llm_temperature: Any = None
+
+    @classmethod
+    def capture(cls, agent):
+        snapshot = cls()
+        memory = getattr(agent, "short_memory", None)
+        if memory is not None:
+            snapshot.history = [
+                copy.copy(message) for message in memory.conversation_history
+            ]
+        if hasattr(agent, "feedback"):
+            snapshot.feedback = list(agent.feedback)
+        output = getattr(agent, "agent_output", None)
+        if hasattr(output, "model_copy"):
+            snapshot.agent_output = output.model_copy(deep=True)
+        if getattr(agent, "dynamic_temperature_enabled", False):
+            snapshot.llm_temperature = getattr(agent.llm, "temperature", None)
+        return snapshot
+
+    def restore(self, agent):
+        if self.history is not None:
+            agent.short_memory.conversation_history = [
+                copy.copy(message) for message in self.history
+            ]
+        if self.feedback is not None:
+            agent.feedback = list(self.feedback)
+        if self.agent_output is not None:
+            agent.agent_output = self.agent_output.model_copy(deep=True)
+        if self.llm_temperature is not None:
+            agent.llm.temperature = self.llm_temperature
+
+
+@dataclass
+class PoolStats:
+    """Lease counters; ``created`` agents were built, ``reused`` were not"""
+
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+
+    @property
+    def leases(self):
+        return self.created + self.reused
+
+    def __str__(self):
+        return (
+            f"{self.leases} leases: {self.created} created,"
+            f" {self.reused} reused, {self.discarded} discarded"
+        )
+
+
+class AgentPool:
+    """Lease agents by configuration and reset them between leases
+
+    Args:
+        llm: Model shared by the default agent factory.
+        agent_factory: ``factory(**config)`` returning an agent. Defaults
+            to a swarms ``Agent`` built from ``llm`` and the config.
+        max_idle (int): Idle agents kept per configuration; extra
+            returns are dropped.
+    """
+
+    def __init__(
+        self,
+        llm: Any = None,
+        agent_factory: Optional[Callable[..., Any]] = None,
+        max_idle: int = 8,
+    ):
+        if agent_factory is None:
+
+            def agent_factory(**config):
+                from swarms import Agent
+
+                return Agent(llm=llm, **config)
+
+        self.agent_factory = agent_factory
+        self.max_idle = max_idle
+        self.stats = PoolStats()
+        self._idle = {}
+        self._leased = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, **config):
+        """Return an idle agent for ``config``, building one if none is free"""
+        key = config_key(config)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                agent, snapshot = idle.pop()
+                self.stats.reused += 1
+                self._leased[id(agent)] = (key, snapshot)
+                return agent
+        agent = self.agent_factory(**config)
+        snapshot = AgentSnapshot.capture(agent)
+        with self._lock:
+            self.stats.created += 1
+            self._leased[id(agent)] = (key, snapshot)
+        return agent
+
+    def release(self, agent):
+        """Reset ``agent`` and make it available to the next lease"""
+        with self._lock:
+            key, snapshot = self._leased.pop(id(agent))
+        snapshot.restore(agent)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append((agent, snapshot))
+            else:
+                self.stats.discarded += 1
+
+    @contextmanager
+    def lease(self, **config):
+        agent = self.acquire(**config)
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    def run(self, task, **config):
+        """Run ``task`` on a leased agent and return the response"""
+        with self.lease(**config) as agent:
+            return agent.run(task)
+
+    def clear(self):
+        """Drop every idle agent"""
+        with self._lock:
+            self._idle.clear()
@@ -0,0 +1,183 @@
+"""Compiled prompt templates with memoized sections and token counts.
+
+The lessons call ``Prompt.get_prompt()`` every time they build an agent
+and splice prompts into f-strings at run time. ``get_prompt`` sends a
+telemetry event on each call, and every budget check re-tokenizes the
+whole result. ``compile_prompt`` parses a template once into literal
+sections and named ``{slot}`` fields. Rendering then only joins
+precomputed strings. When a tokenizer is given, each literal section is
+tokenized at compile time, so ``tokens(**values)`` only counts the slot
+values, and those counts are memoized too.
+
+    request = compile_prompt(
+        "Using these guidelines: {guidelines}, write a prompt for: {case}",
+        tokenizer=agent.tokenizer,
+    ).bind(guidelines=prompt_generator.content)
+    agent.run(request.render(case="financial reporting"))
+    print(request.tokens(case="financial reporting"))
+
+Slots use ``str.format`` syntax, including conversions and format specs;
+write ``{{`` and ``}}`` for literal braces. As with ``TokenCounter``,
+the token total is a sum over sections and can differ from tokenizing
+the rendered prompt by a token at section boundaries.
+"""
+import functools
+import re
+import string
+import threading
+from typing import Any, Optional
+
+from swarms_course.tokens import token_count_fn
+
+_FORMATTER = string.Formatter()
+_ROOT = re.compile(r"[^.\[]*")
+
+
+def _root(field):
+    """Slot name of a field such as ``user.name`` or ``items[0]``"""
+    return _ROOT.match(field).group()
+
+
+class PromptTemplate:
+    """A template compiled into literal sections and slots
+
+    Args:
+        text (str): Template source in ``str.format`` syntax.
+        tokenizer: Anything ``token_count_fn`` accepts, or None if token
+            counts are not needed.
+        name (str): Label used in ``repr``.
+    """
+
+    def __init__(
+        self, text: str, tokenizer: Any = None, name: Optional[str] = None
+    ):
+        parts = []
+        for literal, field, spec, conversion in _FORMATTER.parse(text):
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                if not field or field.isdigit():
+                    raise ValueError(
+                        f"prompt slots must be named, got {{{field}}}"
+                    )
+                parts.append((field, conversion, spec))
+        self.name = name
+        self._setup(parts, tokenizer)
+
+    def _setup(self, parts, tokenizer, count=None):
+        # Merge neighbouring literals so each static section is one string
+        merged = []
+        for part in parts:
+            if isinstance(part, str) and merged and isinstance(
+                merged[-1], str
+            ):
+                merged[-1] += part
+            else:
+                merged.append(part)
+        self.tokenizer = tokenizer
+        self._parts = tuple(merged)
+        self.slots = tuple(
+            dict.fromkeys(
+                _root(p[0]) for p in merged if not isinstance(p, str)
+            )
+        )
+        self._count = count
+        if count is None and tokenizer is not None:
+            self._count = functools.lru_cache(maxsize=4096)(
+                token_count_fn(tokenizer)
+            )
+        self._static = "".join(p for p in merged if isinstance(p, str))
+        self.static_tokens = (
+            sum(self._count(p) for p in merged if isinstance(p, str))
+            if self._count is not None
+            else None
+        )
+
+    @classmethod
+    def _from_parts(cls, parts, tokenizer, count, name):
+        template = cls.__new__(cls)
+        template.name = name
+        template._setup(parts, tokenizer, count)
+        return template
+
+    @staticmethod
+    def _value(field, conversion, spec, values):
+        if field in values:
+            value = values[field]
+        else:
+            value = _FORMATTER.get_field(field, (), values)[0]
+        if conversion:
+            value = _FORMATTER.convert_field(value, conversion)
+        return format(value, spec) if spec else str(value)
+
+    def render(self, **values) -> str:
+        """The prompt with every slot filled from ``values``"""
+        if not self.slots:
+            return self._static
+        return "".join(
+            part if isinstance(part, str) else self._value(*part, values)
+            for part in self._parts
+        )
+
+    def bind(self, **values) -> "PromptTemplate":
+        """New template with the given slots folded into static sections"""
+        parts = []
+        for part in self._parts:
+            if isinstance(part, str):
+                parts.append(part)
+            elif _root(part[0]) in values:
+                parts.append(self._value(*part, values))
+            else:
+                parts.append(part)
+        return self._from_parts(
+            parts, self.tokenizer, self._count, self.name
+        )
+
+    def tokens(self, **values) -> int:
+        """Token count of ``render(**values)`` without re-tokenizing it"""
+        if self._count is None:
+            raise ValueError("compile the template with a tokenizer")
+        total = self.static_tokens
+        for part in self._parts:
+            if not isinstance(part, str):
+                total += self._count(self._value(*part, values))
+        return total
+
+    def __str__(self):
+        return self.render()
+
+    def __repr__(self):
+        return (
+            f"PromptTemplate(name={self.name!r}, slots={self.slots},"
+            f" static_tokens={self.static_tokens})"
+        )
+
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_prompt(
+    prompt: Any, tokenizer: Any = None, name: Optional[str] = None
+) -> PromptTemplate:
+    """Compile a template string or swarms ``Prompt``, reusing past results
+
+    A ``Prompt``'s ``content`` is read directly, without ``get_prompt``'s
+    telemetry call. Templates are cached by text and tokenizer, so
+    compiling the same prompt for many agents parses and tokenizes it
+    once.
+    """
+    text = getattr(prompt, "content", prompt)
+    name = name or getattr(prompt, "name", None)
+    key = (text, id(tokenizer), name)
+    with _compiled_lock:
+        entry = _compiled.get(key)
+        # Holding the tokenizer keeps its id from being reused
+        if entry is not None and entry[0] is tokenizer:
+            return entry[1]
+    template = PromptTemplate(text, tokenizer=tokenizer, name=name)
+    with _compiled_lock:
+        if len(_compiled) >= 1024:
+            _compiled.pop(next(iter(_compiled)))
+        _compiled[key] = (tokenizer, template)
+    return template
@@ -0,0 +1,434 @@
+"""Client-side rate limiting shared by every agent using a provider key.
+
+Agents that share an API key share its quota, but each one only sees
+its own calls; run them in parallel and together they trip 429s, retry
+and trip more. ``RateLimiter`` keeps two token buckets for a key, one
+for requests per second and one for tokens per minute, and makes each
+caller wait for its turn before sending:
+
+    llm = rate_limit(
+        OpenAIChat(), requests_per_second=8, tokens_per_minute=90_000
+    )
+    agent = Agent(llm=llm, agent_name="support")
+
+Each call reserves its share up front, so concurrent callers queue in
+order instead of all retrying when capacity frees up. Tokens are
+estimated before the call (prompt plus ``max_tokens``) and settled
+against the actual count afterwards. A streamed call reserves before
+its first chunk and settles against the streamed text after its last.
+
+Limiters are shared per key (a hash of the API key and model) by
+threads and event loops in one process. With ``path``, the bucket state
+lives in a small file under an exclusive ``flock``, so worker processes
+on the same machine draw from one quota too.
+"""
+import asyncio
+import hashlib
+import math
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# Bucket levels and the time they were last refilled
+_STATE = struct.Struct("<3d")
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class _MemoryState:
+    """Bucket state for the threads and event loops of one process"""
+
+    def __init__(self):
+        self._values = None
+        self._lock = threading.Lock()
+
+    def update(self, change):
+        with self._lock:
+            self._values, result = change(self._values)
+            return result
+
+
+class FileState:
+    """Bucket state in a file, shared by processes through ``flock``
+
+    Args:
+        path (str): File holding the state; created if missing.
+    """
+
+    def __init__(self, path: str):
+        import fcntl
+
+        self.path = path
+        self._flock = fcntl.flock
+        self._exclusive = fcntl.LOCK_EX
+        self._unlock = fcntl.LOCK_UN
+        self._file = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        # A forked child must not share the parent's open file: flock
+        # locks belong to it, so parent and child would not exclude
+        # each other
+        if self._file is None or self._pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._file = os.fdopen(fd, "r+b", buffering=0)
+            self._pid = os.getpid()
+        return self._file
+
+    def update(self, change):
+        with self._lock:
+            f = self._open()
+            self._flock(f, self._exclusive)
+            try:
+                f.seek(0)
+                data = f.read(_STATE.size)
+                values = (
+                    list(_STATE.unpack(data))
+                    if len(data) == _STATE.size
+                    else None
+                )
+                values, result = change(values)
+                f.seek(0)
+                f.write(_STATE.pack(*values))
+                return result
+            finally:
+                self._flock(f, self._unlock)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None and self._pid == os.getpid():
+                self._file.close()
+            self._file = None
+
+
+@dataclass
+class LimiterStats:
+    """Reservations made in this process and the time spent waiting"""
+
+    requests: int = 0
+    tokens: int = 0
+    delayed: int = 0
+    waited: float = 0.0
+
+    def __str__(self):
+        return (
+            f"{self.requests} requests, {self.tokens} tokens;"
+            f" {self.delayed} delayed, {self.waited:.2f}s waited"
+        )
+
+
+class RateLimiter:
+    """Requests-per-second and tokens-per-minute buckets for one key
+
+    Args:
+        requests_per_second (float): Sustained request rate, or None.
+        tokens_per_minute (float): Sustained token rate, or None.
+        burst (int): Requests that may start at once after a quiet
+            period; defaults to one second's worth.
+        state: Where the buckets live; a ``FileState`` to share them
+            across processes. Defaults to this process only.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        state=None,
+    ):
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst or max(1, math.ceil(requests_per_second or 1))
+        self.state = state or _MemoryState()
+        # Processes share wall-clock time, not a monotonic clock
+        self.clock = (
+            time.time if isinstance(state, FileState) else time.monotonic
+        )
+        self._stats = LimiterStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> LimiterStats:
+        with self._lock:
+            return LimiterStats(**vars(self._stats))
+
+    def _refill(self, values, now):
+        if values is None:
+            return [float(self.burst), self.tokens_per_minute or 0.0, now]
+        requests, tokens, updated = values
+        elapsed = max(0.0, now - updated)
+        if self.requests_per_second:
+            requests = min(
+                self.burst, requests + elapsed * self.requests_per_second
+            )
+        if self.tokens_per_minute:
+            tokens = min(
+                self.tokens_per_minute,
+                tokens + elapsed * self.tokens_per_minute / 60,
+            )
+        return [requests, tokens, now]
+
+    def reserve(self, requests: int = 1, tokens: int = 0) -> float:
+        """Take ``requests`` and ``tokens`` now; seconds to wait before use
+
+        The buckets may go negative: later callers then wait behind this
+        one rather than competing with it.
+        """
+
+        def change(values):
+            now = self.clock()
+            values = self._refill(values, now)
+            delay = 0.0
+            if self.requests_per_second and requests:
+                values[0] -= requests
+                delay = max(delay, -values[0] / self.requests_per_second)
+            if self.tokens_per_minute and tokens:
+                values[1] -= tokens
+                delay = max(delay, -values[1] * 60 / self.tokens_per_minute)
+            return values, delay
+
+        delay = self.state.update(change)
+        with self._lock:
+            self._stats.requests += requests
+            self._stats.tokens += tokens
+            if delay > 0:
+                self._stats.delayed += 1
+                self._stats.waited += delay
+        return delay
+
+    def settle(self, estimated: int, actual: int):
+        """Correct a reservation of ``estimated`` tokens to ``actual``"""
+        if not self.tokens_per_minute or actual == estimated:
+            return
+
+        def change(values):
+            values = self._refill(values, self.clock())
+            values[1] = min(
+                self.tokens_per_minute, values[1] + estimated - actual
+            )
+            return values, None
+
+        self.state.update(change)
+        with self._lock:
+            self._stats.tokens += actual - estimated
+
+    def acquire(self, requests: int = 1, tokens: int = 0) -> float:
+        """Block until the reservation may be used; returns seconds waited"""
+        delay = self.reserve(requests, tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self, requests: int = 1, tokens: int = 0) -> float:
+        """``acquire`` without blocking the event loop"""
+        delay = self.reserve(requests, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+def limiter_key(llm: Any) -> str:
+    """Hash of the API key and model ``llm`` uses
+
+    Only the digest is kept or written to disk, never the key itself.
+    """
+    secret = ""
+    for name in ("api_key", "openai_api_key", "anthropic_api_key"):
+        value = getattr(llm, name, None)
+        if value is not None:
+            reveal = getattr(value, "get_secret_value", None)
+            secret = reveal() if reveal else str(value)
+            break
+    model = getattr(llm, "model_name", None) or type(llm).__name__
+    return hashlib.sha256(f"{secret}\0{model}".encode()).hexdigest()[:16]
+
+
+def rate_limiter(
+    key: str, path: Optional[str] = None, **options
+) -> RateLimiter:
+    """The limiter shared by every caller using ``key`` in this process
+
+    With ``path``, a directory, the buckets are kept in
+    ``path/<key>.bucket`` and shared with other processes. ``options``
+    configure the limiter when it is first created; every process
+    sharing a file should pass the same ones.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get((key, path))
+        if limiter is None:
+            state = None
+            if path is not None:
+                state = FileState(os.path.join(path, f"{key}.bucket"))
+            limiter = _limiters[(key, path)] = RateLimiter(
+                state=state, **options
+            )
+        return limiter
+
+
+def _estimate_tokens(text: str) -> int:
+    # About four characters per token for English text
+    return max(1, len(text) // 4)
+
+
+class RateLimitedLLM:
+    """Wrap ``llm`` so each call first waits for ``limiter``
+
+    Exposes ``run``, ``__call__``, ``arun``, ``stream`` and ``astream``
+    like the models agents accept, and forwards every other attribute to
+    the wrapped model.
+
+    Args:
+        llm: The model to wrap.
+        limiter (RateLimiter): Quota to draw from.
+        count_tokens: ``text -> tokens`` used for the token budget;
+            defaults to a four-characters-per-token estimate.
+        completion_tokens (int): Completion size assumed before the
+            call when the model has no ``max_tokens``.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        limiter: RateLimiter,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        completion_tokens: int = 256,
+    ):
+        self.__dict__["llm"] = llm
+        self.__dict__["limiter"] = limiter
+        self.__dict__["count_tokens"] = count_tokens or _estimate_tokens
+        self.__dict__["completion_tokens"] = completion_tokens
+
+    @property
+    def stats(self):
+        return self.limiter.stats
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def __setattr__(self, name, value):
+        # Agents set ``temperature`` on their model; pass it through
+        if name in self.__dict__:
+            self.__dict__[name] = value
+        else:
+            setattr(self.llm, name, value)
+
+    def _reservation(self, task):
+        """Tokens to reserve for ``task``; zero without a token budget"""
+        if not self.limiter.tokens_per_minute:
+            return 0, 0
+        prompt = self.count_tokens(str(task))
+        completion = (
+            getattr(self.llm, "max_tokens", None) or self.completion_tokens
+        )
+        return prompt, prompt + completion
+
+    def _settle(self, prompt, estimated, response=None):
+        # A failed call is charged its prompt only
+        if estimated:
+            actual = prompt
+            if response is not None:
+                actual += self.count_tokens(str(response))
+            self.limiter.settle(estimated, actual)
+
+    def run(self, task, *args, **kwargs):
+        prompt, estimated = self._reservation(task)
+        self.limiter.acquire(tokens=estimated)
+        try:
+            if callable(self.llm):
+                response = self.llm(task, *args, **kwargs)
+            else:
+                response = self.llm.run(task, *args, **kwargs)
+        except Exception:
+            self._settle(prompt, estimated)
+            raise
+        self._settle(prompt, estimated, response)
+        return response
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs):
+        """``run`` as a coroutine, waiting without blocking the loop"""
+        from swarms_course.async_agents import async_call
+
+        prompt, estimated = self._reservation(task)
+        await self.limiter.aacquire(tokens=estimated)
+        try:
+            response = await async_call(self.llm)(task, *args, **kwargs)
+        except Exception:
+            self._settle(prompt, estimated)
+            raise
+        self._settle(prompt, estimated, response)
+        return response
+
+    def stream(self, task, *args, **kwargs):
+        """Stream from the model once the reservation may be used
+
+        The tokens are settled against the text streamed so far when the
+        stream ends, fails or is closed early.
+        """
+        from swarms_course.streaming import stream_chunks
+
+        prompt, estimated = self._reservation(task)
+        self.limiter.acquire(tokens=estimated)
+        pieces = []
+        try:
+            for chunk in stream_chunks(self.llm, task, *args, **kwargs):
+                pieces.append(chunk)
+                yield chunk
+        finally:
+            self._settle(prompt, estimated, "".join(pieces) or None)
+
+    async def astream(self, task, *args, **kwargs):
+        """``stream`` as an async generator, for models with ``astream``
+
+        Models without one are awaited whole and yield a single chunk.
+        """
+        from swarms_course.async_agents import async_call
+
+        prompt, estimated = self._reservation(task)
+        await self.limiter.aacquire(tokens=estimated)
+        pieces = []
+        try:
+            astream = getattr(self.llm, "astream", None)
+            if astream is None:
+                response = await async_call(self.llm)(task, *args, **kwargs)
+                pieces.append(str(response))
+                yield pieces[-1]
+                return
+            async for chunk in astream(task, *args, **kwargs):
+                # Chat models yield message chunks, completion models
+                # strings
+                pieces.append(getattr(chunk, "content", chunk))
+                yield pieces[-1]
+        finally:
+            self._settle(prompt, estimated, "".join(pieces) or None)
+
+
+def rate_limit(
+    llm,
+    requests_per_second: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    burst: Optional[int] = None,
+    path: Optional[str] = None,
+    **options,
+) -> RateLimitedLLM:
+    """Wrap ``llm`` in a ``RateLimitedLLM`` using its key's shared limiter
+
+    ``path`` is a directory for sharing the limiter across processes;
+    ``options`` go to ``RateLimitedLLM``.
+    """
+    limiter = rate_limiter(
+        limiter_key(llm),
+        path=path,
+        requests_per_second=requests_per_second,
+        tokens_per_minute=tokens_per_minute,
+        burst=burst,
+    )
+    return RateLimitedLLM(llm, limiter, **options)
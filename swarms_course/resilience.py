@@ -0,0 +1,560 @@
+"""Retries, circuit breakers and hedged requests around an agent's LLM.
+
+A hosted model rarely fails outright; it browns out: a share of calls
+return 429s and 5xxs, and a tail of calls take many times the median.
+``ResilientLLM`` wraps any model an ``Agent`` accepts and handles each
+call the way a production client would:
+
+- transient failures (429, 5xx, timeouts, dropped connections) are
+  retried with full-jitter exponential backoff, honouring
+  ``Retry-After`` when the provider sends one;
+- a ``CircuitBreaker`` per provider opens after repeated failures, so
+  calls fail fast with ``CircuitOpenError`` instead of queueing behind
+  a dead endpoint, and lets one probe through after ``recovery_time``;
+- with ``hedge="p95"``, a call still running after the recent p95
+  latency gets a duplicate, and whichever answers first wins. Hedges
+  are capped at ``hedge_budget`` of calls so they cannot double the
+  load on a struggling provider.
+
+    llm = resilient(OpenAIChat(temperature=0), hedge="p95")
+    agent = Agent(llm=llm, agent_name="support", retry_attempts=1)
+    print(llm.stats)
+
+``stream`` retries and short-circuits the same way up to the first
+chunk. After that a retry would repeat text the caller has already
+seen, so a failure mid-stream is raised as it is.
+
+Give the agent ``retry_attempts=1``: it retries failed calls itself, and
+nested retries multiply the worst-case latency. Python cannot cancel a
+blocking call, so on the threaded path a losing hedge runs to
+completion in the background; ``arun`` cancels it.
+"""
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+from swarms_course.stats import LatencyStats, percentile
+
+# Threads running hedged calls, shared by every ResilientLLM
+HEDGE_WORKERS = 256
+
+_executor = None
+_executor_lock = threading.Lock()
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+_PERMANENT = (TypeError, ValueError, AttributeError, KeyError)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit is open"""
+
+
+def _executor_for_hedges():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS, thread_name_prefix="hedge"
+            )
+        return _executor
+
+
+def status_of(error: BaseException) -> Optional[int]:
+    """HTTP status carried by ``error`` (httpx, aiohttp, openai), if any"""
+    for source in (error, getattr(error, "response", None)):
+        for name in ("status_code", "status"):
+            value = getattr(source, name, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the provider asked the caller to wait, if it said"""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after") is not None:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed call is worth retrying
+
+    Errors with an HTTP status are retried on 408, 409, 425, 429 and
+    5xx only. Errors without one (timeouts, refused or dropped
+    connections) are retried unless they look like a bug in the caller.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    status = status_of(error)
+    if status is not None:
+        return status in (408, 409, 425, 429) or status >= 500
+    return not isinstance(error, _PERMANENT)
+
+
+def provider_of(llm: Any) -> str:
+    """Key identifying the endpoint behind ``llm``"""
+    for name in ("base_url", "openai_api_base", "api_base", "url"):
+        value = getattr(llm, name, None)
+        if isinstance(value, str) and value:
+            return value
+    return getattr(llm, "model_name", None) or type(llm).__name__
+
+
+@dataclass
+class Backoff:
+    """Full-jitter exponential backoff
+
+    The delay before retry ``attempt`` (0-based) is drawn uniformly from
+    zero to ``min(max_delay, base * factor ** attempt)``, which spreads
+    out callers that failed together instead of retrying in lockstep.
+    """
+
+    base: float = 0.2
+    factor: float = 2.0
+    max_delay: float = 10.0
+
+    def delay(self, attempt: int, rng=random) -> float:
+        ceiling = min(self.max_delay, self.base * self.factor**attempt)
+        return rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Stop calling a provider after ``failure_threshold`` failures in a row
+
+    Closed, calls go through. Open, ``allow`` refuses them until
+    ``recovery_time`` seconds have passed; then the breaker is half-open
+    and lets a single probe through, closing again if it succeeds and
+    reopening if it fails.
+
+    Args:
+        name (str): Provider the breaker guards, for messages.
+        failure_threshold (int): Consecutive failures that open it.
+        recovery_time (float): Seconds to stay open before probing.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = 5,
+        recovery_time: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if self.clock() - self._opened_at < self.recovery_time:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+            self._probing = False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if (
+                self.state == self.HALF_OPEN
+                or self.failures >= self.failure_threshold
+            ):
+                if self.state != self.OPEN:
+                    self.opened += 1
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+                self._probing = False
+
+    def __repr__(self):
+        return (
+            f"CircuitBreaker({self.name!r}, state={self.state},"
+            f" failures={self.failures}, opened={self.opened})"
+        )
+
+
+def circuit_breaker(provider: str, **options) -> CircuitBreaker:
+    """The breaker shared by every wrapper calling ``provider``
+
+    ``options`` configure the breaker when it is first created.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = _breakers[provider] = CircuitBreaker(
+                provider, **options
+            )
+        return breaker
+
+
+@dataclass
+class ResilienceStats:
+    """Call counters; ``latency`` covers recent model calls that answered"""
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    short_circuited: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    latency: Optional[LatencyStats] = None
+
+    def __str__(self):
+        text = (
+            f"{self.calls} calls, {self.attempts} attempts"
+            f" ({self.retries} retries), {self.failures} failed,"
+            f" {self.short_circuited} short-circuited; {self.hedges}"
+            f" hedges ({self.hedge_wins} won)"
+        )
+        if self.latency is not None and self.latency.count:
+            text += f"; {self.latency}"
+        return text
+
+
+class ResilientLLM:
+    """Wrap ``llm`` with retries, a circuit breaker and optional hedging
+
+    Exposes ``run``, ``__call__``, ``arun`` and ``stream`` like the
+    models agents accept, and forwards every other attribute to the
+    wrapped model.
+
+    Args:
+        llm: The model to wrap.
+        retries (int): Retries after the first attempt for transient
+            failures.
+        backoff (Backoff): Delay between attempts.
+        breaker: A ``CircuitBreaker``, a provider key for a shared one,
+            None for the shared breaker of ``provider_of(llm)``, or False
+            for none.
+        hedge: None to never hedge, seconds to wait before sending a
+            duplicate, or a percentile of recent latencies such as
+            ``"p95"``.
+        hedge_budget (float): Most hedges as a share of calls.
+        retry_if: ``retry_if(error)`` deciding whether to retry;
+            defaults to ``is_transient``.
+        window (int): Recent latencies kept for percentile hedging.
+        seed (int): Seed for the backoff jitter.
+    """
+
+    # Latencies needed before a percentile hedge delay is trusted
+    MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        llm: Any,
+        retries: int = 3,
+        backoff: Optional[Backoff] = None,
+        breaker: Union[CircuitBreaker, str, bool, None] = None,
+        hedge: Union[float, str, None] = None,
+        hedge_budget: float = 0.1,
+        retry_if: Optional[Callable[[BaseException], bool]] = None,
+        window: int = 200,
+        seed: Optional[int] = None,
+    ):
+        if breaker is None:
+            breaker = circuit_breaker(provider_of(llm))
+        elif isinstance(breaker, str):
+            breaker = circuit_breaker(breaker)
+        elif breaker is False:
+            breaker = None
+        quantile = None
+        if isinstance(hedge, str):
+            if not hedge.startswith("p"):
+                raise ValueError(
+                    f"hedge must be seconds or a percentile like 'p95',"
+                    f" got {hedge!r}"
+                )
+            quantile = float(hedge[1:])
+        d = self.__dict__
+        d["llm"] = llm
+        d["retries"] = retries
+        d["backoff"] = backoff or Backoff()
+        d["breaker"] = breaker
+        d["hedge"] = hedge
+        d["hedge_budget"] = hedge_budget
+        d["retry_if"] = retry_if or is_transient
+        d["_quantile"] = quantile
+        d["_latencies"] = deque(maxlen=window)
+        d["_stats"] = ResilienceStats()
+        d["_lock"] = threading.Lock()
+        d["_random"] = random.Random(seed)
+
+    @property
+    def stats(self) -> ResilienceStats:
+        with self._lock:
+            stats = ResilienceStats(**vars(self._stats))
+            latencies = list(self._latencies)
+        stats.latency = LatencyStats.from_values(latencies)
+        return stats
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def __setattr__(self, name, value):
+        # Agents set ``temperature`` on their model; pass it through
+        if name in self.__dict__:
+            self.__dict__[name] = value
+        else:
+            setattr(self.llm, name, value)
+
+    def _count(self, field, n=1):
+        with self._lock:
+            setattr(self._stats, field, getattr(self._stats, field) + n)
+
+    def _call(self, task, *args, **kwargs):
+        start = time.perf_counter()
+        if callable(self.llm):
+            response = self.llm(task, *args, **kwargs)
+        else:
+            response = self.llm.run(task, *args, **kwargs)
+        self._latencies.append(time.perf_counter() - start)
+        return response
+
+    async def _acall(self, call, task, *args, **kwargs):
+        start = time.perf_counter()
+        response = await call(task, *args, **kwargs)
+        self._latencies.append(time.perf_counter() - start)
+        return response
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging this attempt, or None"""
+        if self.hedge is None:
+            return None
+        with self._lock:
+            if self._stats.hedges >= max(
+                1, self.hedge_budget * self._stats.calls
+            ):
+                return None
+        if self._quantile is None:
+            return float(self.hedge)
+        latencies = list(self._latencies)
+        if len(latencies) < self.MIN_SAMPLES:
+            return None
+        return percentile(latencies, self._quantile)
+
+    def _admit(self):
+        """Count an attempt, or raise if the provider's circuit is open"""
+        if self.breaker is not None and not self.breaker.allow():
+            self._count("short_circuited")
+            raise CircuitOpenError(
+                f"circuit for {self.breaker.name} is open after"
+                f" {self.breaker.failures} failures"
+            )
+        self._count("attempts")
+
+    def _failed(self, error, attempt) -> float:
+        """Record a failed attempt; the delay before retrying, or raise"""
+        transient = self.retry_if(error)
+        if self.breaker is not None:
+            # A non-transient error still means the provider answered
+            if transient:
+                self.breaker.failure()
+            else:
+                self.breaker.success()
+        if not transient or attempt >= self.retries:
+            self._count("failures")
+            raise error
+        self._count("retries")
+        delay = self.backoff.delay(attempt, self._random)
+        asked = retry_after(error)
+        if asked is not None:
+            delay = max(delay, min(asked, self.backoff.max_delay))
+        return delay
+
+    def _succeeded(self):
+        if self.breaker is not None:
+            self.breaker.success()
+
+    def _hedged(self, task, args, kwargs, delay):
+        executor = _executor_for_hedges()
+        primary = executor.submit(self._call, task, *args, **kwargs)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeout:
+            pass
+        self._count("hedges")
+        hedge = executor.submit(self._call, task, *args, **kwargs)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._count("hedge_wins")
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def run(self, task, *args, **kwargs):
+        self._count("calls")
+        attempt = 0
+        while True:
+            self._admit()
+            try:
+                delay = self._hedge_delay()
+                if delay is None:
+                    response = self._call(task, *args, **kwargs)
+                else:
+                    response = self._hedged(task, args, kwargs, delay)
+            except Exception as error:
+                time.sleep(self._failed(error, attempt))
+                attempt += 1
+                continue
+            self._succeeded()
+            return response
+
+    __call__ = run
+
+    async def _ahedged(self, call, task, args, kwargs, delay):
+        primary = asyncio.ensure_future(
+            self._acall(call, task, *args, **kwargs)
+        )
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        self._count("hedges")
+        hedge = asyncio.ensure_future(self._acall(call, task, *args, **kwargs))
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception() is None:
+                        if future is hedge:
+                            self._count("hedge_wins")
+                        return future.result()
+                    error = future.exception()
+            raise error
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def arun(self, task, *args, **kwargs):
+        """``run`` as a coroutine; a losing hedge is cancelled"""
+        from swarms_course.async_agents import async_call
+
+        call = async_call(self.llm)
+        self._count("calls")
+        attempt = 0
+        while True:
+            self._admit()
+            try:
+                delay = self._hedge_delay()
+                if delay is None:
+                    response = await self._acall(call, task, *args, **kwargs)
+                else:
+                    response = await self._ahedged(
+                        call, task, args, kwargs, delay
+                    )
+            except Exception as error:
+                await asyncio.sleep(self._failed(error, attempt))
+                attempt += 1
+                continue
+            self._succeeded()
+            return response
+
+    def stream(self, task, *args, **kwargs):
+        """Stream from the model, retrying until the first chunk arrives
+
+        Errors connecting or before the first chunk are retried like
+        ``run``; later ones are counted against the breaker and raised.
+        Streams are never hedged.
+        """
+        from swarms_course.streaming import stream_chunks
+
+        self._count("calls")
+        attempt = 0
+        while True:
+            self._admit()
+            start = time.perf_counter()
+            chunks = stream_chunks(self.llm, task, *args, **kwargs)
+            try:
+                first = next(chunks, None)
+            except Exception as error:
+                time.sleep(self._failed(error, attempt))
+                attempt += 1
+                continue
+            break
+        # The provider answered; settle a half-open probe even if the
+        # caller stops reading early
+        self._succeeded()
+        if first is None:
+            return
+        yield first
+        try:
+            yield from chunks
+        except Exception as error:
+            self._count("failures")
+            if self.breaker is not None and self.retry_if(error):
+                self.breaker.failure()
+            raise
+        self._latencies.append(time.perf_counter() - start)
+
+
+def resilient(
+    llm,
+    retries: int = 3,
+    hedge: Union[float, str, None] = None,
+    failure_threshold: int = 5,
+    recovery_time: float = 10.0,
+    **options,
+) -> ResilientLLM:
+    """Wrap ``llm`` in a ``ResilientLLM`` using its provider's breaker
+
+    ``failure_threshold`` and ``recovery_time`` apply if this is the
+    first wrapper for the provider; ``options`` go to ``ResilientLLM``.
+    """
+    breaker = options.pop("breaker", None)
+    if breaker is None:
+        breaker = circuit_breaker(
+            provider_of(llm),
+            failure_threshold=failure_threshold,
+            recovery_time=recovery_time,
+        )
+    return ResilientLLM(
+        llm, retries=retries, breaker=breaker, hedge=hedge, **options
+    )
@@ -0,0 +1,415 @@
+"""Route an agent's model calls across several providers.
+
+``ModelRouter`` holds several backends, for example Groq and Anthropic,
+and is used anywhere an ``llm=`` is accepted. Each call goes to the
+backend expected to answer soonest, scored from three things the router
+tracks per backend:
+
+- an exponentially weighted moving average (EWMA) of its latency;
+- the calls it has in flight, since each one queues ahead of the next;
+- its rate-limit headroom: with a declared ``rate_limit`` the router
+  keeps a token bucket per backend and stops sending once it is empty,
+  and a 429 sets the backend aside for its ``Retry-After``.
+
+A backend whose circuit breaker is open, or that has no headroom, is
+skipped; when every backend with a closed breaker is out of headroom
+the call waits for the first one to free up. A call that fails with a
+transient error (429, 5xx, timeout) falls back to the next best
+backend; other errors are raised straight away. ``stream`` falls back
+the same way until the first chunk arrives.
+
+    router = ModelRouter({"groq": groq_model, "anthropic": anthropic_model})
+    agent = Agent(llm=router, agent_name="support")
+    print(router.stats)
+"""
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Optional, Union
+
+from swarms_course.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    circuit_breaker,
+    is_transient,
+    provider_of,
+    retry_after,
+    status_of,
+)
+
+
+class Backend:
+    """One model behind a ``ModelRouter`` and what is known about it
+
+    Args:
+        llm: The model.
+        name (str): Label in stats; defaults to the model's provider.
+        rate_limit (float): Requests per second the provider allows, if
+            known.
+        burst (int): Requests allowed at once before ``rate_limit``
+            applies; defaults to one second's worth.
+        breaker: A ``CircuitBreaker``, None for the shared breaker of
+            the model's provider, or False for none.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        name: Optional[str] = None,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        breaker: Union[CircuitBreaker, bool, None] = None,
+    ):
+        self.llm = llm
+        self.name = name or provider_of(llm)
+        self.rate_limit = rate_limit
+        self.burst = burst or max(1, math.ceil(rate_limit or 1))
+        if breaker is None:
+            breaker = circuit_breaker(provider_of(llm))
+        self.breaker = breaker or None
+        self.ewma = None
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+        self.rate_limited = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._limited_until = 0.0
+
+    def headroom(self, now: float) -> float:
+        """Share of the rate limit still available, from 0 to 1"""
+        if now < self._limited_until:
+            return 0.0
+        if self.rate_limit is None:
+            return 1.0
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated) * self.rate_limit,
+        )
+        self._updated = now
+        return self._tokens / self.burst if self._tokens >= 1 else 0.0
+
+    def score(self, now: float, default: float) -> float:
+        """Expected wait; lower is better, infinite without headroom"""
+        headroom = self.headroom(now)
+        if not headroom:
+            return math.inf
+        latency = self.ewma if self.ewma is not None else default
+        return latency * (self.in_flight + 1) / headroom
+
+    def available_in(self, now: float) -> float:
+        """Seconds until the backend has headroom again"""
+        wait = max(0.0, self._limited_until - now)
+        if self.rate_limit is not None and self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.rate_limit)
+        return wait
+
+    def __repr__(self):
+        return f"Backend({self.name!r})"
+
+
+@dataclass
+class BackendStats:
+    """Calls routed to one backend; ``ewma`` is in seconds"""
+
+    name: str
+    calls: int = 0
+    failures: int = 0
+    rate_limited: int = 0
+    in_flight: int = 0
+    ewma: Optional[float] = None
+    state: str = CircuitBreaker.CLOSED
+
+
+@dataclass
+class RouterStats:
+    """Per-backend counters and calls that fell back to another backend"""
+
+    backends: List[BackendStats] = field(default_factory=list)
+    fallbacks: int = 0
+
+    @property
+    def calls(self):
+        return sum(backend.calls for backend in self.backends)
+
+    def __str__(self):
+        lines = [f"{self.calls} calls, {self.fallbacks} fell back"]
+        for backend in self.backends:
+            share = backend.calls / self.calls if self.calls else 0.0
+            ewma = (
+                f"{backend.ewma * 1000:.0f}ms"
+                if backend.ewma is not None
+                else "-"
+            )
+            lines.append(
+                f"  {backend.name}: {backend.calls} calls ({share:.0%}),"
+                f" ewma {ewma}, {backend.failures} failed,"
+                f" {backend.rate_limited} rate-limited, {backend.state}"
+            )
+        return "\n".join(lines)
+
+
+class ModelRouter:
+    """Send each call to the backend expected to answer soonest
+
+    Exposes ``run``, ``__call__``, ``arun`` and ``stream`` like the
+    models agents accept. Attributes an agent sets, such as
+    ``temperature``, are set on every backend; other attributes are read
+    from the first.
+
+    Args:
+        backends: A mapping of names to models or ``Backend``
+            objects, or a list of models or ``Backend`` objects.
+        alpha (float): Weight of the newest latency in the EWMA.
+        fallbacks (int): Other backends to try after a transient
+            failure; defaults to all of them.
+        retry_if: ``retry_if(error)`` deciding whether to fall back;
+            defaults to ``is_transient``.
+    """
+
+    def __init__(
+        self,
+        backends: Union[Mapping[str, Any], List[Any]],
+        alpha: float = 0.3,
+        fallbacks: Optional[int] = None,
+        retry_if=None,
+    ):
+        if isinstance(backends, Mapping):
+            backends = [
+                llm if isinstance(llm, Backend) else Backend(llm, name)
+                for name, llm in backends.items()
+            ]
+        else:
+            backends = [
+                llm if isinstance(llm, Backend) else Backend(llm)
+                for llm in backends
+            ]
+        if not backends:
+            raise ValueError("ModelRouter needs at least one backend")
+        d = self.__dict__
+        d["backends"] = backends
+        d["alpha"] = alpha
+        d["fallbacks"] = (
+            len(backends) - 1 if fallbacks is None else fallbacks
+        )
+        d["retry_if"] = retry_if or is_transient
+        d["_fallbacks"] = 0
+        d["_lock"] = threading.Lock()
+
+    @property
+    def stats(self) -> RouterStats:
+        with self._lock:
+            return RouterStats(
+                backends=[
+                    BackendStats(
+                        name=backend.name,
+                        calls=backend.calls,
+                        failures=backend.failures,
+                        rate_limited=backend.rate_limited,
+                        in_flight=backend.in_flight,
+                        ewma=backend.ewma,
+                        state=(
+                            backend.breaker.state
+                            if backend.breaker is not None
+                            else CircuitBreaker.CLOSED
+                        ),
+                    )
+                    for backend in self.backends
+                ],
+                fallbacks=self._fallbacks,
+            )
+
+    def __getattr__(self, name):
+        return getattr(self.backends[0].llm, name)
+
+    def __setattr__(self, name, value):
+        # Agents set ``temperature`` on their model; set it everywhere
+        if name in self.__dict__:
+            self.__dict__[name] = value
+        else:
+            for backend in self.backends:
+                setattr(backend.llm, name, value)
+
+    def _acquire(self, tried):
+        """Reserve the best untried backend with headroom
+
+        Returns ``(backend, None)``; ``(None, seconds)`` when the usable
+        backends are all out of headroom and the first frees up in
+        ``seconds``; or ``(None, None)`` when no backend will do.
+        """
+        with self._lock:
+            now = time.monotonic()
+            known = [b.ewma for b in self.backends if b.ewma is not None]
+            # Untried backends are assumed as fast as the fastest known
+            default = min(known, default=1.0)
+            scored = sorted(
+                (
+                    (b.score(now, default), index, b)
+                    for index, b in enumerate(self.backends)
+                    if b not in tried
+                ),
+                key=lambda item: item[:2],
+            )
+            wait = None
+            for score, _, backend in scored:
+                breaker = backend.breaker
+                if score == math.inf:
+                    # Rate-limited, not broken: worth waiting for
+                    if breaker is None or breaker.state != breaker.OPEN:
+                        free_in = backend.available_in(now)
+                        wait = free_in if wait is None else min(wait, free_in)
+                    continue
+                if breaker is not None and not breaker.allow():
+                    continue
+                if backend.rate_limit is not None:
+                    backend._tokens -= 1
+                backend.in_flight += 1
+                backend.calls += 1
+                return backend, None
+        return None, wait
+
+    def _release(self, backend, seconds, error=None) -> bool:
+        """Record a finished call; whether a failure should fall back"""
+        with self._lock:
+            backend.in_flight -= 1
+            if error is None:
+                if backend.ewma is None:
+                    backend.ewma = seconds
+                else:
+                    backend.ewma += self.alpha * (seconds - backend.ewma)
+            else:
+                backend.failures += 1
+        breaker = backend.breaker
+        if error is None:
+            if breaker is not None:
+                breaker.success()
+            return False
+        transient = self.retry_if(error)
+        if status_of(error) == 429:
+            # Out of quota, not unhealthy: set it aside until it refills
+            with self._lock:
+                backend.rate_limited += 1
+                now = time.monotonic()
+                backend._tokens, backend._updated = 0.0, now
+                backend._limited_until = now + (retry_after(error) or 1.0)
+            if breaker is not None:
+                breaker.success()
+        elif breaker is not None:
+            if transient:
+                breaker.failure()
+            else:
+                breaker.success()
+        return transient
+
+    def _next(self, tried, error):
+        """``(backend, None)`` to try next, or ``(None, seconds)`` to wait
+
+        Raises ``error``, or ``CircuitOpenError`` on the first attempt,
+        when no backend is left.
+        """
+        if len(tried) > self.fallbacks:
+            raise error
+        backend, wait = self._acquire(tried)
+        if backend is None:
+            if wait is not None:
+                return None, wait
+            if error is not None:
+                raise error
+            raise CircuitOpenError(
+                "no backend available: "
+                + ", ".join(b.name for b in self.backends)
+            )
+        if tried:
+            with self._lock:
+                self.__dict__["_fallbacks"] += 1
+        return backend, None
+
+    def run(self, task, *args, **kwargs):
+        tried, error = [], None
+        while True:
+            backend, wait = self._next(tried, error)
+            if backend is None:
+                time.sleep(wait)
+                continue
+            llm = backend.llm
+            start = time.perf_counter()
+            try:
+                if callable(llm):
+                    response = llm(task, *args, **kwargs)
+                else:
+                    response = llm.run(task, *args, **kwargs)
+            except Exception as failure:
+                seconds = time.perf_counter() - start
+                if not self._release(backend, seconds, failure):
+                    raise
+                tried.append(backend)
+                error = failure
+                continue
+            self._release(backend, time.perf_counter() - start)
+            return response
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs):
+        """``run`` as a coroutine, awaiting each backend natively"""
+        from swarms_course.async_agents import async_call
+
+        tried, error = [], None
+        while True:
+            backend, wait = self._next(tried, error)
+            if backend is None:
+                await asyncio.sleep(wait)
+                continue
+            start = time.perf_counter()
+            try:
+                response = await async_call(backend.llm)(
+                    task, *args, **kwargs
+                )
+            except Exception as failure:
+                seconds = time.perf_counter() - start
+                if not self._release(backend, seconds, failure):
+                    raise
+                tried.append(backend)
+                error = failure
+                continue
+            self._release(backend, time.perf_counter() - start)
+            return response
+
+    def stream(self, task, *args, **kwargs):
+        """Stream from the best backend, falling back until the first chunk
+
+        Once a chunk has been yielded the stream stays on its backend; a
+        later failure is recorded against it and raised.
+        """
+        from swarms_course.streaming import stream_chunks
+
+        tried, error = [], None
+        while True:
+            backend, wait = self._next(tried, error)
+            if backend is None:
+                time.sleep(wait)
+                continue
+            start = time.perf_counter()
+            chunks = stream_chunks(backend.llm, task, *args, **kwargs)
+            try:
+                first = next(chunks, None)
+            except Exception as failure:
+                seconds = time.perf_counter() - start
+                if not self._release(backend, seconds, failure):
+                    raise
+                tried.append(backend)
+                error = failure
+                continue
+            break
+        failure = None
+        try:
+            if first is not None:
+                yield first
+                yield from chunks
+        except Exception as error:
+            failure = error
+            raise
+        finally:
+            self._release(backend, time.perf_counter() - start, failure)
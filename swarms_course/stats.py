@@ -0,0 +1,43 @@
+"""Small latency statistics helpers shared by the course utilities."""
+import math
+from dataclasses import dataclass
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of ``values`` for ``q`` in [0, 100]"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class LatencyStats:
+    """Summary of a set of latencies, in seconds"""
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_values(cls, values):
+        values = list(values)
+        return cls(
+            count=len(values),
+            mean=sum(values) / len(values) if values else 0.0,
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+            p99=percentile(values, 99),
+            max=max(values, default=0.0),
+        )
+
+    def __str__(self):
+        return (
+            f"n={self.count} mean={self.mean * 1000:.1f}ms"
+            f" p50={self.p50 * 1000:.1f}ms p95={self.p95 * 1000:.1f}ms"
+            f" p99={self.p99 * 1000:.1f}ms max={self.max * 1000:.1f}ms"
+        )
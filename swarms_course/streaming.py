@@ -0,0 +1,249 @@
+"""Stream an agent's output token by token while it runs.
+
+``Agent.run`` returns only after every loop has finished, so a cell that
+prints the response shows nothing for the whole run. ``stream_run``
+runs the agent in a worker thread with its model wrapped so that each
+LLM call streams: chunks are forwarded as they arrive, and the agent
+still receives the joined text and carries on as usual. The stream
+yields ``StreamEvent``s for loop boundaries and tokens, and records the
+time to first token, overall and per loop.
+
+    for event in stream_run(agent, "Draft the quarterly report"):
+        if event.kind == "token":
+            print(event.text, end="", flush=True)
+
+    stream = print_stream(agent, "Draft the quarterly report")
+    print(stream.stats)
+
+``AgentStream`` also supports ``async for``. Models that have a
+``stream(task)`` method (langchain chat models, ``StubLLM``) are
+streamed; any other model is called normally and its whole response
+arrives as one token. Do not run the agent elsewhere while it streams;
+leaving the loop early stops the events but lets the run finish.
+"""
+import asyncio
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional
+
+LOOP = "loop"
+TOKEN = "token"
+DONE = "done"
+
+
+@dataclass
+class StreamEvent:
+    """One step of a streamed run; ``seconds`` is time since the start"""
+
+    kind: str
+    text: str = ""
+    loop: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class StreamStats:
+    """Timing of a streamed run"""
+
+    loops: int = 0
+    tokens: int = 0
+    first_token: Optional[float] = None
+    loop_first_tokens: List[float] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def __str__(self):
+        first = (
+            f"{self.first_token * 1000:.1f}ms"
+            if self.first_token is not None
+            else "n/a"
+        )
+        return (
+            f"{self.loops} loops, {self.tokens} tokens in"
+            f" {self.seconds:.2f}s; first token after {first}"
+        )
+
+
+def stream_chunks(llm, task, *args, **kwargs) -> Iterator[str]:
+    """Text chunks of ``llm``'s completion, streamed if it can stream"""
+    stream = getattr(llm, "stream", None)
+    if stream is None:
+        yield str(llm(task, *args, **kwargs))
+        return
+    for chunk in stream(task, *args, **kwargs):
+        # Chat models yield message chunks, completion models strings
+        yield getattr(chunk, "content", chunk)
+
+
+class _StreamingLLM:
+    """Stand-in for the agent's model that reports every chunk"""
+
+    def __init__(self, llm, stream):
+        self.__dict__["llm"] = llm
+        self.__dict__["stream_to"] = stream
+
+    def __getattr__(self, name):
+        return getattr(self.llm, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.llm, name, value)
+
+    def __call__(self, task, *args, **kwargs):
+        stream = self.stream_to
+        stream._loop()
+        pieces = []
+        for chunk in stream_chunks(self.llm, task, *args, **kwargs):
+            pieces.append(chunk)
+            # Once the consumer stops listening the run still completes,
+            # so the agent's memory gets whole responses
+            stream._token(chunk)
+        return "".join(pieces)
+
+    run = __call__
+
+
+class AgentStream:
+    """Events of one streamed ``agent.run``; iterate once, sync or async
+
+    After the stream is exhausted, ``response`` holds what ``agent.run``
+    returned and ``stats`` the timings.
+    """
+
+    def __init__(self, agent, task, *args, **kwargs):
+        self.agent = agent
+        self.task = task
+        self.args = args
+        self.kwargs = kwargs
+        self.response = None
+        self.stats = StreamStats()
+        self._emit = None
+        self._start = None
+        self._loop_start = None
+        self._closed = False
+
+    def _elapsed(self):
+        return time.perf_counter() - self._start
+
+    def _send(self, event):
+        if not self._closed:
+            self._emit(event)
+
+    def _loop(self):
+        self.stats.loops += 1
+        self._loop_start = time.perf_counter()
+        self._send(
+            StreamEvent(
+                LOOP, loop=self.stats.loops, seconds=self._elapsed()
+            )
+        )
+
+    def _token(self, text):
+        if self._loop_start is not None:
+            self.stats.loop_first_tokens.append(
+                time.perf_counter() - self._loop_start
+            )
+            self._loop_start = None
+        seconds = self._elapsed()
+        if self.stats.first_token is None:
+            self.stats.first_token = seconds
+        self.stats.tokens += 1
+        self._send(
+            StreamEvent(
+                TOKEN, text=text, loop=self.stats.loops, seconds=seconds
+            )
+        )
+
+    def _run(self):
+        """Run the agent with a streaming model; always ends with DONE"""
+        agent = self.agent
+        llm = agent.llm
+        agent.llm = _StreamingLLM(llm, self)
+        error = None
+        try:
+            self.response = agent.run(self.task, *self.args, **self.kwargs)
+        except BaseException as e:
+            error = e
+        finally:
+            agent.llm = llm
+            self.stats.seconds = self._elapsed()
+        self._send(
+            StreamEvent(
+                DONE, loop=self.stats.loops, seconds=self.stats.seconds
+            )
+        )
+        return error
+
+    def __iter__(self):
+        return self._events()
+
+    def _events(self):
+        events = queue.Queue()
+        self._emit = events.put
+        self._start = time.perf_counter()
+        outcome = {}
+        worker = threading.Thread(
+            target=lambda: outcome.setdefault("error", self._run()),
+            name="agent-stream",
+            daemon=True,
+        )
+        worker.start()
+        try:
+            while True:
+                event = events.get()
+                yield event
+                if event.kind == DONE:
+                    break
+        finally:
+            self._closed = True
+        worker.join()
+        if outcome.get("error") is not None:
+            raise outcome["error"]
+
+    def __aiter__(self):
+        return self._aevents()
+
+    async def _aevents(self):
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+        self._emit = lambda event: loop.call_soon_threadsafe(
+            events.put_nowait, event
+        )
+        self._start = time.perf_counter()
+        worker = loop.run_in_executor(None, self._run)
+        try:
+            while True:
+                event = await events.get()
+                yield event
+                if event.kind == DONE:
+                    break
+        finally:
+            self._closed = True
+        error = await worker
+        if error is not None:
+            raise error
+
+
+def stream_run(agent, task: str, *args, **kwargs) -> AgentStream:
+    """Stream ``agent.run(task, ...)``; the run starts on iteration"""
+    return AgentStream(agent, task, *args, **kwargs)
+
+
+def print_stream(
+    agent, task: str, *args, file: Any = None, **kwargs
+) -> AgentStream:
+    """Print ``agent``'s output as it streams and return the finished stream
+
+    Each loop starts with a ``[loop N]`` header; tokens are flushed as
+    they arrive.
+    """
+    file = file or sys.stdout
+    stream = stream_run(agent, task, *args, **kwargs)
+    for event in stream:
+        if event.kind == LOOP:
+            print(f"\n[loop {event.loop}]", file=file, flush=True)
+        elif event.kind == TOKEN:
+            print(event.text, end="", file=file, flush=True)
+    print(file=file, flush=True)
+    return stream
@@ -0,0 +1,102 @@
+"""Deterministic, offline stand-in for the course's LLM clients.
+
+``StubLLM`` accepts the same constructor arguments as ``OpenAIChat`` and
+``Anthropic`` (API keys, base URLs, model names, temperature) and ignores
+the ones it has no use for. Responses are derived from a hash of the
+prompt, so the same input always produces the same output and notebook
+runs are reproducible without network access.
+"""
+import asyncio
+import hashlib
+import re
+import threading
+import time
+
+_WORD = re.compile(r"\S+\s*")
+
+_RESPONSES = (
+    "Here is a structured plan: clarify the goal, gather the relevant"
+    " data, analyse it, and report actionable recommendations.",
+    "Key considerations: stakeholder impact, cost, timeline and risk."
+    " I recommend starting with a small pilot and measuring results.",
+    "Summary: the request has been analysed. Next steps are to"
+    " validate assumptions, document decisions and follow up.",
+    "Recommendation: prioritise customer-facing improvements, track"
+    " progress weekly and escalate blockers early.",
+)
+
+
+class StubLLM:
+    """Callable LLM stand-in with optional injected latency
+
+    Args:
+        model_name (str): Reported in every response.
+        temperature (float): Stored for agents that read or tweak it.
+        latency (float | callable): Seconds to sleep per call, or a
+            zero-argument callable returning the delay.
+        token_latency (float): Extra seconds per generated word, so
+            streamed output arrives gradually.
+    """
+
+    def __init__(
+        self,
+        model_name="stub-model",
+        temperature=0.5,
+        latency=0.0,
+        token_latency=0.0,
+        *args,
+        **kwargs,
+    ):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.latency = latency
+        self.token_latency = token_latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _wait(self):
+        with self._lock:
+            self.calls += 1
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay:
+            time.sleep(delay)
+
+    def run(self, task, *args, **kwargs):
+        """Return a deterministic completion for ``task``"""
+        self._wait()
+        response = self.respond(task)
+        if self.token_latency:
+            time.sleep(self.token_latency * len(_WORD.findall(response)))
+        return response
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs):
+        """``run`` as a coroutine; the latency is awaited, not slept"""
+        with self._lock:
+            self.calls += 1
+        delay = self.latency() if callable(self.latency) else self.latency
+        response = self.respond(task)
+        if self.token_latency:
+            delay += self.token_latency * len(_WORD.findall(response))
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    def stream(self, task, *args, **kwargs):
+        """Yield the completion for ``task`` word by word"""
+        self._wait()
+        for index, word in enumerate(_WORD.findall(self.respond(task))):
+            if self.token_latency and index:
+                time.sleep(self.token_latency)
+            yield word
+
+    def respond(self, task):
+        digest = hashlib.sha256(str(task).encode("utf-8")).digest()
+        body = _RESPONSES[digest[0] % len(_RESPONSES)]
+        return f"[{self.model_name}] {body} (ref {digest.hex()[:8]})"
+
+
+# Drop-in names for the clients used in the lessons
+OpenAIChat = StubLLM
+Anthropic = StubLLM
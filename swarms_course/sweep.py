@@ -0,0 +1,140 @@
+"""Run one task across a grid of agent configurations concurrently.
+
+Agent runs spend nearly all of their time waiting on the model, so a
+sweep over temperatures or loop counts does not need to run one
+configuration after another. ``sweep`` builds one agent per
+configuration and fans the runs out over a bounded thread pool.
+
+    report = sweep(
+        "Suggest a marketing strategy for a new product.",
+        {"temperature": [0.1, 0.5, 0.9], "max_loops": [1]},
+        llm=llm,
+    )
+    print(report.summary())
+"""
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from swarms_course.stats import LatencyStats
+
+
+def expand_grid(grid):
+    """Expand a grid into a list of configuration dicts
+
+    ``grid`` is either a mapping of parameter name to candidate values,
+    expanded as a cartesian product in key order, or an explicit list of
+    configuration dicts, returned unchanged.
+    """
+    if isinstance(grid, dict):
+        keys = list(grid)
+        return [
+            dict(zip(keys, values))
+            for values in itertools.product(*(grid[k] for k in keys))
+        ]
+    return [dict(config) for config in grid]
+
+
+def default_agent_name(config):
+    return "sweep-" + "-".join(f"{k}-{v}" for k, v in config.items())
+
+
+@dataclass
+class SweepResult:
+    """Outcome of one configuration's run"""
+
+    config: Dict[str, Any]
+    response: Any = None
+    seconds: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclass
+class SweepReport:
+    """All results, in grid order, plus timing for the whole sweep"""
+
+    results: List[SweepResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def latency(self):
+        return LatencyStats.from_values(r.seconds for r in self.results)
+
+    @property
+    def speedup(self):
+        """Serial time (sum of run latencies) over actual wall time"""
+        serial = sum(r.seconds for r in self.results)
+        return serial / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self):
+        errors = sum(not r.ok for r in self.results)
+        return (
+            f"{len(self.results)} runs in {self.wall_seconds:.2f}s"
+            f" ({self.speedup:.1f}x vs serial, {errors} errors);"
+            f" latency {self.latency}"
+        )
+
+
+def sweep(
+    task: str,
+    grid,
+    llm: Any = None,
+    agent_factory: Optional[Callable[..., Any]] = None,
+    max_workers: int = 4,
+    pool: Any = None,
+) -> SweepReport:
+    """Run ``task`` once per configuration in ``grid`` on a thread pool
+
+    Args:
+        task (str): The task every agent runs.
+        grid: Parameter grid, see ``expand_grid``.
+        llm: Model shared by the default agent factory.
+        agent_factory: ``factory(**config)`` returning an object with a
+            ``run(task)`` method. Defaults to a swarms ``Agent`` built
+            from ``llm`` and the configuration.
+        max_workers (int): Upper bound on concurrent runs.
+        pool (AgentPool): Lease agents from this pool instead of
+            building them, so repeated sweeps reuse warmed agents.
+
+    Returns:
+        SweepReport: Results in grid order. A run that raises records
+        its exception instead of aborting the sweep.
+    """
+    if agent_factory is None:
+        from swarms import Agent
+
+        def agent_factory(**config):
+            config.setdefault("agent_name", default_agent_name(config))
+            return Agent(llm=llm, **config)
+
+    configs = expand_grid(grid)
+
+    def run_one(config):
+        result = SweepResult(config=config)
+        start = time.perf_counter()
+        try:
+            if pool is not None:
+                config = {"agent_name": default_agent_name(config), **config}
+                result.response = pool.run(task, **config)
+            else:
+                agent = agent_factory(**dict(config))
+                result.response = agent.run(task)
+        except Exception as error:
+            result.error = error
+        result.seconds = time.perf_counter() - start
+        return result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(configs) or 1))
+    ) as executor:
+        results = list(executor.map(run_one, configs))
+    return SweepReport(
+        results=results, wall_seconds=time.perf_counter() - start
+    )
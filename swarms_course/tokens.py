@@ -0,0 +1,174 @@
+"""Incremental token accounting for an agent's conversation.
+
+``Agent.check_available_tokens`` renders the whole short-term memory and
+re-tokenizes it on every call, so asking "how much budget is left?"
+costs O(history). ``TokenCounter`` tokenizes each message once and
+keeps a running total per message. It swaps the conversation's history
+for a ``MessageLog``, which reports in-place edits (evictions,
+replacements) with the first position they touch, so a query costs
+nothing when the history is unchanged, only counts the new messages
+after appends, and re-adds cached counts from the first edited message
+after anything else.
+
+    budget = track_tokens(agent)
+    agent.run("Summarise the account history")
+    print(budget.used, budget.remaining)
+
+Counts are per rendered message (``"role: content\\n\\n"``, as in
+``Conversation.return_history_as_string``), so the total can differ from
+tokenizing the joined history by a token at some message boundaries.
+Messages are tracked by identity: replacing one in the history is
+picked up, but editing a message's content in place is not.
+"""
+from array import array
+from typing import Any, Callable
+
+from swarms_course.conversation import MessageLog
+
+
+def render_message(message):
+    return f"{message['role']}: {message['content']}\n\n"
+
+
+def token_count_fn(tokenizer) -> Callable[[str], int]:
+    """Return a ``text -> token count`` function for ``tokenizer``
+
+    Accepts a tiktoken ``Encoding``, a swarms ``TikTokenizer`` (whose
+    encoding is used directly, skipping its per-call thread pool), any
+    object with ``count_tokens``, or a plain callable.
+    """
+    encoding = getattr(tokenizer, "encoding", tokenizer)
+    if hasattr(encoding, "encode"):
+        encode = encoding.encode
+        return lambda text: len(encode(text))
+    if hasattr(tokenizer, "count_tokens"):
+        return tokenizer.count_tokens
+    if callable(tokenizer):
+        return tokenizer
+    raise TypeError(f"cannot count tokens with {tokenizer!r}")
+
+
+class TokenCounter:
+    """Running token total for a conversation's message list
+
+    Args:
+        conversation: A swarms ``Conversation`` (anything with a
+            ``conversation_history`` list of role/content dicts). Its
+            history becomes a ``MessageLog``; edit it through
+            ``conversation.conversation_history`` rather than a
+            reference taken before the counter was attached.
+        tokenizer: See ``token_count_fn``.
+        context_length (int): Budget that ``remaining`` is measured
+            against.
+    """
+
+    def __init__(
+        self,
+        conversation: Any,
+        tokenizer: Any,
+        context_length: int = 8192,
+    ):
+        self.conversation = conversation
+        self.count = token_count_fn(tokenizer)
+        self.context_length = context_length
+        self.tokenized = 0
+        # id(message) -> (message, tokens); holding the message keeps its
+        # id from being reused while it is cached
+        self._counts = {}
+        # Running total after each synced message
+        self._totals = array("q")
+        self._history = None
+        self._attach()
+
+    def _attach(self):
+        """Observe the conversation's current history list"""
+        if self._history is not None and self in self._history.owners:
+            self._history.owners.remove(self)
+        history = self.conversation.conversation_history
+        if not isinstance(history, MessageLog):
+            self.conversation.conversation_history = MessageLog(history)
+            history = self.conversation.conversation_history
+        history.owners.append(self)
+        self._history = history
+        del self._totals[:]
+
+    def _invalidate(self, index):
+        """Forget the totals from message ``index`` on"""
+        del self._totals[index:]
+
+    def tokens(self, message):
+        """Token count of one message, tokenized at most once"""
+        entry = self._counts.get(id(message))
+        if entry is not None and entry[0] is message:
+            return entry[1]
+        tokens = self.count(render_message(message))
+        self.tokenized += 1
+        self._counts[id(message)] = (message, tokens)
+        return tokens
+
+    def sync(self):
+        """Bring the total up to date with the conversation"""
+        if self.conversation.conversation_history is not self._history:
+            # The conversation swapped its list (clear, load, restore)
+            self._attach()
+        history = self._history
+        totals = self._totals
+        synced = len(totals)
+        if synced == len(history):
+            return
+        total = totals[-1] if synced else 0
+        for index in range(synced, len(history)):
+            total += self.tokens(history[index])
+            totals.append(total)
+        if len(self._counts) > 2 * len(history) + 64:
+            # Drop counts for messages no longer in the history
+            live = {id(m) for m in history}
+            self._counts = {
+                key: entry
+                for key, entry in self._counts.items()
+                if key in live
+            }
+
+    def removed(self, message):
+        """Drop the cached count of ``message``, taken out of the history
+
+        The history reports the edit itself; this only frees the entry
+        before the next prune.
+        """
+        entry = self._counts.get(id(message))
+        if entry is not None and entry[0] is message:
+            del self._counts[id(message)]
+
+    def inserted(self, message):
+        """Count ``message``, added to the history, ahead of the next sync"""
+        self.tokens(message)
+
+    @property
+    def used(self) -> int:
+        self.sync()
+        return self._totals[-1] if self._totals else 0
+
+    @property
+    def remaining(self) -> int:
+        return self.context_length - self.used
+
+    def __repr__(self):
+        return (
+            f"TokenCounter(used={self.used},"
+            f" remaining={self.remaining},"
+            f" context_length={self.context_length})"
+        )
+
+
+def track_tokens(agent) -> TokenCounter:
+    """Attach a ``TokenCounter`` to ``agent`` and return it
+
+    The agent's ``check_available_tokens`` is rebound to the counter, so
+    existing callers get the cached total instead of a full re-count.
+    """
+    counter = TokenCounter(
+        agent.short_memory, agent.tokenizer, agent.context_length
+    )
+    agent.token_counter = counter
+    agent.check_available_tokens = lambda: counter.used
+    return counter
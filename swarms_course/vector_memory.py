@@ -0,0 +1,374 @@
+"""Offline long-term memory: embeddings in NumPy, persisted with memmap.
+
+``VectorMemory`` stores each memory's text next to a row of a float32
+embedding matrix and answers "which memories are relevant to this
+task?" with a top-k similarity search. Searches are exact until
+``build_index`` trains an IVF index (k-means centroids, one inverted
+list per centroid); then a query scores only the ``nprobe`` closest
+lists. Memories added after the index was built are scanned exactly
+until the next rebuild.
+
+It implements the ``query(task)`` method swarms agents call on their
+``long_term_memory``, so an agent retrieves the top-k memories for each
+task instead of carrying the whole history in its prompt:
+
+    memory = VectorMemory("agent_memory")
+    memory.add("Customer 12345 is on the Enterprise Suite annual plan")
+    agent = Agent(llm=llm, long_term_memory=memory)
+
+With a ``path`` everything lives in that directory: vectors in a
+memory-mapped ``vectors.f32``, texts in ``texts.bin`` with byte offsets
+in ``offsets.u64``, and the index in ``ivf_*.npy``. Nothing is read
+into memory up front. The default embedder hashes words and word pairs
+into ``dim`` buckets, which needs no model download; pass any
+``embedder(texts) -> array`` for real embeddings.
+"""
+import json
+import mmap
+import os
+import re
+import threading
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+
+WORD = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words and word pairs, L2 normalised"""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def features(self, text):
+        words = WORD.findall(text.lower())
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def __call__(self, texts: Iterable[str]) -> np.ndarray:
+        texts = list(texts)
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self.features(text):
+                h = zlib.crc32(feature.encode())
+                sign = 1.0 if h & 0x80000000 else -1.0
+                vectors[row, h % self.dim] += sign
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+@dataclass
+class Hit:
+    """One search result; ``score`` is the inner product with the query"""
+
+    index: int
+    score: float
+    text: str
+
+
+def top_k(scores, k):
+    """Positions of the ``k`` largest ``scores``, best first"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    best = np.argpartition(-scores, k - 1)[:k]
+    return best[np.argsort(-scores[best])]
+
+
+def kmeans(vectors, clusters, iterations=10, seed=0):
+    """Spherical k-means (inner product) on the rows of ``vectors``"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[
+        rng.choice(len(vectors), clusters, replace=False)
+    ].copy()
+    for _ in range(iterations):
+        assignment = assign(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        counts = np.bincount(assignment, minlength=clusters)
+        empty = counts == 0
+        # Reseed empty clusters from random points
+        sums[empty] = vectors[rng.choice(len(vectors), empty.sum())]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.maximum(norms, 1e-12)
+    return centroids.astype(np.float32)
+
+
+def assign(vectors, centroids, chunk=65536):
+    """Index of the most similar centroid for each row, in chunks"""
+    out = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk):
+        block = np.asarray(vectors[start : start + chunk])
+        out[start : start + chunk] = np.argmax(block @ centroids.T, axis=1)
+    return out
+
+
+class VectorMemory:
+    """Top-k retrievable long-term memory, in memory or in a directory
+
+    Args:
+        path (str): Directory to persist to; reopened if it exists.
+        dim (int): Embedding size (ignored when reopening).
+        embedder: ``embedder(texts) -> (n, dim) array``; defaults to
+            ``HashingEmbedder(dim)``. Vectors should be L2 normalised.
+        nprobe (int): Inverted lists scanned per query once indexed.
+        k (int): Results returned by ``query``.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        dim: int = 256,
+        embedder: Optional[Callable[[List[str]], np.ndarray]] = None,
+        nprobe: int = 8,
+        k: int = 5,
+    ):
+        self.path = path
+        self.nprobe = nprobe
+        self.k = k
+        self._lock = threading.RLock()
+        self._count = 0
+        self._capacity = 0
+        self._vectors = None
+        self._offsets = array("Q", [0])
+        self._texts = bytearray()
+        self._text_file = None
+        self._text_map = None
+        self._centroids = None
+        self._order = None
+        self._list_offsets = None
+        self._indexed = 0
+        meta = self._file("meta.json")
+        if meta and os.path.exists(meta):
+            with open(meta) as f:
+                dim = json.load(f)["dim"]
+        self.dim = dim
+        self.embedder = embedder or HashingEmbedder(dim)
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            self._open()
+
+    # -- storage ---------------------------------------------------------
+
+    def _file(self, name):
+        return os.path.join(self.path, name) if self.path else None
+
+    def _open(self):
+        meta = self._file("meta.json")
+        if os.path.exists(meta):
+            with open(meta) as f:
+                info = json.load(f)
+            self._count = info["count"]
+            self._indexed = info.get("indexed", 0)
+            with open(self._file("offsets.u64"), "rb") as f:
+                self._offsets = array("Q")
+                self._offsets.frombytes(f.read())
+            del self._offsets[self._count + 1 :]
+            if self._indexed:
+                self._centroids = np.load(self._file("ivf_centroids.npy"))
+                self._order = np.load(
+                    self._file("ivf_order.npy"), mmap_mode="r"
+                )
+                self._list_offsets = np.load(
+                    self._file("ivf_offsets.npy")
+                )
+        self._grow(max(self._count, 1024))
+        self._text_file = open(self._file("texts.bin"), "a+b")
+        self._text_file.truncate(self._offsets[-1])
+
+    def _grow(self, needed):
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, 2 * self._capacity, 1024)
+        if self.path is None:
+            vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+            if self._vectors is not None:
+                vectors[: self._count] = self._vectors[: self._count]
+        else:
+            name = self._file("vectors.f32")
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._vectors = None
+            with open(name, "ab") as f:
+                f.truncate(max(os.path.getsize(name), capacity * self.dim * 4))
+            vectors = np.memmap(
+                name, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+            )
+        self._vectors = vectors
+        self._capacity = capacity
+
+    def text(self, index: int) -> str:
+        """Text of memory ``index``"""
+        start, end = self._offsets[index], self._offsets[index + 1]
+        if start == end:
+            return ""
+        if self.path is None:
+            return self._texts[start:end].decode()
+        if self._text_map is None or len(self._text_map) < end:
+            self._text_file.flush()
+            self._text_map = mmap.mmap(
+                self._text_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return self._text_map[start:end].decode()
+
+    def __len__(self):
+        return self._count
+
+    # -- writing ---------------------------------------------------------
+
+    def add(self, text: str, vector=None) -> int:
+        """Store one memory and return its index"""
+        vectors = None if vector is None else np.asarray(vector)[None]
+        return self.add_many([text], vectors)[0]
+
+    def add_many(self, texts, vectors=None) -> range:
+        """Store many memories; embeds ``texts`` unless ``vectors`` given"""
+        texts = list(texts)
+        if vectors is None:
+            vectors = self.embedder(texts)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.shape != (len(texts), self.dim):
+            raise ValueError(
+                f"expected vectors of shape {(len(texts), self.dim)},"
+                f" got {vectors.shape}"
+            )
+        encoded = [t.encode() for t in texts]
+        with self._lock:
+            start = self._count
+            self._grow(start + len(texts))
+            self._vectors[start : start + len(texts)] = vectors
+            end = self._offsets[-1]
+            for data in encoded:
+                end += len(data)
+                self._offsets.append(end)
+            blob = b"".join(encoded)
+            if self.path is None:
+                self._texts += blob
+            else:
+                self._text_file.write(blob)
+            self._count += len(texts)
+        return range(start, start + len(texts))
+
+    def flush(self):
+        """Persist everything added so far (a no-op in memory)"""
+        if self.path is None:
+            return
+        with self._lock:
+            self._vectors.flush()
+            self._text_file.flush()
+            with open(self._file("offsets.u64"), "wb") as f:
+                f.write(self._offsets.tobytes())
+            tmp = self._file("meta.json.tmp")
+            with open(tmp, "w") as f:
+                json.dump(
+                    {
+                        "dim": self.dim,
+                        "count": self._count,
+                        "indexed": self._indexed,
+                    },
+                    f,
+                )
+            os.replace(tmp, self._file("meta.json"))
+
+    def close(self):
+        if self.path is not None and self._text_file is not None:
+            self.flush()
+            self._text_file.close()
+            self._text_file = None
+            self._text_map = None
+            self._vectors = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- index -----------------------------------------------------------
+
+    def build_index(
+        self,
+        nlist: Optional[int] = None,
+        sample: int = 65536,
+        iterations: int = 10,
+        seed: int = 0,
+    ):
+        """Train the IVF index over every memory stored so far
+
+        ``nlist`` defaults to about sqrt(n) lists, and k-means trains on a
+        random ``sample`` of the vectors. Raises ``ValueError`` when no
+        memories are stored yet.
+        """
+        with self._lock:
+            count = self._count
+            if count == 0:
+                raise ValueError("cannot build an index over no memories")
+            vectors = self._vectors[:count]
+            nlist = nlist or max(1, int(np.sqrt(count)))
+            rng = np.random.default_rng(seed)
+            rows = rng.choice(count, min(sample, count), replace=False)
+            centroids = kmeans(
+                np.asarray(vectors[np.sort(rows)]),
+                min(nlist, len(rows)),
+                iterations=iterations,
+                seed=seed,
+            )
+            assignment = assign(vectors, centroids)
+            order = np.argsort(assignment, kind="stable").astype(np.int64)
+            offsets = np.zeros(len(centroids) + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(assignment, minlength=len(centroids)),
+                out=offsets[1:],
+            )
+            self._centroids, self._order = centroids, order
+            self._list_offsets, self._indexed = offsets, count
+            if self.path is not None:
+                np.save(self._file("ivf_centroids.npy"), centroids)
+                np.save(self._file("ivf_order.npy"), order)
+                np.save(self._file("ivf_offsets.npy"), offsets)
+                self.flush()
+
+    # -- reading ---------------------------------------------------------
+
+    def _candidates(self, query, nprobe):
+        lists = top_k(self._centroids @ query, nprobe)
+        starts = self._list_offsets[lists]
+        ends = self._list_offsets[lists + 1]
+        parts = [self._order[s:e] for s, e in zip(starts, ends)]
+        parts.append(np.arange(self._indexed, self._count))
+        return np.concatenate(parts)
+
+    def search_vector(self, query, k=None, exact=False, nprobe=None):
+        """Top-k ``(index, score)`` pairs for an embedded query"""
+        k = k or self.k
+        query = np.asarray(query, dtype=np.float32)
+        count = self._count
+        if count == 0:
+            return []
+        if exact or self._centroids is None:
+            scores = np.asarray(self._vectors[:count] @ query)
+            best = top_k(scores, k)
+            return [(int(i), float(scores[i])) for i in best]
+        candidates = self._candidates(query, nprobe or self.nprobe)
+        candidates.sort()
+        scores = np.asarray(self._vectors[candidates] @ query)
+        best = top_k(scores, k)
+        return [(int(candidates[i]), float(scores[i])) for i in best]
+
+    def search(self, text: str, k=None, exact=False, nprobe=None):
+        """Top-k memories most similar to ``text``, best first"""
+        query = self.embedder([text])[0]
+        return [
+            Hit(index, score, self.text(index))
+            for index, score in self.search_vector(
+                query, k, exact=exact, nprobe=nprobe
+            )
+        ]
+
+    def query(self, task: str, *args, k=None, **kwargs) -> str:
+        """Relevant memories for ``task`` as text, for swarms agents"""
+        hits = self.search(task, k=k)
+        return "\n".join(f"- {hit.text}" for hit in hits)
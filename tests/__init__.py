@@ -0,0 +1,20 @@
+"""Unit tests for the swarms_course helpers.
+
+Run from the repository root with ``python -m pytest tests`` or
+``python -m unittest discover -s tests -t .``.
+"""
+import swarms.structs.agent
+from swarms import Agent
+
+
+class WordTokenizer:
+    """Counts words; stands in for TikTokenizer, which downloads its
+    encoding the first time an Agent is built"""
+
+    def count_tokens(self, string):
+        return len(str(string).split())
+
+
+# Agent.run reports to swarms.world on every run; tests stay offline
+Agent.log_agent_data = lambda self, *args, **kwargs: None
+swarms.structs.agent.TikTokenizer = WordTokenizer
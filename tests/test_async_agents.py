@@ -0,0 +1,94 @@
+"""Tests for running swarms agents as coroutines."""
+import asyncio
+import contextlib
+import io
+import unittest
+
+from swarms import Agent
+
+from swarms_course.async_agents import arun_agent
+from swarms_course.stub_llm import StubLLM
+from swarms_course.vector_memory import VectorMemory
+
+TASK = "Which plan is customer 12345 on, and when does it renew?"
+
+
+class FailingLLM:
+    """Raises on every call, like an endpoint that is down"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def run(self, task, *args, **kwargs):
+        self.calls += 1
+        raise ConnectionError("endpoint unavailable")
+
+    __call__ = run
+
+
+def build_agent(llm, **config):
+    memory = VectorMemory(dim=64)
+    memory.add_many(
+        [
+            "Customer 12345 is on the Enterprise Suite annual plan",
+            "The Enterprise Suite renews every March",
+        ]
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Agent(
+            llm=llm,
+            agent_name="parity-agent",
+            system_prompt="You answer account questions.",
+            max_loops=3,
+            long_term_memory=memory,
+            rag_every_loop=True,
+            retry_attempts=2,
+            **config,
+        )
+
+
+def history(agent):
+    return [
+        (message["role"], message["content"])
+        for message in agent.short_memory.conversation_history
+    ]
+
+
+def run_both(make_llm, **config):
+    """Run the same task through ``run`` and ``arun_agent`` on twin agents"""
+    sync_agent = build_agent(make_llm(), **config)
+    async_agent = build_agent(make_llm(), **config)
+    with contextlib.redirect_stdout(io.StringIO()):
+        sync_result = sync_agent.run(TASK)
+        async_result = asyncio.run(arun_agent(async_agent, TASK))
+    return sync_agent, sync_result, async_agent, async_result
+
+
+class ArunAgentTest(unittest.TestCase):
+    def test_matches_run(self):
+        sync_agent, sync_result, async_agent, async_result = run_both(
+            StubLLM
+        )
+        self.assertEqual(async_result, sync_result)
+        self.assertEqual(history(async_agent), history(sync_agent))
+        # rag_every_loop queried the memory on every loop, on both paths
+        roles = [role for role, _ in history(async_agent)]
+        self.assertEqual(roles.count("Database"), 4)
+        self.assertEqual(async_agent.agent_output.task, TASK)
+        self.assertEqual(
+            async_agent.agent_output.full_history,
+            sync_agent.agent_output.full_history,
+        )
+
+    def test_gives_up_like_run(self):
+        sync_agent, sync_result, async_agent, async_result = run_both(
+            FailingLLM
+        )
+        self.assertEqual(async_result, sync_result)
+        self.assertEqual(async_result, "")
+        self.assertEqual(history(async_agent), history(sync_agent))
+        self.assertEqual(async_agent.llm.calls, sync_agent.llm.calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for the concurrent batch runners."""
+import asyncio
+import gc
+import time
+import unittest
+
+from swarms_course.batch import arun_batch, run_batch
+
+
+def fail_on_three(task):
+    if task == 3:
+        raise ValueError("bad task")
+    return task * 2
+
+
+class RunBatchTest(unittest.TestCase):
+    def test_every_task_reports_once(self):
+        results = list(run_batch(fail_on_three, range(10), max_concurrency=3))
+        self.assertEqual(sorted(r.index for r in results), list(range(10)))
+        by_index = {r.index: r for r in results}
+        self.assertIsInstance(by_index[3].error, ValueError)
+        self.assertEqual(by_index[4].response, 8)
+        self.assertTrue(all(r.ok for i, r in by_index.items() if i != 3))
+
+    def test_concurrency_is_bounded(self):
+        running = []
+        peak = []
+
+        def slow(task):
+            running.append(task)
+            peak.append(len(running))
+            time.sleep(0.01)
+            running.remove(task)
+
+        list(run_batch(slow, range(20), max_concurrency=4))
+        self.assertLessEqual(max(peak), 4)
+
+    def test_timeout_is_reported(self):
+        results = list(
+            run_batch(lambda t: time.sleep(t), [0.5, 0.0], timeout=0.1)
+        )
+        by_index = {r.index: r for r in results}
+        self.assertIsInstance(by_index[0].error, TimeoutError)
+        self.assertTrue(by_index[1].ok)
+
+    def test_timed_out_run_keeps_its_slot(self):
+        started = {}
+
+        def sleep(t):
+            started[t] = time.perf_counter()
+            time.sleep(t)
+
+        results = list(
+            run_batch(sleep, [0.4, 0.05], max_concurrency=1, timeout=0.2)
+        )
+        by_index = {r.index: r for r in results}
+        self.assertIsInstance(by_index[0].error, TimeoutError)
+        # The second task waited for the stuck thread, not its deadline
+        self.assertTrue(by_index[1].ok)
+        self.assertGreaterEqual(started[0.05] - started[0.4], 0.35)
+
+
+class ArunBatchTest(unittest.TestCase):
+    def test_async_agent(self):
+        async def double(task):
+            await asyncio.sleep(0)
+            return task * 2
+
+        async def collect():
+            return [r async for r in arun_batch(double, range(10))]
+
+        results = asyncio.run(collect())
+        self.assertEqual(
+            sorted(r.response for r in results), [i * 2 for i in range(10)]
+        )
+
+    def test_finished_tasks_are_released(self):
+        async def echo(task):
+            await asyncio.sleep(0)
+            return task
+
+        def finished_tasks():
+            gc.collect()
+            return sum(
+                type(o) is asyncio.Task and o.done()
+                for o in gc.get_objects()
+            )
+
+        async def consume():
+            seen = 0
+            async for _ in arun_batch(echo, range(500), max_concurrency=4):
+                seen += 1
+                if seen == 400:
+                    return finished_tasks()
+
+        self.assertLess(asyncio.run(consume()), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
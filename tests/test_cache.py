@@ -0,0 +1,87 @@
+"""Tests for the response cache tiers."""
+import os
+import tempfile
+import time
+import unittest
+
+from swarms_course.cache import ResponseCache, cache_responses
+from swarms_course.stub_llm import StubLLM
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "responses.sqlite")
+
+    def test_memory_tier_is_lru(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "first")
+        cache.put("b", "second")
+        self.assertEqual(cache.get("a"), "first")
+        cache.put("c", "third")  # evicts "b", the least recently used
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "first")
+        self.assertEqual(cache.get("c"), "third")
+        self.assertEqual(cache.stats.memory_hits, 3)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_disk_tier_survives_restart(self):
+        cache = ResponseCache(self.path, max_entries=1)
+        cache.put("a", {"answer": "first"}, seconds=1.5)
+        cache.put("b", "second")
+        # "a" fell out of the memory tier but is still on disk
+        self.assertEqual(cache.get("a"), {"answer": "first"})
+        self.assertEqual(cache.stats.disk_hits, 1)
+        self.assertEqual(cache.stats.saved_seconds, 1.5)
+        cache.close()
+
+        reopened = ResponseCache(self.path)
+        self.assertEqual(reopened.get("b"), "second")
+        self.assertEqual(reopened.get("b"), "second")
+        self.assertEqual(reopened.stats.disk_hits, 1)
+        self.assertEqual(reopened.stats.memory_hits, 1)
+        reopened.close()
+
+    def test_entries_expire(self):
+        cache = ResponseCache(self.path, ttl=0.05)
+        cache.put("a", "stale")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("a"))
+        cache.purge()
+        cache.close()
+        self.assertIsNone(ResponseCache(self.path).get("a"))
+
+    def test_cached_llm_respects_threshold(self):
+        llm = cache_responses(StubLLM(temperature=0.0), self.path)
+        first = llm.run("Summarise ticket 1")
+        self.assertEqual(llm.run("Summarise ticket 1"), first)
+        self.assertEqual(llm.llm.calls, 1)
+        self.assertEqual(llm.stats.hits, 1)
+
+        llm.temperature = 0.9  # set through to the model, as agents do
+        llm.run("Summarise ticket 1")
+        llm.run("Summarise ticket 1")
+        self.assertEqual(llm.llm.calls, 3)
+        self.assertEqual(llm.stats.bypassed, 2)
+
+    def test_unknown_temperature_is_not_cached(self):
+        stub = StubLLM()
+        del stub.temperature
+        llm = cache_responses(stub)
+        llm.run("Summarise ticket 1")
+        llm.run("Summarise ticket 1")
+        # Not replayed in one chunk either
+        self.assertGreater(len(list(llm.stream("Summarise ticket 1"))), 1)
+        self.assertEqual(stub.calls, 3)
+        self.assertEqual((llm.stats.hits, llm.stats.bypassed), (0, 3))
+
+    def test_stream_replays_cached_response(self):
+        llm = cache_responses(StubLLM(temperature=0.0))
+        streamed = "".join(llm.stream("Draft a reply"))
+        self.assertEqual(list(llm.stream("Draft a reply")), [streamed])
+        self.assertEqual(llm.llm.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+"""Tests for the checkpoint log and agent resume."""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from swarms_course.checkpoint import (
+    MAGIC,
+    CheckpointLog,
+    aresume,
+    checkpoint,
+    replay,
+    resume,
+)
+from swarms_course.conversation import Message
+from swarms_course.stub_llm import StubLLM
+
+
+def as_tuples(history):
+    return [
+        (m["role"], m["content"], getattr(m, "time", None))
+        if isinstance(m, Message)
+        else (m["role"], m["content"], m.get("timestamp"))
+        for m in history
+    ]
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class Crash(BaseException):
+    pass
+
+
+class CrashAfter(StubLLM):
+    def __init__(self, calls):
+        super().__init__()
+        self.left = calls
+
+    def run(self, task, *args, **kwargs):
+        if self.left == 0:
+            raise Crash()
+        self.left -= 1
+        return super().run(task, *args, **kwargs)
+
+    __call__ = run
+
+
+class CheckpointLogTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, "agent.ckpt")
+
+    def open_log(self, **options):
+        log = CheckpointLog(self.path, **options)
+        self.addCleanup(log.close)
+        return log
+
+    def test_appends_replay(self):
+        log = self.open_log()
+        log.start_run("Reconcile invoices", 3)
+        history = [{"role": "System: ", "content": "Be brief."}]
+        for loop in range(3):
+            history.append(
+                {"role": "agent", "content": f"step {loop}", "timestamp": "t"}
+            )
+            history.append(Message("Tool Executor", {"rows": loop}, 1.5))
+            log.commit(history, loop + 1, done=loop == 2)
+        state = log.load()
+        self.assertEqual(state.messages, as_tuples(history))
+        self.assertEqual(state.task, "Reconcile invoices")
+        self.assertEqual(state.max_loops, 3)
+        self.assertEqual(state.loop, 3)
+        self.assertTrue(state.done)
+        self.assertEqual(state.tool_results, [{"rows": i} for i in range(3)])
+        self.assertEqual(log.stats.appended, 7)
+
+    def test_torn_tail_is_dropped(self):
+        log = self.open_log()
+        log.start_run("task", 5)
+        history = [{"role": "User", "content": "hello"}]
+        log.commit(history, 1)
+        committed = read(self.path)
+        history.append({"role": "agent", "content": "half written"})
+        log.commit(history, 2)
+        log.close()
+        # Cut the second commit short, as a crash mid-write would
+        with open(self.path, "r+b") as f:
+            f.truncate(len(read(self.path)) - 3)
+
+        state, end = replay(read(self.path))
+        self.assertEqual(end, len(committed))
+        self.assertEqual(state.loop, 1)
+        self.assertEqual(state.messages, as_tuples(history[:1]))
+        reopened = self.open_log()
+        self.assertEqual(os.path.getsize(self.path), len(committed))
+        self.assertEqual(reopened.loop, 1)
+
+    def test_corrupt_record_is_dropped(self):
+        log = self.open_log()
+        log.start_run("task", 5)
+        history = [{"role": "User", "content": "hello"}]
+        log.commit(history, 1)
+        size = log.size
+        history.append({"role": "agent", "content": "flipped"})
+        log.commit(history, 2)
+        data = bytearray(read(self.path))
+        data[size + 8] ^= 0xFF
+        self.assertEqual(replay(bytes(data))[0].loop, 1)
+
+    def test_splices_replay(self):
+        log = self.open_log(min_compact_bytes=1 << 30)
+        log.start_run("task", 10)
+        history = [{"role": "System: ", "content": "pinned"}]
+        history += [{"role": "User", "content": f"turn {i}"} for i in range(6)]
+        log.commit(history, 1)
+        # Evict three turns behind the pinned message and fold them into
+        # a summary, as bound_memory does, then keep appending
+        del history[1:4]
+        history.insert(1, {"role": "Summary", "content": "turns 0-2"})
+        history.append({"role": "User", "content": "turn 6"})
+        log.commit(history, 2)
+        history[1] = {"role": "Summary", "content": "turns 0-3"}
+        del history[2]
+        log.commit(history, 3)
+        history[-1] = {"role": "User", "content": "truncated"}
+        log.commit(history, 4)
+        del history[3:]
+        log.commit(history, 5)
+        # Tail replacement and truncation are spliced, not rewritten
+        self.assertEqual(log.stats.spliced, 4)
+        self.assertEqual(log.stats.compactions, 0)
+        self.assertEqual(log.load().messages, as_tuples(history))
+        self.assertEqual(log.load().loop, 5)
+
+    def test_compaction_keeps_state(self):
+        log = self.open_log(min_compact_bytes=0, compact_ratio=2.0)
+        log.start_run("task", 100)
+        history = [{"role": "System: ", "content": "pinned"}]
+        for loop in range(50):
+            history.append({"role": "User", "content": "x" * 200})
+            if len(history) > 4:
+                del history[1:3]
+                history.insert(1, {"role": "Summary", "content": str(loop)})
+            log.commit(history, loop)
+        self.assertGreater(log.stats.compactions, 0)
+        self.assertLess(os.path.getsize(self.path), 4 * 300 * 2)
+        self.assertEqual(log.load().messages, as_tuples(history))
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    def test_reused_file_starts_over(self):
+        log = self.open_log()
+        log.start_run("first", 2)
+        log.commit([{"role": "User", "content": "old"}], 2, done=True)
+        log.close()
+        log = self.open_log()
+        log.start_run("second", 2)
+        log.commit([{"role": "User", "content": "new"}], 0)
+        state = log.load()
+        self.assertEqual(state.task, "second")
+        self.assertEqual(state.messages, [("User", "new", None)])
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a checkpoint log")
+        with self.assertRaises(ValueError):
+            CheckpointLog(self.path)
+        self.assertEqual(replay(MAGIC)[0].messages, [])
+
+
+class ResumeTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, "agent.ckpt")
+
+    def agent(self, llm):
+        from swarms import Agent
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            return Agent(
+                llm=llm,
+                agent_name="researcher",
+                max_loops=4,
+                workspace_dir=self.directory,
+            )
+
+    def test_resume_after_crash(self):
+        crashing = self.agent(CrashAfter(calls=2))
+        log = checkpoint(crashing, self.path)
+        self.addCleanup(log.close)
+        with self.assertRaises(Crash), contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            crashing.run("Research note-taking tools")
+        self.assertEqual(log.load().loop, 2)
+
+        resumed = self.agent(StubLLM())
+        log = checkpoint(resumed, self.path)
+        self.addCleanup(log.close)
+        with contextlib.redirect_stdout(io.StringIO()):
+            remaining = resume(resumed)
+        state = log.load()
+        self.assertEqual((state.loop, state.done), (4, True))
+        history = resumed.short_memory.conversation_history
+        self.assertEqual(state.messages, as_tuples(history))
+        # Task plus one response per loop after the system prompt
+        self.assertEqual(len(history), 1 + 1 + 4)
+        self.assertTrue(remaining)
+        self.assertEqual(resumed.llm.calls, 2)
+
+    def test_finished_run_has_nothing_to_resume(self):
+        import asyncio
+
+        agent = self.agent(StubLLM())
+        log = checkpoint(agent, self.path)
+        self.addCleanup(log.close)
+        with contextlib.redirect_stdout(io.StringIO()):
+            agent.run("Research note-taking tools")
+        self.assertTrue(log.load().done)
+        fresh = self.agent(StubLLM())
+        self.addCleanup(checkpoint(fresh, self.path).close)
+        self.assertIsNone(asyncio.run(aresume(fresh)))
+        self.assertEqual(
+            len(fresh.short_memory.conversation_history), 1 + 1 + 4
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
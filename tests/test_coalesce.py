@@ -0,0 +1,114 @@
+"""Tests for coalescing identical model calls in flight."""
+import asyncio
+import threading
+import time
+import unittest
+
+from swarms_course.coalesce import CoalescingLLM
+from swarms_course.stub_llm import StubLLM
+
+CALLERS = 5
+
+
+def in_threads(fn):
+    """Call ``fn`` from ``CALLERS`` threads at once; their results"""
+    results = [None] * CALLERS
+    barrier = threading.Barrier(CALLERS)
+
+    def worker(index):
+        barrier.wait()
+        results[index] = fn()
+
+    threads = [
+        threading.Thread(target=worker, args=(i,)) for i in range(CALLERS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class CoalescingLLMTest(unittest.TestCase):
+    def test_identical_calls_share_one(self):
+        stub = StubLLM(temperature=0.0, latency=0.3)
+        llm = CoalescingLLM(stub)
+        results = in_threads(lambda: llm.run("q"))
+        self.assertEqual(results, [stub.respond("q")] * CALLERS)
+        self.assertEqual(stub.calls, 1)
+        self.assertEqual((llm.stats.calls, llm.stats.upstream), (CALLERS, 1))
+
+    def test_high_temperature_calls_are_not_coalesced_by_default(self):
+        stub = StubLLM(temperature=0.7, latency=0.1)
+        llm = CoalescingLLM(stub)
+        in_threads(lambda: llm.run("q"))
+        self.assertEqual(stub.calls, CALLERS)
+        self.assertEqual(llm.stats.coalesced, 0)
+
+    def test_threshold_none_coalesces_everything(self):
+        stub = StubLLM(temperature=0.7, latency=0.3)
+        llm = CoalescingLLM(stub, threshold=None)
+        in_threads(lambda: llm.run("q"))
+        self.assertEqual(stub.calls, 1)
+
+    def test_async_calls_share_one(self):
+        stub = StubLLM(temperature=0.0, latency=0.1)
+        llm = CoalescingLLM(stub)
+
+        async def main():
+            return await asyncio.gather(
+                *(llm.arun("q") for _ in range(CALLERS))
+            )
+
+        self.assertEqual(asyncio.run(main()), [stub.respond("q")] * CALLERS)
+        self.assertEqual(stub.calls, 1)
+
+
+class CoalescedStreamTest(unittest.TestCase):
+    def test_waiting_streams_share_the_leader(self):
+        stub = StubLLM(temperature=0.0, latency=0.3, token_latency=0.01)
+        llm = CoalescingLLM(stub)
+        streams = in_threads(lambda: list(llm.stream("q")))
+        for chunks in streams:
+            self.assertEqual("".join(chunks), stub.respond("q"))
+        # One stream went upstream word by word; the rest got one chunk
+        self.assertEqual(sorted(len(c) > 1 for c in streams).count(True), 1)
+        self.assertEqual(stub.calls, 1)
+        self.assertEqual(llm.stats.coalesced, CALLERS - 1)
+
+    def test_high_temperature_streams_pass_through(self):
+        stub = StubLLM(temperature=0.7)
+        llm = CoalescingLLM(stub)
+        self.assertGreater(len(list(llm.stream("q"))), 1)
+        self.assertEqual(llm.stats.calls, 0)
+
+    def test_abandoned_leader_lets_the_others_stream(self):
+        stub = StubLLM(temperature=0.0)
+        llm = CoalescingLLM(stub)
+        leader = llm.stream("q")
+        next(leader)
+        results = []
+        follower = threading.Thread(
+            target=lambda: results.append("".join(llm.stream("q")))
+        )
+        follower.start()
+        while llm.stats.coalesced == 0:
+            time.sleep(0.01)
+        leader.close()
+        follower.join()
+        self.assertEqual(results, [stub.respond("q")])
+        self.assertEqual(stub.calls, 2)
+
+    def test_same_thread_streams_do_not_wait_on_each_other(self):
+        stub = StubLLM(temperature=0.0)
+        llm = CoalescingLLM(stub)
+        pairs = list(zip(llm.stream("q"), llm.stream("q")))
+        self.assertEqual(
+            "".join(a for a, _ in pairs), "".join(b for _, b in pairs)
+        )
+        self.assertEqual(stub.calls, 2)
+        self.assertEqual(llm.stats.coalesced, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
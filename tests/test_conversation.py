@@ -0,0 +1,72 @@
+"""Tests for the compact conversation store."""
+import unittest
+
+from swarms.structs.conversation import Conversation
+
+from swarms_course.conversation import CompactConversation, Message
+
+
+def fill(conversation, turns):
+    for i in range(turns):
+        role = "User" if i % 2 else "enterprise-assistant"
+        conversation.add(role, f"Turn {i}: invoice INV-{i}\nis overdue")
+
+
+class CompactConversationTest(unittest.TestCase):
+    def assertSameRender(self, swarms_store, compact):
+        self.assertEqual(
+            compact.return_history_as_string(),
+            swarms_store.return_history_as_string(),
+        )
+
+    def test_render_matches_conversation(self):
+        for time_enabled in (False, True):
+            swarms_store = Conversation(
+                system_prompt="You are a support assistant.",
+                time_enabled=time_enabled,
+            )
+            compact = CompactConversation(
+                system_prompt="You are a support assistant.",
+                time_enabled=time_enabled,
+            )
+            for turns in (0, 1, 7):
+                fill(swarms_store, turns)
+                fill(compact, turns)
+                if not time_enabled:
+                    self.assertSameRender(swarms_store, compact)
+            # Timestamps are rendered to the second and may straddle one,
+            # so compare a copy carrying the same timestamps instead
+            self.assertSameRender(
+                swarms_store,
+                CompactConversation.from_conversation(swarms_store),
+            )
+
+    def test_render_after_edits(self):
+        swarms_store = Conversation(system_prompt="System prompt")
+        compact = CompactConversation(system_prompt="System prompt")
+        fill(swarms_store, 10)
+        fill(compact, 10)
+        compact.return_history_as_string()
+        for store in (swarms_store, compact):
+            history = store.conversation_history
+            history.pop(3)
+            history.insert(1, {"role": "Summary", "content": "folded"})
+            history[-1] = {"role": "User", "content": "replaced"}
+            del history[5:7]
+        self.assertSameRender(swarms_store, compact)
+        compact.conversation_history.append(Message("User", "appended"))
+        swarms_store.add("User", "appended")
+        self.assertSameRender(swarms_store, compact)
+
+    def test_messages_read_like_dicts(self):
+        compact = CompactConversation(time_enabled=True)
+        compact.add("User", "hello")
+        message = compact.conversation_history[0]
+        self.assertEqual(message["role"], "User")
+        self.assertEqual(message["content"], "hello")
+        self.assertIsInstance(message.time, float)
+        self.assertEqual(len(message.timestamp), len("2024-01-01 00:00:00"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Tests for token-bounded short-term memory."""
+import unittest
+
+from swarms.structs.conversation import Conversation
+
+from swarms_course.memory import (
+    SUMMARY_ROLE,
+    TRUNCATION_MARKER,
+    BoundedMemory,
+)
+from swarms_course.tokens import render_message
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def count_chars(text):
+    """About four characters per token, like English under BPE"""
+    return -(-len(text) // 4)
+
+
+def full_count(conversation, count=count_words):
+    return sum(
+        count(render_message(m)) for m in conversation.conversation_history
+    )
+
+
+class BoundedMemoryTest(unittest.TestCase):
+    def test_history_stays_under_budget(self):
+        conversation = Conversation(system_prompt="Support agent.")
+        memory = BoundedMemory(conversation, count_words, max_tokens=60)
+        for i in range(50):
+            conversation.add("User", f"ticket {i} needs a reply soon")
+            self.assertLessEqual(full_count(conversation), 60)
+            self.assertEqual(memory.counter.used, full_count(conversation))
+        history = conversation.conversation_history
+        self.assertEqual(history[0]["content"], "Support agent.")
+        self.assertEqual(
+            history[-1]["content"], "ticket 49 needs a reply soon"
+        )
+        self.assertGreater(memory.stats.evicted, 0)
+
+    def test_evicted_turns_are_summarised(self):
+        folded = []
+
+        def summarizer(summary, evicted):
+            folded.extend(m["content"] for m in evicted)
+            return f"{len(folded)} turns folded"
+
+        conversation = Conversation(system_prompt="Support agent.")
+        memory = BoundedMemory(
+            conversation,
+            count_words,
+            max_tokens=80,
+            summarizer=summarizer,
+            summary_tokens=10,
+        )
+        for i in range(40):
+            conversation.add("User", f"ticket {i} needs a reply soon")
+            self.assertLessEqual(full_count(conversation), 80)
+        history = conversation.conversation_history
+        self.assertEqual(history[1]["role"], SUMMARY_ROLE)
+        self.assertEqual(history[1]["content"], f"{len(folded)} turns folded")
+        self.assertEqual(len(folded), memory.stats.evicted)
+        roles = [m["role"] for m in history]
+        self.assertEqual(roles.count(SUMMARY_ROLE), 1)
+
+    def test_oversized_message_is_truncated(self):
+        conversation = Conversation(system_prompt="Support agent.")
+        memory = BoundedMemory(conversation, count_words, max_tokens=20)
+        conversation.add("User", " ".join(f"w{i}" for i in range(100)))
+        self.assertLessEqual(full_count(conversation), 20)
+        content = conversation.conversation_history[-1]["content"]
+        self.assertTrue(content.startswith(TRUNCATION_MARKER))
+        self.assertTrue(content.endswith("w99"))
+        self.assertEqual(memory.stats.truncated, 1)
+
+    def test_truncated_message_fits_with_its_marker(self):
+        for budget in range(12, 40):
+            conversation = Conversation(system_prompt="Support agent.")
+            memory = BoundedMemory(conversation, count_chars, budget)
+            conversation.add("User", "x" * 500)
+            total = full_count(conversation, count_chars)
+            self.assertLessEqual(total, budget)
+            self.assertEqual(memory.counter.used, total)
+            self.assertEqual(memory.stats.truncated, 1)
+
+    def test_pinned_messages_must_fit(self):
+        conversation = Conversation(system_prompt="word " * 50)
+        with self.assertRaises(ValueError):
+            BoundedMemory(conversation, count_words, max_tokens=20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for client-side rate limiting of an LLM."""
+import asyncio
+import time
+import unittest
+
+from swarms_course.ratelimit import RateLimitedLLM, RateLimiter
+from swarms_course.stub_llm import StubLLM
+
+
+def count_words(text):
+    return len(text.split())
+
+
+class AsyncStreamingLLM(StubLLM):
+    """A stub with langchain's ``astream``, yielding message chunks"""
+
+    class Chunk:
+        def __init__(self, content):
+            self.content = content
+
+    async def astream(self, task, *args, **kwargs):
+        for word in self.stream(task):
+            yield self.Chunk(word)
+
+
+class RateLimitedLLMTest(unittest.TestCase):
+    def limited(self, llm=None, **options):
+        limiter = RateLimiter(**options)
+        return RateLimitedLLM(
+            llm or StubLLM(), limiter, count_tokens=count_words
+        )
+
+    def test_run_settles_actual_tokens(self):
+        llm = self.limited(tokens_per_minute=60_000)
+        response = llm.run("plan the rollout")
+        self.assertEqual(llm.stats.tokens, 3 + count_words(response))
+
+    def test_stream_counts_against_requests_per_second(self):
+        llm = self.limited(requests_per_second=20, burst=1)
+        list(llm.stream("first"))
+        start = time.perf_counter()
+        list(llm.stream("second"))
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        self.assertEqual(llm.stats.requests, 2)
+        self.assertEqual(llm.stats.delayed, 1)
+
+    def test_stream_reserves_before_the_first_chunk(self):
+        llm = self.limited(requests_per_second=20, tokens_per_minute=60_000)
+        stream = llm.stream("plan the rollout")
+        self.assertEqual(llm.stats.requests, 0)
+        first = next(stream)
+        self.assertEqual(llm.stats.requests, 1)
+        # Prompt plus the assumed completion, until the stream ends
+        self.assertEqual(llm.stats.tokens, 3 + llm.completion_tokens)
+        response = first + "".join(stream)
+        self.assertEqual(llm.stats.tokens, 3 + count_words(response))
+
+    def test_closed_stream_settles_what_was_read(self):
+        llm = self.limited(tokens_per_minute=60_000)
+        stream = llm.stream("plan the rollout")
+        next(stream)
+        stream.close()
+        self.assertEqual(llm.stats.tokens, 3 + 1)
+
+    def test_astream(self):
+        async def collect(llm):
+            return [chunk async for chunk in llm.astream("plan the rollout")]
+
+        for model in (AsyncStreamingLLM(), StubLLM()):
+            llm = self.limited(model, tokens_per_minute=60_000)
+            chunks = asyncio.run(collect(llm))
+            response = "".join(chunks)
+            self.assertEqual(response, model.respond("plan the rollout"))
+            self.assertEqual(llm.stats.requests, 1)
+            self.assertEqual(llm.stats.tokens, 3 + count_words(response))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+"""Tests for retries, circuit breakers and hedging around an LLM."""
+import asyncio
+import random
+import time
+import unittest
+
+from swarms_course.resilience import (
+    Backoff,
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientLLM,
+)
+
+NO_WAIT = Backoff(base=0.0)
+
+
+class FlakyLLM:
+    """Fails its first ``failures`` calls with ``error``, then answers"""
+
+    def __init__(self, failures=0, error=ConnectionError("reset")):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def run(self, task, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return f"answer to {task}"
+
+    __call__ = run
+
+    def stream(self, task, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        yield "answer "
+        yield "to "
+        yield task
+
+
+class BrokenStreamLLM:
+    """Streams one chunk, then drops the connection"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def stream(self, task, *args, **kwargs):
+        self.calls += 1
+        yield "partial "
+        raise ConnectionError("dropped")
+
+
+class StallingLLM:
+    """The first call stalls; later calls answer at once"""
+
+    def __init__(self, stall=1.0):
+        self.stall = stall
+        self.calls = 0
+        self.cancelled = 0
+
+    def run(self, task, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            time.sleep(self.stall)
+            return "slow"
+        return "fast"
+
+    __call__ = run
+
+    async def arun(self, task, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            try:
+                await asyncio.sleep(self.stall)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return "slow"
+        return "fast"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class BackoffTest(unittest.TestCase):
+    def test_delays_stay_within_the_jitter_window(self):
+        backoff = Backoff(base=0.1, factor=2.0, max_delay=1.0)
+        rng = random.Random(0)
+        for attempt in range(8):
+            ceiling = min(1.0, 0.1 * 2.0**attempt)
+            delays = [backoff.delay(attempt, rng) for _ in range(500)]
+            self.assertGreaterEqual(min(delays), 0.0)
+            self.assertLessEqual(max(delays), ceiling)
+            # Full jitter spreads over the whole window
+            self.assertGreater(max(delays), 0.9 * ceiling)
+            self.assertLess(min(delays), 0.1 * ceiling)
+
+
+class RetryTest(unittest.TestCase):
+    def test_retries_transient_failures(self):
+        llm = ResilientLLM(
+            FlakyLLM(failures=2), backoff=NO_WAIT, breaker=False
+        )
+        self.assertEqual(llm.run("q"), "answer to q")
+        stats = llm.stats
+        self.assertEqual((stats.calls, stats.attempts), (1, 3))
+        self.assertEqual((stats.retries, stats.failures), (2, 0))
+
+    def test_gives_up_after_retries(self):
+        flaky = FlakyLLM(failures=10)
+        llm = ResilientLLM(flaky, retries=3, backoff=NO_WAIT, breaker=False)
+        with self.assertRaises(ConnectionError):
+            llm.run("q")
+        self.assertEqual(flaky.calls, 4)
+        self.assertEqual((llm.stats.retries, llm.stats.failures), (3, 1))
+
+    def test_permanent_errors_are_not_retried(self):
+        flaky = FlakyLLM(failures=1, error=ValueError("bad request"))
+        llm = ResilientLLM(flaky, backoff=NO_WAIT, breaker=False)
+        with self.assertRaises(ValueError):
+            llm.run("q")
+        self.assertEqual(flaky.calls, 1)
+
+    def test_async_retries(self):
+        llm = ResilientLLM(
+            FlakyLLM(failures=1), backoff=NO_WAIT, breaker=False
+        )
+        self.assertEqual(asyncio.run(llm.arun("q")), "answer to q")
+        self.assertEqual(llm.stats.retries, 1)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            "test", failure_threshold=2, recovery_time=5.0, clock=self.clock
+        )
+
+    def test_closed_open_half_open_closed(self):
+        breaker = self.breaker
+        self.assertTrue(breaker.allow())
+        breaker.failure()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+        self.clock.now = 5.0
+        # One probe after the recovery time, then wait for its outcome
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(breaker.allow())
+        breaker.success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.opened, 1)
+
+    def test_failed_probe_reopens(self):
+        breaker = self.breaker
+        breaker.failure()
+        breaker.failure()
+        self.clock.now = 5.0
+        self.assertTrue(breaker.allow())
+        breaker.failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.opened, 2)
+
+    def test_open_circuit_fails_fast(self):
+        flaky = FlakyLLM(failures=10)
+        llm = ResilientLLM(
+            flaky, retries=5, backoff=NO_WAIT, breaker=self.breaker
+        )
+        with self.assertRaises(CircuitOpenError):
+            llm.run("q")
+        # Two failures opened the breaker; the third attempt never ran
+        self.assertEqual(flaky.calls, 2)
+        with self.assertRaises(CircuitOpenError):
+            llm.run("q")
+        self.assertEqual(flaky.calls, 2)
+        self.assertEqual(llm.stats.short_circuited, 2)
+
+
+class HedgingTest(unittest.TestCase):
+    def test_hedge_returns_first_success(self):
+        llm = ResilientLLM(StallingLLM(stall=0.5), hedge=0.05, breaker=False)
+        start = time.perf_counter()
+        self.assertEqual(llm.run("q"), "fast")
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual((llm.stats.hedges, llm.stats.hedge_wins), (1, 1))
+
+    def test_async_hedge_cancels_the_loser(self):
+        stalling = StallingLLM(stall=5.0)
+        llm = ResilientLLM(stalling, hedge=0.05, breaker=False)
+
+        async def main():
+            response = await llm.arun("q")
+            # Let the cancelled primary unwind
+            await asyncio.sleep(0)
+            return response
+
+        start = time.perf_counter()
+        self.assertEqual(asyncio.run(main()), "fast")
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(stalling.cancelled, 1)
+        self.assertEqual(llm.stats.hedge_wins, 1)
+
+
+class StreamTest(unittest.TestCase):
+    def test_retries_before_the_first_chunk(self):
+        flaky = FlakyLLM(failures=2)
+        llm = ResilientLLM(flaky, backoff=NO_WAIT, breaker=False)
+        self.assertEqual("".join(llm.stream("q")), "answer to q")
+        self.assertEqual(flaky.calls, 3)
+        self.assertEqual(llm.stats.retries, 2)
+
+    def test_no_retry_after_chunks(self):
+        broken = BrokenStreamLLM()
+        breaker = CircuitBreaker("stream", failure_threshold=1)
+        llm = ResilientLLM(broken, backoff=NO_WAIT, breaker=breaker)
+        chunks = []
+        with self.assertRaises(ConnectionError):
+            for chunk in llm.stream("q"):
+                chunks.append(chunk)
+        self.assertEqual(chunks, ["partial "])
+        self.assertEqual(broken.calls, 1)
+        self.assertEqual(llm.stats.failures, 1)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+    def test_open_circuit_refuses_streams(self):
+        breaker = CircuitBreaker("stream", failure_threshold=1)
+        breaker.failure()
+        llm = ResilientLLM(FlakyLLM(), breaker=breaker)
+        with self.assertRaises(CircuitOpenError):
+            next(llm.stream("q"))
+
+
+if __name__ == "__main__":
+    unittest.main()
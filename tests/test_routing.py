@@ -0,0 +1,137 @@
+"""Tests for routing model calls across providers."""
+import asyncio
+import time
+import unittest
+
+from swarms_course.resilience import CircuitBreaker, CircuitOpenError
+from swarms_course.routing import Backend, ModelRouter
+from swarms_course.stub_llm import StubLLM
+
+
+class StatusError(Exception):
+    """An HTTP error as the provider clients raise them"""
+
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.headers = {}
+        if retry_after is not None:
+            self.headers["retry-after"] = str(retry_after)
+
+
+class FailingLLM:
+    """Raises ``error`` on its first ``failures`` calls"""
+
+    def __init__(self, error, failures=1):
+        self.error = error
+        self.failures = failures
+        self.calls = 0
+
+    def run(self, task, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "recovered"
+
+    __call__ = run
+
+    def stream(self, task, *args, **kwargs):
+        yield self.run(task)
+
+
+def backend(llm, name, **options):
+    return Backend(llm, name, breaker=CircuitBreaker(name), **options)
+
+
+class ModelRouterTest(unittest.TestCase):
+    def test_prefers_the_faster_backend(self):
+        fast, slow = StubLLM("fast"), StubLLM("slow")
+        router = ModelRouter([backend(fast, "fast"), backend(slow, "slow")])
+        router.backends[0].ewma, router.backends[1].ewma = 0.1, 1.0
+        self.assertIn("[fast]", router.run("q"))
+        self.assertEqual((fast.calls, slow.calls), (1, 0))
+
+    def test_waits_for_headroom_instead_of_overrunning(self):
+        llm = StubLLM()
+        router = ModelRouter([backend(llm, "only", rate_limit=20, burst=1)])
+        router.run("q")
+        start = time.perf_counter()
+        router.run("q")
+        # The bucket was empty: the second call waited about 1/20s
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+        self.assertEqual(llm.calls, 2)
+
+    def test_sidelined_backend_is_not_called_before_retry_after(self):
+        limited = FailingLLM(StatusError(429, retry_after=0.2))
+        broken = StubLLM("broken")
+        router = ModelRouter(
+            [backend(limited, "limited"), backend(broken, "broken")]
+        )
+        router.backends[1].breaker.failure_threshold = 1
+        router.backends[1].breaker.failure()
+        with self.assertRaises(StatusError):
+            router.run("q")
+        start = time.perf_counter()
+        self.assertEqual(router.run("q"), "recovered")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.15)
+        self.assertEqual((limited.calls, broken.calls), (2, 0))
+        self.assertEqual(router.stats.backends[0].rate_limited, 1)
+
+    def test_async_waits_for_headroom(self):
+        llm = StubLLM()
+        router = ModelRouter([backend(llm, "only", rate_limit=20, burst=1)])
+
+        async def main():
+            await router.arun("q")
+            start = time.perf_counter()
+            await router.arun("q")
+            return time.perf_counter() - start
+
+        self.assertGreaterEqual(asyncio.run(main()), 0.04)
+
+    def test_no_backend_available(self):
+        router = ModelRouter([backend(StubLLM(), "down")])
+        router.backends[0].breaker.failure_threshold = 1
+        router.backends[0].breaker.failure()
+        with self.assertRaises(CircuitOpenError):
+            router.run("q")
+
+    def test_transient_failure_falls_back(self):
+        flaky = FailingLLM(StatusError(503))
+        steady = StubLLM("steady")
+        router = ModelRouter([backend(flaky, "flaky"), backend(steady, "s")])
+        router.backends[0].ewma, router.backends[1].ewma = 0.1, 1.0
+        self.assertIn("[steady]", router.run("q"))
+        self.assertEqual(router.stats.fallbacks, 1)
+
+
+class RouterStreamTest(unittest.TestCase):
+    def test_stream_is_routed_and_released(self):
+        fast, slow = StubLLM("fast"), StubLLM("slow")
+        router = ModelRouter([backend(fast, "fast"), backend(slow, "slow")])
+        router.backends[0].ewma, router.backends[1].ewma = 0.1, 1.0
+        chunks = list(router.stream("q"))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), fast.respond("q"))
+        stats = router.stats.backends[0]
+        self.assertEqual((stats.calls, stats.in_flight), (1, 0))
+
+    def test_stream_falls_back_before_the_first_chunk(self):
+        flaky = FailingLLM(StatusError(503))
+        steady = StubLLM("steady")
+        router = ModelRouter([backend(flaky, "flaky"), backend(steady, "s")])
+        router.backends[0].ewma, router.backends[1].ewma = 0.1, 1.0
+        self.assertEqual("".join(router.stream("q")), steady.respond("q"))
+        self.assertEqual(router.stats.fallbacks, 1)
+
+    def test_abandoned_stream_releases_its_backend(self):
+        router = ModelRouter([backend(StubLLM(), "only")])
+        stream = router.stream("q")
+        next(stream)
+        self.assertEqual(router.stats.backends[0].in_flight, 1)
+        stream.close()
+        self.assertEqual(router.stats.backends[0].in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Tests for the concurrent configuration sweep."""
+import unittest
+
+from swarms_course.pool import AgentPool
+from swarms_course.stub_llm import StubLLM
+from swarms_course.sweep import expand_grid, sweep
+
+GRID = {"temperature": [0.1, 0.5, 0.9], "max_loops": [1]}
+
+
+class SweepTest(unittest.TestCase):
+    def test_expand_grid_order(self):
+        self.assertEqual(
+            expand_grid({"a": [1, 2], "b": ["x"]}),
+            [{"a": 1, "b": "x"}, {"a": 2, "b": "x"}],
+        )
+
+    def test_sweep_with_factory(self):
+        report = sweep(
+            "Suggest a marketing strategy",
+            GRID,
+            agent_factory=lambda **config: StubLLM(**config),
+        )
+        self.assertEqual(len(report.results), 3)
+        for result in report.results:
+            self.assertIsNone(result.error)
+
+    def test_sweep_with_pool(self):
+        pool = AgentPool(llm=StubLLM())
+        report = sweep(
+            "Suggest a marketing strategy", GRID, pool=pool, max_workers=3
+        )
+        self.assertEqual(
+            [result.config for result in report.results], expand_grid(GRID)
+        )
+        for result in report.results:
+            self.assertIsNone(result.error)
+            self.assertIn("[stub-model]", result.response)
+        self.assertEqual(pool.stats.leases, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for incremental token counting."""
+import unittest
+
+from swarms.structs.conversation import Conversation
+
+from swarms_course.conversation import CompactConversation
+from swarms_course.tokens import TokenCounter, render_message
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def full_count(conversation):
+    return sum(
+        count_words(render_message(m))
+        for m in conversation.conversation_history
+    )
+
+
+class TokenCounterTest(unittest.TestCase):
+    def setUp(self):
+        self.conversation = Conversation(system_prompt="You are terse.")
+        self.counter = TokenCounter(self.conversation, count_words, 100)
+
+    def test_appends_match_full_count(self):
+        for i in range(20):
+            self.conversation.add("User", f"question number {i} " * (i % 4))
+            self.assertEqual(
+                self.counter.used, full_count(self.conversation)
+            )
+        self.assertEqual(self.counter.remaining, 100 - self.counter.used)
+
+    def test_messages_are_tokenized_once(self):
+        for i in range(10):
+            self.conversation.add("User", f"turn {i}")
+            self.counter.used
+        self.assertEqual(self.counter.tokenized, 11)
+
+    def test_eviction_matches_full_count(self):
+        history = self.conversation.conversation_history
+        for i in range(10):
+            self.conversation.add("User", f"turn {i} with some words")
+        self.counter.used
+        del history[1:4]
+        self.assertEqual(self.counter.used, full_count(self.conversation))
+        history.clear()
+        self.assertEqual(self.counter.used, 0)
+
+    def test_replaced_middle_message_is_recounted(self):
+        history = self.conversation.conversation_history
+        for i in range(6):
+            self.conversation.add("User", f"turn {i}")
+        self.counter.used
+        # Same length and same last message, as a summary swap or an
+        # AgentPool snapshot restore can leave it
+        history[2] = {"role": "Summary", "content": "a much longer summary"}
+        self.assertEqual(self.counter.used, full_count(self.conversation))
+        history[:] = list(history)
+        self.assertEqual(self.counter.used, full_count(self.conversation))
+
+    def test_removed_and_inserted_keep_total(self):
+        history = self.conversation.conversation_history
+        for i in range(5):
+            self.conversation.add("User", f"turn {i}")
+        self.counter.used
+        self.counter.removed(history.pop(2))
+        message = {"role": "Summary", "content": "turns were folded"}
+        history.append(message)
+        self.counter.inserted(message)
+        tokenized = self.counter.tokenized
+        self.assertEqual(self.counter.used, full_count(self.conversation))
+        self.assertEqual(self.counter.tokenized, tokenized)
+
+    def test_shares_the_compact_conversation_log(self):
+        conversation = CompactConversation(system_prompt="You are terse.")
+        counter = TokenCounter(conversation, count_words)
+        for i in range(6):
+            conversation.add("User", f"turn {i}")
+        conversation.return_history_as_string()
+        conversation.delete(2)
+        self.assertEqual(counter.used, full_count(conversation))
+        # Both the store's rendering and the counter saw the edit
+        self.assertNotIn("turn 1", conversation.return_history_as_string())
+        conversation.clear()
+        conversation.add("User", "again")
+        self.assertEqual(counter.used, full_count(conversation))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the offline vector long-term memory."""
+import tempfile
+import unittest
+
+import numpy as np
+
+from swarms_course.vector_memory import HashingEmbedder, VectorMemory
+
+FACTS = [
+    "Customer 12345 is on the Enterprise Suite annual plan",
+    "Invoice INV-889 was paid late in March",
+    "The Berlin office handles all EMEA support escalations",
+    "Renewal discounts above 15 percent need finance approval",
+    "Customer 777 asked for single sign-on with Okta",
+]
+
+
+class VectorMemoryTest(unittest.TestCase):
+    def test_embeddings_are_normalised(self):
+        vectors = HashingEmbedder(64)(FACTS)
+        self.assertEqual(vectors.shape, (len(FACTS), 64))
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0)
+
+    def test_search_finds_relevant_memory(self):
+        memory = VectorMemory()
+        memory.add_many(FACTS)
+        hits = memory.search("which plan is customer 12345 on", k=2)
+        self.assertEqual(hits[0].text, FACTS[0])
+        self.assertGreaterEqual(hits[0].score, hits[1].score)
+        self.assertIn(f"- {FACTS[3]}", memory.query("renewal discounts"))
+
+    def test_empty_memory(self):
+        memory = VectorMemory()
+        self.assertEqual(memory.search_vector(np.ones(memory.dim)), [])
+        self.assertEqual(memory.search("anything"), [])
+        self.assertEqual(memory.query("anything"), "")
+        with self.assertRaises(ValueError):
+            memory.build_index()
+        with tempfile.TemporaryDirectory() as path:
+            with VectorMemory(path) as memory:
+                self.assertEqual(memory.query("anything"), "")
+                with self.assertRaises(ValueError):
+                    memory.build_index()
+
+    def test_reopen_and_recall(self):
+        with tempfile.TemporaryDirectory() as path:
+            with VectorMemory(path, dim=128) as memory:
+                memory.add_many(FACTS)
+                memory.add("Customer 12345 prefers email over phone calls")
+            with VectorMemory(path) as memory:
+                self.assertEqual(len(memory), len(FACTS) + 1)
+                self.assertEqual(memory.dim, 128)
+                self.assertEqual(memory.text(1), FACTS[1])
+                hits = memory.search("email or phone calls for 12345")
+                self.assertEqual(hits[0].index, len(FACTS))
+                memory.add("Okta rollout finished in June")
+            with VectorMemory(path) as memory:
+                self.assertEqual(len(memory), len(FACTS) + 2)
+                self.assertEqual(
+                    memory.search("okta rollout", k=1)[0].text,
+                    "Okta rollout finished in June",
+                )
+
+    def test_index_agrees_with_exact_search(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(2000, 32)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        with tempfile.TemporaryDirectory() as path:
+            with VectorMemory(path, dim=32) as memory:
+                memory.add_many(
+                    [f"memory {i}" for i in range(len(vectors))], vectors
+                )
+                memory.build_index(nlist=16)
+                # Added after the index: still found by the exact tail scan
+                memory.add("latest", vectors[7])
+            with VectorMemory(path) as memory:
+                query = vectors[7]
+                exact = memory.search_vector(query, k=2, exact=True)
+                indexed = memory.search_vector(query, k=2, nprobe=16)
+                self.assertEqual(
+                    sorted(i for i, _ in exact), sorted(i for i, _ in indexed)
+                )
+                self.assertEqual(sorted(i for i, _ in exact), [7, 2000])
+
+
+if __name__ == "__main__":
+    unittest.main()